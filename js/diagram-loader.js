@@ -1,4 +1,7 @@
 (function () {
+  // Set by pages from `_data/diagram_bundle.json` (see tools/build_diagrams.py).
+  const script = document.currentScript;
+  const bundleSrc = script ? script.getAttribute('data-diagram-bundle') : '';
   const mounts = document.querySelectorAll('[data-diagram-src]');
   if (!mounts.length) {
     return;
@@ -47,6 +50,7 @@
     });
 
   async function hydrateDiagrams() {
+    const bundled = await loadBundle();
     await Promise.all(Array.prototype.map.call(mounts, async function (mount) {
       const src = mount.getAttribute('data-diagram-src');
       const fallback = mount.getAttribute('data-diagram-fallback') || 'Diagram source unavailable.';
@@ -56,14 +60,16 @@
       }
 
       try {
-        const response = await fetch(src, { cache: 'no-store' });
-        if (!response.ok) {
-          renderPlaceholder(mount, fallback);
-          return;
+        let code = Object.prototype.hasOwnProperty.call(bundled, src) ? bundled[src] : '';
+        if (!code) {
+          // Not in the bundle (a new draft, or no bundle built yet): read the source itself.
+          const response = await fetch(src, { cache: 'no-store' });
+          if (!response.ok) {
+            renderPlaceholder(mount, fallback);
+            return;
+          }
+          code = extractMermaid(await response.text());
         }
-
-        const text = await response.text();
-        const code = extractMermaid(text);
         if (!code) {
           renderPlaceholder(mount, fallback);
           return;
@@ -81,6 +87,23 @@
     }));
   }
 
+  async function loadBundle() {
+    if (!bundleSrc) {
+      return {};
+    }
+    try {
+      // The filename carries a content hash, so the ordinary HTTP cache is safe here.
+      const response = await fetch(bundleSrc);
+      if (!response.ok) {
+        return {};
+      }
+      const bundle = await response.json();
+      return (bundle && bundle.diagrams) || {};
+    } catch (error) {
+      return {};
+    }
+  }
+
   function extractMermaid(text) {
     const match = String(text).match(/```mermaid\s*([\s\S]*?)```/i);
     return match ? match[1].trim() : '';
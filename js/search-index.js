@@ -0,0 +1,201 @@
+(function () {
+  /*
+   * Reader for the prebuilt search index in /assets/search/ (see tools/build_search_index.py).
+   * The manifest lists every page plus the shard file for each two-letter token prefix;
+   * a query only fetches the shards its terms start with, and shard names are content-hashed
+   * so the browser can keep them as long as it likes.
+   *
+   *   window.siteSearch.search('consent lear').then(function (hits) { ... });
+   *
+   * Each hit is { url, title, summary, kind, score }. Every term must match (as a prefix),
+   * so typing narrows results instead of widening them.
+   */
+  const BASE = '/assets/search/';
+  const STOPWORDS = new Set((
+    'a an and are as at be but by can do for from has have how if in into is it its ' +
+    'not of on or so than that the their them then there these they this to too was ' +
+    'we were what when where which while who why will with you your'
+  ).split(' '));
+
+  let manifestPromise = null;
+  const shardPromises = {};
+
+  function loadManifest() {
+    if (!manifestPromise) {
+      manifestPromise = fetch(BASE + 'manifest.json').then(function (response) {
+        if (!response.ok) {
+          throw new Error('search manifest unavailable');
+        }
+        return response.json();
+      });
+    }
+    return manifestPromise;
+  }
+
+  function loadShard(manifest, prefix) {
+    const name = manifest.shards[prefix];
+    if (!name) {
+      return Promise.resolve({});
+    }
+    if (!shardPromises[name]) {
+      shardPromises[name] = fetch(BASE + 'shards/' + name).then(function (response) {
+        return response.ok ? response.json() : {};
+      });
+    }
+    return shardPromises[name];
+  }
+
+  /**
+   * Match the generator's tokenizer: lowercase words, two characters or more, no stopwords.
+   */
+  function tokenize(query) {
+    const words = String(query).toLowerCase().match(/[\p{L}\p{N}]+/gu) || [];
+    return words.filter(function (word) {
+      return word.length >= 2 && !STOPWORDS.has(word);
+    });
+  }
+
+  /**
+   * Sum scores for every indexed token that starts with `term`.
+   */
+  function scoreTerm(shard, term) {
+    const scores = new Map();
+    Object.keys(shard).forEach(function (token) {
+      if (token.indexOf(term) !== 0) {
+        return;
+      }
+      const postings = shard[token];
+      // Exact matches outrank prefix matches so "art" prefers "art" over "artifact".
+      const boost = token === term ? 2 : 1;
+      for (let i = 0; i < postings.length; i += 2) {
+        scores.set(postings[i], (scores.get(postings[i]) || 0) + postings[i + 1] * boost);
+      }
+    });
+    return scores;
+  }
+
+  async function search(query, limit) {
+    const terms = tokenize(query);
+    if (!terms.length) {
+      return [];
+    }
+    const manifest = await loadManifest();
+    const shards = await Promise.all(terms.map(function (term) {
+      return loadShard(manifest, term.slice(0, manifest.prefix));
+    }));
+
+    let combined = null;
+    terms.forEach(function (term, index) {
+      const scores = scoreTerm(shards[index], term);
+      if (combined === null) {
+        combined = scores;
+        return;
+      }
+      const next = new Map();
+      combined.forEach(function (score, doc) {
+        if (scores.has(doc)) {
+          next.set(doc, score + scores.get(doc));
+        }
+      });
+      combined = next;
+    });
+
+    return Array.from(combined.entries())
+      .sort(function (a, b) {
+        return b[1] - a[1] || a[0] - b[0];
+      })
+      .slice(0, limit || 20)
+      .map(function (entry) {
+        const doc = manifest.docs[entry[0]];
+        return { url: doc.u, title: doc.t, summary: doc.s, kind: doc.k, score: entry[1] };
+      });
+  }
+
+  /**
+   * Wire a `[data-site-search]` form (see /search/) to the index: results update as you type,
+   * and `?q=` in the URL fills the box so searches can be linked and bookmarked.
+   */
+  function bindSearchForm() {
+    const form = document.querySelector('[data-site-search]');
+    const list = document.querySelector('[data-site-search-results]');
+    const status = document.querySelector('[data-site-search-status]');
+    if (!form || !list || !status) {
+      return;
+    }
+    const input = form.querySelector('input[name="q"]');
+    let latest = 0;
+    let timer = null;
+
+    function render(hits, query) {
+      list.textContent = '';
+      hits.forEach(function (hit) {
+        const item = document.createElement('li');
+        const link = document.createElement('a');
+        link.href = hit.url;
+        link.textContent = hit.title;
+        const kind = document.createElement('span');
+        kind.className = 'eyebrow';
+        kind.textContent = hit.kind;
+        item.appendChild(kind);
+        item.appendChild(link);
+        if (hit.summary) {
+          const summary = document.createElement('p');
+          summary.textContent = hit.summary;
+          item.appendChild(summary);
+        }
+        list.appendChild(item);
+      });
+      status.textContent = hits.length
+        ? hits.length + (hits.length === 1 ? ' match' : ' matches') + ' for “' + query + '”'
+        : 'Nothing matches “' + query + '”.';
+    }
+
+    function run() {
+      const query = input.value.trim();
+      const ticket = ++latest;
+      const url = new URL(window.location.href);
+      if (query) {
+        url.searchParams.set('q', query);
+      } else {
+        url.searchParams.delete('q');
+      }
+      window.history.replaceState(null, '', url);
+      if (!tokenize(query).length) {
+        list.textContent = '';
+        status.textContent = '';
+        return;
+      }
+      search(query).then(function (hits) {
+        // A slower earlier query must not overwrite a newer one.
+        if (ticket === latest) {
+          render(hits, query);
+        }
+      }).catch(function () {
+        if (ticket === latest) {
+          status.textContent = 'Search is unavailable right now.';
+        }
+      });
+    }
+
+    form.addEventListener('submit', function (event) {
+      event.preventDefault();
+      run();
+    });
+    input.addEventListener('input', function () {
+      window.clearTimeout(timer);
+      timer = window.setTimeout(run, 150);
+    });
+    input.value = new URLSearchParams(window.location.search).get('q') || '';
+    if (input.value) {
+      run();
+    }
+  }
+
+  window.siteSearch = { search: search, tokenize: tokenize };
+
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', bindSearchForm);
+  } else {
+    bindSearchForm();
+  }
+})();
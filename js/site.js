@@ -12,6 +12,9 @@
   // The hero sketch treats this multiplier as gospel when calculating oscillations.
   // Keep it in one place so that "double the motion" or "dial it down" is a one-line change.
   const HERO_MOTION_MULTIPLIER = 2;
+  // Written by tools/build_asset_manifest.py; answers "is this asset published?" without probing.
+  const ASSET_MANIFEST = '/assets/asset-manifest.json';
+  let assetManifestPromise = null;
 
   /**
    * Swap any `[data-current-year]` node content for the current year.
@@ -63,7 +66,28 @@
   }
 
   /**
-   * Probe a resource URL with a `HEAD` request, falling back to `GET` when servers reject `HEAD`.
+   * Fetch the build-time asset manifest (`tools/build_asset_manifest.py`) once per page.
+   * Resolves to `null` when it can't be read, so callers fall back to probing.
+   */
+  function loadAssetManifest() {
+    if (!assetManifestPromise) {
+      assetManifestPromise = fetch(ASSET_MANIFEST)
+        .then(function (response) {
+          return response.ok ? response.json() : null;
+        })
+        .then(function (manifest) {
+          return manifest && manifest.files && manifest.roots ? manifest : null;
+        })
+        .catch(function () {
+          return null;
+        });
+    }
+    return assetManifestPromise;
+  }
+
+  /**
+   * Decide whether a resource is published. Paths the manifest covers are answered from it
+   * (zero-byte placeholders count as not yet added); anything else still gets probed.
    * Returns a boolean so UI code can render ✅ or 🕘 badges.
    */
   async function requestResource(path) {
@@ -71,6 +95,28 @@
       return false;
     }
 
+    const manifest = await loadAssetManifest();
+    if (manifest) {
+      const url = new URL(path, window.location.href);
+      const key = decodeURI(url.pathname);
+      const under = function (prefix) {
+        return key.indexOf(prefix) === 0;
+      };
+      const covered = url.origin === window.location.origin &&
+        manifest.roots.some(under) && !(manifest.skip || []).some(under);
+      if (covered) {
+        const entry = manifest.files[key];
+        return Boolean(entry && entry[0] > 0);
+      }
+    }
+
+    return probeResource(path);
+  }
+
+  /**
+   * Probe a resource URL with a `HEAD` request, falling back to `GET` when servers reject `HEAD`.
+   */
+  async function probeResource(path) {
     try {
       const headResponse = await fetch(path, { method: 'HEAD' });
       if (headResponse.ok) {
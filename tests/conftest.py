@@ -0,0 +1,41 @@
+"""Deterministic sharding, so slices of the suite can run side by side.
+
+    python -m pytest -q --shard 1/4 & python -m pytest -q --shard 2/4 & ...
+
+Tests are ordered by node id and dealt round-robin, so every shard gets the
+same tests on every machine and together the shards cover the suite once.
+Each shard is its own process with its own `SITE` snapshot.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption("--shard", default=None, metavar="I/N", help="run only the I-th of N slices (1-based)")
+
+
+def _shard(config):
+    value = config.getoption("--shard")
+    if value is None:
+        return None
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--shard expects I/N, got {value!r}") from None
+    if not 1 <= index <= count:
+        raise pytest.UsageError(f"--shard {value}: I must be between 1 and N")
+    return index, count
+
+
+def pytest_collection_modifyitems(config, items):
+    shard = _shard(config)
+    if shard is None:
+        return
+    index, count = shard
+    ordered = sorted(items, key=lambda item: item.nodeid)
+    keep = ordered[index - 1 :: count]
+    kept = {id(item) for item in keep}
+    deselected = [item for item in items if id(item) not in kept]
+    items[:] = keep
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
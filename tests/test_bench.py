@@ -0,0 +1,37 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import bench  # noqa: E402
+
+
+class BenchTests(unittest.TestCase):
+    def test_synthetic_repo_lints_clean(self):
+        # A fixture the lints reject would time the error path, not the real one.
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp) / "n12"
+            fixture = bench.generate_repo(repo, 12, links=3, heroes=False)
+            self.assertEqual(fixture["related_links"], 36)
+            for group in ("lint", "lint_visual_system"):
+                result = bench.run_group_in(repo, group)
+                self.assertIn("phases", result, result)
+                self.assertEqual(result["errors"], 0, group)
+                self.assertGreater(result["peak_rss_kb"], 0)
+
+    def test_scaling_exponent(self):
+        def entry(size, seconds):
+            return {"size": size, "groups": {"lint": {"phases": {"check": seconds}}}}
+
+        linear = bench.scaling([entry(10, 0.1), entry(100, 1.0)])
+        quadratic = bench.scaling([entry(10, 0.1), entry(100, 10.0)])
+        self.assertAlmostEqual(linear["lint"]["check"], 1.0)
+        self.assertAlmostEqual(quadratic["lint"]["check"], 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
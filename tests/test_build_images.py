@@ -0,0 +1,200 @@
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import build_images  # noqa: E402
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+
+HAS_WEBP = Image is not None and features.check("webp")
+
+
+class NamingTests(unittest.TestCase):
+    def test_ladder_never_upscales(self):
+        self.assertEqual(build_images.ladder(1000), [320, 640, 960, 1000])
+        self.assertEqual(build_images.ladder(800), [320, 640, 800])
+        self.assertEqual(build_images.ladder(4000), list(build_images.WIDTHS))
+
+    def test_variant_names_carry_width_and_source_hash(self):
+        self.assertEqual(
+            build_images.variant_path("img/studio/shot.jpg", "0123456789abcdef", 640, "webp"),
+            "assets/responsive/img/studio/shot-640.0123456789.webp",
+        )
+
+
+# The Gemfile pins the same Liquid that GitHub Pages renders with.
+LIQUID = ["bundle", "exec", "ruby"]
+RENDER_INCLUDE = """
+require "json"
+require "liquid"
+
+module JekyllStandIns
+  def relative_url(input)
+    "#{@context['site.baseurl']}#{input}"
+  end
+end
+Liquid::Template.register_filter(JekyllStandIns)
+
+assigns = JSON.parse($stdin.read)
+puts Liquid::Template.parse(File.read(ARGV[0])).render!(assigns)
+"""
+
+
+def _has_liquid():
+    try:
+        return subprocess.run(LIQUID + ["-e", "require 'liquid'"], cwd=ROOT, capture_output=True).returncode == 0
+    except OSError:
+        return False
+
+
+@unittest.skipUnless(_has_liquid(), "needs the Liquid gem (bundle install)")
+class IncludeTests(unittest.TestCase):
+    """Render `_includes/responsive-image.html` against a hand-written manifest."""
+
+    manifest = {
+        "formats": ["avif", "webp"],
+        "images": {
+            "/img/studio/shot.jpg": {
+                "width": 1000,
+                "height": 500,
+                # No AVIF encoder on the build machine: only WebP was written.
+                "srcset": {"webp": "/assets/responsive/img/studio/shot-320.0123456789.webp 320w"},
+            },
+        },
+    }
+
+    def render(self, src, **params):
+        assigns = {
+            "site": {"baseurl": "/sub", "data": {"responsive_images": self.manifest}},
+            "include": {"src": src, "alt": "A \"shot\"", "sizes": "50vw", **params},
+        }
+        result = subprocess.run(
+            LIQUID + ["-e", RENDER_INCLUDE, str(ROOT / "_includes/responsive-image.html")],
+            cwd=ROOT,
+            input=json.dumps(assigns),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout
+
+    def test_listed_source_gets_a_source_per_written_format(self):
+        html = self.render("/img/studio/shot.jpg")
+        self.assertIn("<picture>", html)
+        self.assertIn(
+            '<source type="image/webp" '
+            'srcset="/sub/assets/responsive/img/studio/shot-320.0123456789.webp 320w" sizes="50vw">',
+            html,
+        )
+        self.assertNotIn("image/avif", html)
+        self.assertIn('<img src="/sub/img/studio/shot.jpg" alt="A &quot;shot&quot;" width="1000" height="500"', html)
+
+    def test_style_reaches_the_img_either_way(self):
+        for src in ("/img/studio/shot.jpg", "/img/studio/other.jpg"):
+            html = self.render(src, style="width: 100%; height: auto")
+            self.assertIn(' style="width: 100%; height: auto" loading="lazy"', html)
+
+    def test_unlisted_source_is_the_plain_img(self):
+        html = self.render("/img/studio/other.jpg")
+        self.assertNotIn("<picture>", html)
+        self.assertNotIn("<source", html)
+        self.assertIn('<img src="/sub/img/studio/other.jpg" alt="A &quot;shot&quot;" loading="lazy"', html)
+
+
+@unittest.skipUnless(HAS_WEBP, "needs Pillow with WebP")
+class BuildTests(unittest.TestCase):
+    formats = ("webp",)
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "img").mkdir()
+        self.photo = self.root / "img/photo.png"
+        Image.new("RGB", (1000, 500), "teal").save(self.photo)
+        # An empty placeholder can't be decoded and must stay a plain <img>.
+        (self.root / "img/placeholder.jpg").write_bytes(b"")
+        # No page shows this one, so it gets no variants.
+        Image.new("RGB", (800, 800), "gray").save(self.root / "img/unused.png")
+        self.write_page("/img/photo.png", "/img/placeholder.jpg")
+
+    def write_page(self, *srcs):
+        calls = "".join(f'{{% include responsive-image.html src="{src}" alt="" %}}\n' for src in srcs)
+        (self.root / "gallery.html").write_text(f"---\nlayout: null\n---\n{calls}", encoding="utf-8")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self):
+        return build_images.build(self.formats, self.root, workers=1)
+
+    def variant_files(self):
+        return sorted(path.name for path in (self.root / "assets/responsive").rglob("*.webp"))
+
+    def test_first_build_encodes_and_lists_readable_sources(self):
+        images, encoded, failed, _ = self.build()
+        self.assertEqual(encoded, 1)
+        self.assertEqual(list(images), ["/img/photo.png"])
+        self.assertEqual(len(failed), 1)
+        self.assertIn("img/placeholder.jpg", failed[0])
+        entry = images["/img/photo.png"]
+        self.assertEqual([v["width"] for v in entry["variants"]["webp"]], [320, 640, 960, 1000])
+        self.assertEqual([v["height"] for v in entry["variants"]["webp"]], [160, 320, 480, 500])
+        self.assertTrue(build_images.is_current(entry, entry["sha256"], self.root))
+
+    def test_rerun_skips_unchanged_sources(self):
+        images, _, _, _ = self.build()
+        files = self.variant_files()
+        again, encoded, _, removed = self.build()
+        self.assertEqual((encoded, removed), (0, 0))
+        self.assertEqual(again, images)
+        self.assertEqual(self.variant_files(), files)
+
+    def test_missing_variant_or_edited_source_is_rebuilt(self):
+        images, _, _, _ = self.build()
+        first = images["/img/photo.png"]["variants"]["webp"][0]["src"]
+        (self.root / first.lstrip("/")).unlink()
+        _, encoded, _, _ = self.build()
+        self.assertEqual(encoded, 1)
+
+        Image.new("RGB", (1000, 500), "orange").save(self.photo)
+        edited, encoded, _, removed = self.build()
+        self.assertEqual((encoded, removed), (1, 4))
+        self.assertNotEqual(edited["/img/photo.png"]["sha256"], images["/img/photo.png"]["sha256"])
+        self.assertEqual(len(self.variant_files()), 4)
+
+    def test_check_tells_new_and_edited_sources_from_known_placeholders(self):
+        self.build()
+        manifest = build_images.load_manifest(self.root / "_data/responsive_images.json")
+        self.assertEqual(list(manifest["unreadable"]), ["/img/placeholder.jpg"])
+        self.assertEqual(build_images.stale_sources(manifest, self.root), [])
+
+        Image.new("RGB", (1000, 500), "orange").save(self.photo)
+        Image.new("RGB", (400, 400), "navy").save(self.root / "img/new.png")
+        self.assertEqual(build_images.stale_sources(manifest, self.root), ["/img/photo.png"])
+        self.write_page("/img/photo.png", "/img/placeholder.jpg", "/img/new.png")
+        self.assertEqual(build_images.stale_sources(manifest, self.root), ["/img/new.png", "/img/photo.png"])
+
+    def test_sources_come_from_what_pages_pass_the_include(self):
+        (self.root / "docs").mkdir()
+        (self.root / "docs/legacy.md").write_text(
+            "---\nlineage_images:\n  - src: /img/unused.png\n---\n", encoding="utf-8"
+        )
+        self.assertEqual(
+            build_images.find_sources(self.root), ["img/photo.png", "img/placeholder.jpg", "img/unused.png"]
+        )
+        (self.root / "docs/legacy.md").unlink()
+        self.assertEqual(build_images.find_sources(self.root), ["img/photo.png", "img/placeholder.jpg"])
+
+
+if __name__ == "__main__":
+    unittest.main()
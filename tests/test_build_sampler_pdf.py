@@ -0,0 +1,137 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from io import BytesIO
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import bench  # noqa: E402
+
+try:
+    import build_sampler_pdf as sampler  # noqa: E402
+    from PIL import Image
+except (ImportError, OSError):
+    # cairosvg raises OSError when the cairo library itself is missing.
+    sampler = None
+
+needs_sampler = unittest.skipIf(sampler is None, "needs reportlab, Pillow, and cairosvg (with libcairo)")
+
+OUTPUT_REL = "assets/docs/Severns_CriticalDigitalStudies.pdf"
+
+
+@needs_sampler
+class HeroTests(unittest.TestCase):
+    def encode(self, image):
+        out = BytesIO()
+        image.save(out, format="PNG")
+        return out.getvalue()
+
+    def test_heroes_are_resampled_to_their_print_box(self):
+        wide = self.encode(Image.new("RGB", (3000, 1000), "red"))
+        hero = sampler.downsample(wide, sampler.HeroSettings(dpi=100, jpeg_quality=70))
+        self.assertAlmostEqual(hero.width, sampler.MAX_IMG_WIDTH)
+        self.assertAlmostEqual(hero.height, 1000 * sampler.MAX_IMG_WIDTH / 3000)
+        with Image.open(BytesIO(hero.data)) as decoded:
+            self.assertEqual(decoded.format, "JPEG")
+            # 6.5 in x 2.17 in at 100 dpi.
+            self.assertEqual(decoded.size, (650, 217))
+
+    def test_small_heroes_are_never_upscaled(self):
+        hero = sampler.downsample(self.encode(Image.new("RGB", (100, 50))), sampler.HeroSettings(dpi=300))
+        self.assertEqual((hero.width, hero.height), (100, 50))
+        with Image.open(BytesIO(hero.data)) as decoded:
+            self.assertEqual(decoded.size, (100, 50))
+
+    def test_transparency_is_flattened_onto_white(self):
+        hero = sampler.downsample(self.encode(Image.new("RGBA", (40, 40), (0, 0, 0, 0))), sampler.HeroSettings())
+        with Image.open(BytesIO(hero.data)) as decoded:
+            self.assertTrue(all(channel > 250 for channel in decoded.getpixel((20, 20))))
+
+
+@needs_sampler
+class FlowableStreamTests(unittest.TestCase):
+    def test_batches_are_pulled_only_when_the_front_runs_out(self):
+        pulled = []
+
+        def batches():
+            for batch in (["a", "b"], [], ["c"]):
+                pulled.append(batch)
+                yield batch
+
+        stream = sampler.FlowableStream(batches())
+        self.assertEqual(pulled, [])
+        self.assertEqual(len(stream), 2)
+        self.assertEqual(pulled, [["a", "b"]])
+        del stream[0:2]
+        self.assertEqual(stream[0], "c")
+        del stream[0]
+        self.assertEqual(len(stream), 0)
+
+
+@needs_sampler
+class SamplerBuildTests(unittest.TestCase):
+    """End-to-end builds in a synthetic repo: bench's fixture, four cards with photo-like heroes."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.repo = Path(cls.tmp.name) / "repo"
+        bench.generate_repo(cls.repo, 40, links=1)
+        cls.output = cls.repo / OUTPUT_REL
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def build(self, *args, force=True):
+        # RL_invariant pins ReportLab's creation date and document ID, so equal inputs give equal bytes.
+        return subprocess.run(
+            [sys.executable, "tools/build_sampler_pdf.py", "--no-cache", *(["--force"] if force else []), *args],
+            cwd=self.repo,
+            env={**os.environ, "RL_invariant": "1"},
+            capture_output=True,
+            text=True,
+        )
+
+    def pdf(self, *args):
+        completed = self.build(*args)
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        return self.output.read_bytes()
+
+    def test_worker_pool_writes_the_same_pdf_as_serial(self):
+        self.assertEqual(self.pdf("--workers", "1"), self.pdf("--workers", "2"))
+
+    def test_batching_writes_the_same_pdf_as_one_pass(self):
+        self.assertEqual(self.pdf("--batch-cards", "0"), self.pdf("--batch-cards", "2"))
+
+    def test_over_budget_build_leaves_no_pdf_behind(self):
+        previous = self.pdf()
+        failed = self.build("--max-pdf-mb", "0.01")
+        self.assertNotEqual(failed.returncode, 0)
+        self.assertIn("budget", failed.stderr)
+        self.assertEqual(self.output.read_bytes(), previous)
+
+        self.output.unlink()
+        self.assertNotEqual(self.build("--max-pdf-mb", "0.01").returncode, 0)
+        self.assertFalse(self.output.exists())
+        self.assertEqual(list(self.output.parent.glob("*.tmp")), [])
+
+    def test_unchanged_tree_skips_the_rebuild(self):
+        self.pdf()
+        skipped = self.build(force=False)
+        self.assertEqual(skipped.returncode, 0, skipped.stderr)
+        self.assertIn("up to date", skipped.stdout)
+
+        bench._write_hero(self.repo / "img/bench/card-0000.png", 99)
+        rebuilt = self.build(force=False)
+        self.assertEqual(rebuilt.returncode, 0, rebuilt.stderr)
+        self.assertIn("Rebuilding: img/bench/card-0000.png changed", rebuilt.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import check_links  # noqa: E402
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = []
+
+    def respond(self, status, location=None, body=b""):
+        self.send_response(status)
+        if location:
+            self.send_header("Location", location)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command == "GET":
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.hits.append(("HEAD", self.path))
+        if self.path == "/no-head":
+            self.respond(405)
+        else:
+            self.route()
+
+    def do_GET(self):
+        self.hits.append(("GET", self.path))
+        self.route()
+
+    def route(self):
+        if self.path.startswith("/slow"):
+            time.sleep(0.2)
+            self.respond(200, body=b"slow")
+        elif self.path in ("/ok", "/no-head"):
+            self.respond(200, body=b"hello")
+        elif self.path == "/moved":
+            self.respond(301, location="/ok")
+        elif self.path == "/hop":
+            host, port = self.server.server_address[:2]
+            self.respond(308, location=f"http://{host}:{port}/moved")
+        elif self.path == "/elsewhere":
+            # Nothing answers here; following it would turn into a DNS error.
+            self.respond(302, location="https://elsewhere.invalid/landing")
+        else:
+            self.respond(404, body=b"nope")
+
+    def log_message(self, *args):
+        pass
+
+
+class CheckLinksTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubHandler.hits.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.tmp.name) / "links.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def check(self, urls, **kwargs):
+        checker = check_links.LinkChecker(
+            base_url=self.base_url, cache_path=self.cache_path, **kwargs
+        )
+        return checker.check(urls)
+
+    def test_statuses_redirects_and_head_fallback(self):
+        results = self.check([
+            "https://example.com/ok",
+            "https://example.com/missing",
+            "https://example.org/no-head",
+            "https://example.com/moved",
+        ])
+        self.assertTrue(results["https://example.com/ok"].ok)
+        self.assertEqual(results["https://example.com/missing"].status, 404)
+        self.assertFalse(results["https://example.com/missing"].ok)
+        self.assertTrue(results["https://example.org/no-head"].ok)
+        self.assertIn(("GET", "/no-head"), StubHandler.hits)
+        self.assertTrue(results["https://example.com/moved"].ok)
+
+    def test_redirects_to_another_origin_are_reported_not_followed(self):
+        results = self.check(["https://example.com/hop", "https://example.com/elsewhere"])
+        hop = results["https://example.com/hop"]
+        self.assertEqual((hop.ok, hop.status, hop.redirect), (True, 200, None))
+        self.assertEqual(
+            sorted(StubHandler.hits), [("HEAD", "/elsewhere"), ("HEAD", "/hop"), ("HEAD", "/moved"), ("HEAD", "/ok")]
+        )
+        elsewhere = results["https://example.com/elsewhere"]
+        self.assertEqual(
+            (elsewhere.ok, elsewhere.status, elsewhere.error, elsewhere.redirect),
+            (True, 302, None, "https://elsewhere.invalid/landing"),
+        )
+        # The redirect survives a trip through the cache.
+        cached = self.check(["https://example.com/elsewhere"])["https://example.com/elsewhere"]
+        self.assertEqual(cached.redirect, "https://elsewhere.invalid/landing")
+
+    def test_cached_results_skip_the_network_until_stale(self):
+        self.check(["https://example.com/ok"])
+        StubHandler.hits.clear()
+        self.check(["https://example.com/ok"])
+        self.assertEqual(StubHandler.hits, [])
+        self.check(["https://example.com/ok"], ttl=0)
+        self.assertEqual(StubHandler.hits, [("HEAD", "/ok")])
+
+    def test_waiting_for_a_host_slot_does_not_count_against_the_timeout(self):
+        # Twelve requests to one host run four at a time: three rounds of 0.2 s each.
+        urls = [f"https://example.com/slow/{index}" for index in range(12)]
+        results = self.check(urls, timeout=0.5)
+        self.assertTrue(all(result.ok for result in results.values()), results)
+
+    def test_failures_are_rechecked_sooner_than_successes(self):
+        self.check(["https://example.com/ok", "https://example.com/missing"])
+        StubHandler.hits.clear()
+        self.check(["https://example.com/ok", "https://example.com/missing"], failure_ttl=0)
+        self.assertEqual(StubHandler.hits, [("HEAD", "/missing"), ("GET", "/missing")])
+
+    def test_collects_external_links_from_fleet_and_nodes(self):
+        links = check_links.collect_links(check_links.SiteModel(ROOT))
+        self.assertIn("_data/fleet.yml", links["https://github.com/bseverns/Human-Buffer"])
+        self.assertIn(
+            "_nodes/classhub.md", links["https://github.com/bseverns/selfhosted-classhub"]
+        )
+        self.assertFalse(any(url.startswith("/") for url in links))
+
+
+if __name__ == "__main__":
+    unittest.main()
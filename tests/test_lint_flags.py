@@ -0,0 +1,73 @@
+import sys
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import check_all  # noqa: E402
+import front_matter  # noqa: E402
+import lint  # noqa: E402
+import lint_hidden_page  # noqa: E402
+import lint_sampler  # noqa: E402
+import parallel  # noqa: E402
+from site_model import SiteModel  # noqa: E402
+
+
+class HiddenPageFlagTests(unittest.TestCase):
+    """The sampler lints read `noindex`/`sitemap` as YAML values, the way Jekyll does."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / lint_hidden_page.PAGE).parent.mkdir(parents=True)
+        front_matter.clear_cache()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def flag_errors(self, front):
+        (self.root / lint_hidden_page.PAGE).write_text(f"---\n{front}\n---\nBody\n", encoding="utf-8")
+        errors = []
+        for lint in (lint_hidden_page, lint_sampler):
+            errors += [
+                error for error in lint.run(SiteModel(self.root)).errors
+                if "noindex" in error or "sitemap" in error
+            ]
+        return errors
+
+    def test_boolean_flags_pass(self):
+        self.assertEqual(self.flag_errors("noindex: true\nsitemap: false"), [])
+
+    def test_any_yaml_spelling_of_a_boolean_passes(self):
+        self.assertEqual(self.flag_errors("noindex: yes  # keep it hidden\nsitemap: False"), [])
+
+    def test_quoted_strings_are_not_flags(self):
+        self.assertEqual(len(self.flag_errors('noindex: "true"\nsitemap: "false"')), 4)
+
+    def test_last_duplicate_key_wins(self):
+        errors = self.flag_errors("noindex: true\nsitemap: false\nnoindex: false")
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(all("noindex" in error for error in errors))
+
+
+class JobsFlagTests(unittest.TestCase):
+    def test_negative_jobs_are_rejected_before_any_pool_starts(self):
+        for main in (lint.main, check_all.main):
+            with self.assertRaises(SystemExit) as raised, unittest.mock.patch("sys.stderr"):
+                main(["--jobs", "-2"])
+            self.assertEqual(raised.exception.code, 2)
+        with self.assertRaises(ValueError):
+            parallel.resolve_jobs(-1)
+
+    def test_zero_means_one_per_cpu_and_none_means_serial(self):
+        self.assertEqual(parallel.jobs_count("0"), 0)
+        self.assertEqual(parallel.resolve_jobs(None), 1)
+        self.assertGreaterEqual(parallel.resolve_jobs(0), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import json
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import build_repo_status  # noqa: E402
+
+
+class StubApi(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = []
+
+    def do_GET(self):
+        self.hits.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/repos/bseverns/truncated":
+            # Promise more than is sent, then hang up mid-body.
+            self.send_response(200)
+            self.send_header("Content-Length", "100")
+            self.end_headers()
+            self.wfile.write(b'{"html_url":')
+            self.close_connection = True
+            return
+        if self.path == "/repos/bseverns/human-buffer":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.send_header("ETag", '"v1"')
+                self.end_headers()
+                return
+            body = json.dumps(
+                {
+                    "html_url": "https://github.com/bseverns/Human-Buffer",
+                    "pushed_at": "2025-05-01T12:00:00Z",
+                    "updated_at": "2025-05-02T12:00:00Z",
+                    "archived": False,
+                    "subscribers_count": 3,
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+        else:
+            body = b'{"message": "Not Found"}'
+            self.send_response(404)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class RepoStatusTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubApi)
+        cls.api_base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubApi.hits.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.tmp.name) / "repo-status.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def status(self):
+        return build_repo_status.RepoStatus(api_base=self.api_base, cache_path=self.cache_path)
+
+    def test_fetches_then_revalidates_with_etag(self):
+        slugs = ["bseverns/human-buffer", "bseverns/gone"]
+        self.assertEqual(
+            self.status().refresh(slugs), {"bseverns/human-buffer": "fetched", "bseverns/gone": "HTTP 404"}
+        )
+        StubApi.hits.clear()
+        status = self.status()
+        self.assertEqual(status.refresh(slugs[:1]), {"bseverns/human-buffer": "unchanged"})
+        self.assertEqual(StubApi.hits, [("/repos/bseverns/human-buffer", '"v1"')])
+        snapshot = status.snapshot(slugs)
+        self.assertEqual(list(snapshot), ["bseverns/human-buffer"])
+        self.assertEqual(snapshot["bseverns/human-buffer"]["pushed_at"], "2025-05-01T12:00:00Z")
+        self.assertNotIn("subscribers_count", snapshot["bseverns/human-buffer"])
+
+    def test_response_cut_short_is_a_failure_not_a_crash(self):
+        outcomes = self.status().refresh(["bseverns/truncated", "bseverns/human-buffer"])
+        self.assertEqual(outcomes["bseverns/human-buffer"], "fetched")
+        self.assertIn("expected bytes", outcomes["bseverns/truncated"])
+
+    def test_snapshot_is_only_rewritten_when_repo_data_changes(self):
+        path = Path(self.tmp.name) / "status.json"
+        repos = {"bseverns/human-buffer": {"pushed_at": "2025-05-01T12:00:00Z"}}
+        self.assertTrue(build_repo_status.write_snapshot(repos, path))
+        self.assertFalse(build_repo_status.write_snapshot(repos, path))
+        self.assertEqual(json.loads(path.read_text())["repos"], repos)
+
+    def test_collects_repos_from_nodes_and_fleet(self):
+        repos = build_repo_status.collect_repos(build_repo_status.SiteModel(ROOT))
+        self.assertIn("_data/fleet.yml", repos["bseverns/human-buffer"])
+        self.assertIn("_nodes/classhub.md", repos["bseverns/selfhosted-classhub"])
+        self.assertIsNone(build_repo_status.repo_slug("https://gitlab.com/a/b"))
+
+
+SLUG_CASES = {
+    "https://github.com/bseverns/Human-Buffer": "bseverns/human-buffer",
+    "https://github.com/a/b.git": "a/b",
+    "https://github.com/a/b.git/": "a/b",
+    "https://github.com/a/b/": "a/b",
+    "http://GitHub.com/a/b.js": "a/b.js",
+    "bseverns/crowd-organ": "bseverns/crowd-organ",
+    " a/b \n": "a/b",
+    "https://gitlab.com/a/b": None,
+    "https://github.com/a/b/tree/main": None,
+    "https://github.com/a": None,
+    "https://github.com/ä/b": None,
+}
+
+
+class RepoSlugTests(unittest.TestCase):
+    """Snapshot keys: one per repo however a page spells its URL."""
+
+    def test_python_slugs(self):
+        for url, slug in SLUG_CASES.items():
+            self.assertEqual(build_repo_status.repo_slug(url), slug, url)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,18 +1,41 @@
-import json
+import hashlib
+import io
+import sys
+import tempfile
 import unittest
+from contextlib import redirect_stdout
 from pathlib import Path
+from unittest import mock
 
 
 ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import build_asset_manifest  # noqa: E402
+import build_catalog  # noqa: E402
+import build_diagrams  # noqa: E402
+import build_images  # noqa: E402
+import build_search_index  # noqa: E402
+import build_static_assets  # noqa: E402
+import build_vendor  # noqa: E402
+import lint_visual_system  # noqa: E402
+from site_model import SiteModel  # noqa: E402
+
+# One snapshot for the whole run: each file is read (and parsed) once, and
+# asset checks hit a single walk of the tree instead of a stat apiece.
+SITE = SiteModel(ROOT)
 
 
 class SiteContentTests(unittest.TestCase):
     def read(self, path):
-        return (ROOT / path).read_text(encoding="utf-8")
+        return SITE.text(path)
+
+    def assertAsset(self, path):
+        self.assertTrue(SITE.is_file(path), path)
 
     def test_teaching_pages_expose_content_and_one_canonical_entry(self):
         self.assertIn("{{ content }}", self.read("_layouts/teaching.html"))
-        self.assertFalse((ROOT / "teaching.md").exists())
+        self.assertFalse(SITE.exists("teaching.md"))
         redirect = self.read("teaching.html")
         self.assertIn('http-equiv="refresh"', redirect)
         self.assertIn('/courses.html', redirect)
@@ -59,34 +82,35 @@ class SiteContentTests(unittest.TestCase):
         for page_path, assets in expected.items():
             page = self.read(page_path)
             for asset in assets:
-                self.assertTrue((ROOT / asset).is_file(), asset)
+                self.assertAsset(asset)
                 self.assertIn("/" + asset, page)
 
     def test_new_archive_records_and_crowd_organ_are_public(self):
-        legacy = self.read("_data/legacy_works.yml")
+        legacy = {work["id"] for work in SITE.yaml("_data/legacy_works.yml")}
         for slug in (
             "everything-was-beautiful",
             "there-was-blood-on-my-hands",
             "iykywhgi",
         ):
-            self.assertIn(f"- id: {slug}", legacy)
-            self.assertTrue((ROOT / "docs" / "legacy" / f"{slug}.md").is_file())
-        node = ROOT / "_nodes" / "crowdOrgan.md"
-        self.assertTrue(node.is_file())
-        node_text = node.read_text(encoding="utf-8")
+            self.assertIn(slug, legacy)
+            self.assertAsset(f"docs/legacy/{slug}.md")
+        self.assertAsset("_nodes/crowdOrgan.md")
+        node_text = self.read("_nodes/crowdOrgan.md")
         self.assertIn('repo: "https://github.com/bseverns/crowd-organ"', node_text)
         self.assertIn("proof_objects:", node_text)
 
+    def routes(self):
+        return {route["id"]: route for route in SITE.yaml("_data/studio_routes.yml")}
+
     def test_proxy_only_data_weird_is_not_a_studio_route(self):
-        self.assertNotIn("id: data-weird", self.read("_data/studio_routes.yml"))
+        self.assertNotIn("data-weird", self.routes())
 
     def test_lofi_sampler_is_a_studio_route_with_real_hardware_image(self):
-        routes = self.read("_data/studio_routes.yml")
-        self.assertIn("- id: lofi-sampler", routes)
-        self.assertIn("url: /atlas/n/lofisampler/", routes)
+        route = self.routes()["lofi-sampler"]
+        self.assertEqual(route["url"], "/atlas/n/lofisampler/")
         image = "img/studio/lofi-sampler/neotrellis.jpg"
-        self.assertIn("/" + image, routes)
-        self.assertTrue((ROOT / image).is_file())
+        self.assertEqual(route["image"], "/" + image)
+        self.assertAsset(image)
 
     def test_classhub_node_publishes_only_staged_interface_proof(self):
         node = self.read("_nodes/classhub.md")
@@ -99,17 +123,98 @@ class SiteContentTests(unittest.TestCase):
             "img/studio/classhub/student-standard-view.png",
             "img/studio/classhub/data-lifespan-dashboard.png",
         ):
-            self.assertTrue((ROOT / image).is_file(), image)
+            self.assertAsset(image)
             self.assertIn("/" + image, node)
 
     def test_i_was_young_catalog_only_lists_public_media(self):
-        catalog = json.loads(self.read("catalog/items/i-was-young-once.json"))
+        index = SITE.json("catalog/index.json")
+        catalog = index["items"]["i-was-young-once"]
+        self.assertIn("i-was-young-once", index["complete"])
         for media_type in ("images", "video"):
             for asset in catalog["media"][media_type]:
-                self.assertTrue((ROOT / asset.lstrip("/")).is_file(), asset)
+                self.assertAsset(asset.lstrip("/"))
         self.assertIn("withheld", catalog["ethics"]["consent"])
         self.assertNotIn("I was young once too", self.read("docs/legacy/i-was-young-once.md"))
 
+    def test_catalog_index_is_compiled_from_current_items(self):
+        index, errors, _ = build_catalog.compile_catalog()
+        self.assertEqual(errors, [])
+        self.assertEqual(self.read("catalog/index.json"), build_catalog.render(index))
+
+    def test_search_index_is_built_from_current_pages(self):
+        manifest, files = build_search_index.build_index(SITE)
+        self.assertEqual(build_search_index.stale_files(manifest, files), [])
+
+    def test_diagram_bundle_is_built_from_current_sources(self):
+        manifest, name, _ = build_diagrams.build_bundle(SITE)
+        self.assertTrue(build_diagrams.is_current(SITE, manifest, name))
+        for page_name, refs in lint_visual_system.PAGE_REFERENCES.items():
+            page = self.read(page_name)
+            if "/js/diagram-loader.js" in page:
+                self.assertIn("data-diagram-bundle=", page, page_name)
+            for ref in refs:
+                self.assertIn(ref, manifest["diagrams"])
+
+    def test_responsive_variants_match_their_sources(self):
+        manifest = build_images.load_manifest()
+        self.assertTrue(manifest.get("images"))
+        self.assertEqual(build_images.stale_sources(manifest), [])
+
+    def test_asset_manifest_lists_every_published_asset(self):
+        # Whole entries: site.js reads the size to tell a placeholder from the real file.
+        built = build_asset_manifest.build_manifest(SITE)["files"]
+        self.assertEqual(build_asset_manifest.listed(SITE), built)
+
+    def test_fingerprinted_assets_match_their_sources(self):
+        # A stale entry would keep serving the old file under a cache-forever name.
+        self.assertEqual(build_static_assets.stale_sources(build_static_assets.load_manifest()), [])
+
+    def test_editing_a_source_makes_its_fingerprinted_copy_stale(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "css").mkdir()
+            source = root / "css/site.css"
+            source.write_text("body { color: red; }\n")
+            digest = hashlib.sha256(source.read_bytes()).hexdigest()
+            entry = build_static_assets.build_asset("css/site.css", digest, False, False, root)
+            manifest = {"files": {"/css/site.css": entry}}
+            self.assertEqual(build_static_assets.stale_sources(manifest, root), [])
+            self.assertFalse((root / (entry["path"].lstrip("/") + ".gz")).exists())
+            source.write_text("body { color: blue; }\n")
+            self.assertEqual(build_static_assets.stale_sources(manifest, root), ["/css/site.css"])
+
+    def test_sketch_pages_load_shared_vendor_copies(self):
+        manifest = build_vendor.load_manifest()
+        shared = {entry["shared"] for entry in manifest["libraries"].values()}
+        for page, scripts in manifest["pages"].items():
+            srcs = [match.group(3) for match in build_vendor.SCRIPT_SRC_RE.finditer(SITE.text(page))]
+            for url in scripts:
+                self.assertIn(url, srcs, page)
+                self.assertIn(url, shared, page)
+                self.assertTrue(SITE.is_file(url.lstrip("/")), url)
+        for entry in manifest["libraries"].values():
+            # The shared copy is the only one; sketch folders no longer carry their own.
+            self.assertEqual([copy["path"] for copy in entry["copies"]], [entry["shared"]])
+            self.assertFalse(SITE.is_file(entry["shared"].lstrip("/") + ".gz"), entry["shared"])
+        for page in build_vendor.SKETCH_PAGES:
+            srcs = [match.group(3) for match in build_vendor.SCRIPT_SRC_RE.finditer(SITE.text(page))]
+            vendored = [src for src in srcs if src.startswith("/assets/vendor/")]
+            self.assertEqual(vendored, manifest["pages"].get(page, []), page)
+
+    def test_vendor_build_refuses_to_ship_unminified_copies(self):
+        with mock.patch.object(build_vendor, "minify", return_value=None), redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(build_vendor.main([]), 1)
+        self.assertIn("rjsmin", out.getvalue())
+
+    def test_cdn_urls_are_only_swapped_for_the_same_build(self):
+        copy = build_vendor.Copy("robot/p5.js", "p5", "1.6.0", "0" * 64, 1)
+        local = {"p5": copy}
+        cdn = "https://cdnjs.cloudflare.com/ajax/libs/p5.js/"
+        self.assertEqual(build_vendor.resolve(cdn + "1.6.0/p5.js", "robot/index.html", {}, local), "p5@1")
+        self.assertIsNone(build_vendor.resolve(cdn + "1.7.0/p5.js", "robot/index.html", {}, local))
+        self.assertIsNone(build_vendor.resolve(cdn + "1.6.0/p5.min.js", "robot/index.html", {}, local))
+        self.assertIsNone(build_vendor.resolve(cdn + "1.6.0/p5.dom.js", "robot/index.html", {}, local))
+
     def test_bundle_uses_supported_ruby_line(self):
         self.assertIn('ruby "~> 3.3"', self.read("Gemfile"))
 
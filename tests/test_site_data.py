@@ -0,0 +1,90 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import site_data  # noqa: E402
+from site_model import SiteModel  # noqa: E402
+
+
+class SiteDataCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "_data").mkdir()
+        self.cache = site_data.cache_dir(self.root)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        site_data.clear_cache()
+
+    def entries(self):
+        return sorted(path.name for path in self.cache.iterdir()) if self.cache.is_dir() else []
+
+    def test_cache_lives_under_the_tree_being_read(self):
+        (self.root / "_data/fleet.yml").write_text("- title: Tools\n")
+        self.assertEqual(SiteModel(self.root).yaml("_data/fleet.yml"), [{"title": "Tools"}])
+        self.assertEqual(len(self.entries()), 1)
+        self.assertTrue(self.entries()[0].startswith("_data%2Ffleet.yml."))
+
+    def test_an_edit_replaces_the_sources_entry(self):
+        path = self.root / "_data/cds.yml"
+        for text in ("a: 1\n", "a: 2\n", "a: 3\n"):
+            path.write_text(text)
+            self.assertEqual(site_data.loads(text, self.cache, "_data/cds.yml"), {"a": int(text[3])})
+        self.assertEqual(len(self.entries()), 1)
+
+    def test_prune_drops_entries_for_deleted_sources(self):
+        for name in ("keep.yml", "gone.yml"):
+            (self.root / "_data" / name).write_text("x: 1\n")
+            site_data.load(self.root / "_data" / name, self.root)
+        (self.root / "_data/gone.yml").unlink()
+        self.assertEqual(site_data.prune(self.root), 1)
+        self.assertEqual([name.split(".yml.")[0] for name in self.entries()], ["_data%2Fkeep"])
+
+
+class TypedAccessorTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "_data").mkdir()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        site_data.clear_cache()
+
+    def test_sparse_cds_card_gets_the_old_defaults(self):
+        (self.root / "_data/cds.yml").write_text(
+            "cards:\n"
+            "  - abstract: No id or title yet\n"
+            "    aligns:\n"
+            "    methods: null\n"
+            "    outcomes: []\n"
+            "    teach: ''\n"
+            "    links:\n"
+            "    img_src:\n"
+            "    draft: true\n",
+            encoding="utf-8",
+        )
+        (card,) = site_data.cds_cards(self.root)
+        self.assertEqual((card.id, card.title, card.abstract), ("", "", "No id or title yet"))
+        self.assertEqual((card.aligns, card.methods, card.outcomes, card.links), ([], [], [], []))
+        self.assertEqual(card.teach, {})
+        self.assertIsNone(card.img_src)
+        self.assertEqual(card.extra, {"draft": True})
+
+    def test_null_order_still_sorts(self):
+        (self.root / "_data/legacy_works.yml").write_text(
+            "- {id: b, title: B, order: 2}\n- {id: a, title: A, order: null, images: null}\n", encoding="utf-8"
+        )
+        works = site_data.legacy_works(self.root)
+        self.assertEqual([work.id for work in works], ["a", "b"])
+        self.assertEqual(works[0].images, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
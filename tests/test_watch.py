@@ -0,0 +1,83 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import lint_hidden_page  # noqa: E402
+import lint_sampler  # noqa: E402
+import watch  # noqa: E402
+from site_model import SiteModel  # noqa: E402
+
+PROJECT = """---
+title: Demo
+summary: A project.
+featured: false
+year: 2024
+hero: /img/demo.jpg
+hero_alt: Demo
+---
+See [the notes](/field-notes/) and [the zine](../docs/zine.pdf).
+"""
+
+
+class WatchTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "_projects").mkdir()
+        (self.root / "_projects/demo.md").write_text(PROJECT)
+        (self.root / "about.md").write_text("---\ntitle: About\n---\n")
+        self.checks = watch.IncrementalChecks(SiteModel(self.root), ("lint",))
+        self.checks.check_all()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def broken_links(self):
+        return [warning for warning in self.checks.findings().warnings if "link not found" in warning]
+
+    def add(self, rel, text):
+        path = self.root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        return self.checks.update({rel})
+
+    def test_new_permalink_rechecks_pages_linking_to_it(self):
+        self.assertEqual(len(self.broken_links()), 2)
+        units = self.add("pages/notes.md", "---\ntitle: Notes\npermalink: /field-notes/\n---\n")
+        self.assertIn("lint:_projects/demo.md", units)
+        self.assertEqual(len(self.broken_links()), 1)
+
+    def test_new_file_rechecks_relative_links_to_it(self):
+        units = self.add("docs/zine.pdf", "%PDF-1.4\n")
+        self.assertIn("lint:_projects/demo.md", units)
+        self.assertEqual(self.broken_links(), ["_projects/demo.md: link not found -> /field-notes/"])
+
+    def test_new_directory_rechecks_links_to_it(self):
+        units = self.add("field-notes/index.txt", "notes\n")
+        self.assertIn("lint:_projects/demo.md", units)
+        self.assertEqual(self.broken_links(), ["_projects/demo.md: link not found -> ../docs/zine.pdf"])
+
+    def test_deleted_directory_breaks_links_again(self):
+        self.add("field-notes/index.txt", "notes\n")
+        (self.root / "field-notes/index.txt").unlink()
+        (self.root / "field-notes").rmdir()
+        units = self.checks.update({"field-notes/index.txt"})
+        self.assertIn("lint:_projects/demo.md", units)
+        self.assertEqual(len(self.broken_links()), 2)
+
+    def test_asset_lints_depend_on_their_assets(self):
+        checks = watch.IncrementalChecks(SiteModel(ROOT), ("lint_sampler", "lint_hidden_page"))
+        checks.check_all()
+        for asset in lint_sampler.ASSETS:
+            self.assertIn("lint_sampler", checks.deps[asset])
+        for asset in lint_hidden_page.ASSETS:
+            self.assertIn("lint_hidden_page", checks.deps[asset])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""Benchmark the tools against synthetic repos of growing size.
+
+For each `--sizes` entry N this writes a throwaway repo with N atlas nodes
+(each with `--links` related links to other nodes), N projects linking to
+nodes and each other, a fleet file pointing at nodes, and N // 10 sampler
+cards (at least four) with generated PNG heroes. It copies the real `tools/`
+into that repo and runs each tool group in a fresh subprocess, so every
+group reports its own per-phase wall time and peak RSS without warm caches
+from the group before it.
+
+Results go to JSON (`.cache/bench/<commit>.json` by default) along with a
+scaling exponent per phase: the log-log slope of time against N between the
+smallest and largest size. Around 1 is linear; a phase creeping toward 2 has
+gone quadratic. `--compare old.json` prints the per-phase ratio against an
+earlier run.
+
+The sampler group needs the same packages as `build_sampler_pdf.py`; without
+them it is recorded as skipped rather than failing the whole run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import instrument
+
+ROOT = Path(__file__).resolve().parents[1]
+TOOLS_DIR = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / ".cache/bench"
+DEFAULT_SIZES = (50, 200, 800)
+DEFAULT_LINKS = 4
+GROUPS = ("lint", "lint_visual_system", "sampler")
+HERO_SIZE = (1600, 1000)
+
+REQUIRED_DIAGRAMS = (
+    "fleet-map.md",
+    "core-project-relationships.md",
+    "memory-engine-flow.md",
+    "mn42-stack.md",
+    "seedbox-triangle.md",
+    "class-hub-architecture.md",
+    "syllabus-constellation.md",
+    "live-rig-topology.md",
+    "research-node-orbit.md",
+    "research-proof-loop.md",
+)
+
+CONFIG = """title: "Bench"
+baseurl: ""
+collections:
+  projects:
+    output: true
+    permalink: /projects/:name/
+  teaching:
+    output: true
+    permalink: /teaching/:name/
+  nodes:
+    output: true
+    permalink: /atlas/n/:name/
+"""
+
+WORDS = (
+    "consent archive signal sensor repair studio classroom memory engine lineage "
+    "ethics interface gesture feedback circuit document practice field noise map"
+).split()
+
+
+def _prose(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def card_count(size: int) -> int:
+    return max(4, size // 10)
+
+
+# --- synthetic repo -------------------------------------------------------
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _write_hero(path: Path, seed: int) -> None:
+    from PIL import Image
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Noise over a gradient: compresses about as badly as a real photo.
+    noise = Image.effect_noise(HERO_SIZE, 40 + seed % 20)
+    gradient = Image.linear_gradient("L").resize(HERO_SIZE)
+    Image.merge("RGB", (noise, gradient, noise.transpose(Image.FLIP_LEFT_RIGHT))).save(path)
+
+
+def generate_repo(dest: Path, size: int, links: int = DEFAULT_LINKS, heroes: bool = True) -> dict:
+    """Write a synthetic repo under `dest` and return what went into it."""
+    rng = random.Random(size)
+    shutil.copytree(TOOLS_DIR, dest / "tools", ignore=shutil.ignore_patterns("__pycache__"))
+    _write(dest / "_config.yml", CONFIG)
+
+    nodes = [f"node-{i:05d}" for i in range(size)]
+    for i, name in enumerate(nodes):
+        related = rng.sample(nodes, min(links, size))
+        entries = "".join(
+            f'  - title: "{other}"\n    url: "/atlas/n/{other}/"\n' for other in related
+        )
+        _write(
+            dest / "_nodes" / f"{name}.md",
+            f'---\ntitle: "{name}"\npermalink: /atlas/n/{name}/\nsummary: "{_prose(rng, 8)}"\n'
+            f"related_projects:\n{entries}---\n\n{_prose(rng, 60)}\n",
+        )
+
+    for i in range(size):
+        body_links = " ".join(
+            f"[see {target}](/atlas/n/{target}/)" for target in rng.sample(nodes, min(2, size))
+        )
+        peer = f"project-{rng.randrange(size):05d}"
+        _write(
+            dest / "_projects" / f"project-{i:05d}.md",
+            f'---\ntitle: "Project {i}"\nsummary: "{_prose(rng, 10)}"\nfeatured: false\n'
+            f"year: {2000 + i % 25}\nhero: /img/bench/hero.png\nhero_alt: \"Bench hero\"\n---\n\n"
+            f"{_prose(rng, 40)} {body_links} [peer](/projects/{peer}/)\n",
+        )
+
+    fleet = "".join(
+        f'      - title: "{name}"\n        url: "/atlas/n/{name}/"\n'
+        for name in rng.sample(nodes, min(size, 30))
+    )
+    _write(dest / "_data/fleet.yml", f'satellite_groups:\n  - title: "Bench"\n    items:\n{fleet}')
+
+    diagram_dir = dest / "docs/visual-system/diagrams"
+    for name in REQUIRED_DIAGRAMS:
+        _write(diagram_dir / name, f"# {name}\n\n```mermaid\ngraph TD\n  A --> B\n```\n")
+    refs = {
+        "how-to-read-this-site.md": REQUIRED_DIAGRAMS[:2],
+        "art.html": (REQUIRED_DIAGRAMS[2], REQUIRED_DIAGRAMS[3], REQUIRED_DIAGRAMS[7]),
+        "courses.html": REQUIRED_DIAGRAMS[4:7],
+        "research/index.md": REQUIRED_DIAGRAMS[8:],
+    }
+    for page, names in refs.items():
+        _write(dest / page, "".join(f"/docs/visual-system/diagrams/{n}\n" for n in names))
+
+    cards = []
+    for i in range(card_count(size)):
+        img = f"/img/bench/card-{i:04d}.png"
+        if heroes:
+            _write_hero(dest / img.lstrip("/"), i)
+        cards.append(
+            {
+                "id": f"card-{i}",
+                "title": f"Card {i}",
+                "img_src": img if heroes else None,
+                "img_alt": f"Card {i} hero",
+                "abstract": _prose(rng, 50),
+                "aligns": rng.sample(WORDS, 3),
+                "methods": [_prose(rng, 8) for _ in range(3)],
+                "outcomes": [_prose(rng, 8) for _ in range(3)],
+                "teach": {"goal": _prose(rng, 6), "lab60": _prose(rng, 10), "assess": _prose(rng, 6)},
+                "links": [{"label": "Repository", "url": f"https://example.com/card-{i}"}],
+            }
+        )
+    if heroes:
+        _write_hero(dest / "img/bench/hero.png", size)
+    _write(dest / "_data/cds.yml", json.dumps({"cards": cards}, indent=1) + "\n")
+    _write(
+        dest / "critical-digital-studies-sampler/index.md",
+        '---\ntitle: "Sampler"\nsitemap: false\nnoindex: true\nupdated: "2025-01-01"\n---\n',
+    )
+    _write(dest / "about.md", "# About\n")
+    (dest / "assets/docs").mkdir(parents=True, exist_ok=True)
+    return {"nodes": size, "projects": size, "related_links": size * min(links, size), "cards": len(cards)}
+
+
+# --- phases (run inside the synthetic repo) -------------------------------
+
+
+def _group_lint(profiler: instrument.Profiler) -> dict:
+    import lint
+    from site_model import SiteModel
+
+    site = SiteModel()
+    with profiler.phase("walk"):
+        site.files
+    with profiler.phase("permalinks"):
+        site.permalinks
+    with profiler.phase("check"):
+        findings = lint.run(site)
+    return {"errors": len(findings.errors), "warnings": len(findings.warnings)}
+
+
+def _group_lint_visual_system(profiler: instrument.Profiler) -> dict:
+    import lint_visual_system as visual
+    from site_model import SiteModel
+
+    site = SiteModel()
+    with profiler.phase("index"):
+        index = visual.AtlasIndex.build(site)
+    with profiler.phase("diagrams"):
+        visual.check_diagrams(site)
+    urls = visual.fleet_urls(site)
+    with profiler.phase("links"):
+        errors = visual.check_fleet(urls, index) + index.dangling()
+    with profiler.phase("orphans"):
+        index.orphans(extra_inbound=urls)
+    return {"errors": len(errors)}
+
+
+def _group_sampler(profiler: instrument.Profiler) -> dict:
+    with profiler.phase("import"):
+        try:
+            import build_sampler_pdf as sampler
+        except OSError as exc:
+            # cairosvg raises OSError when the cairo library itself is missing.
+            raise ImportError(str(exc).splitlines()[0]) from exc
+    sampler.raster_cache = None
+    sampler.profiler = profiler
+    with profiler.phase("load_cards"):
+        cards = sampler.load_cards()
+    # build_pdf reports its own nested phases (heroes, flowables, doc.build).
+    with profiler.phase("build_pdf"):
+        sampler.build_pdf(cards, workers=1, max_bytes=None)
+    return {"pdf_bytes": sampler.OUTPUT_PATH.stat().st_size}
+
+
+def _peak_rss_kb() -> int:
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # Linux reports kilobytes, macOS bytes.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_group(name: str) -> dict:
+    profiler = instrument.Profiler()
+    try:
+        with open(os.devnull, "w") as quiet, _redirect_stdout(quiet):
+            extra = globals()[f"_group_{name}"](profiler)
+    except ImportError as exc:
+        return {"skipped": f"{type(exc).__name__}: {exc}"}
+    return {
+        "phases": profiler.phases,
+        "total": sum(seconds for key, seconds in profiler.phases.items() if "/" not in key),
+        "peak_rss_kb": _peak_rss_kb(),
+        **extra,
+    }
+
+
+@contextmanager
+def _redirect_stdout(stream):
+    saved = sys.stdout
+    sys.stdout = stream
+    try:
+        yield
+    finally:
+        sys.stdout = saved
+
+
+def run_group_in(repo: Path, name: str) -> dict:
+    """Run one group in a fresh interpreter using the repo's copy of the tools."""
+    completed = subprocess.run(
+        [sys.executable, str(repo / "tools/bench.py"), "--group", name],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        return {"error": completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "failed"}
+    return json.loads(completed.stdout)
+
+
+# --- reporting ------------------------------------------------------------
+
+
+def scaling(results: list[dict]) -> dict[str, dict[str, float]]:
+    """Log-log slope of each phase's time against N, smallest to largest size."""
+    if len(results) < 2:
+        return {}
+    first, last = results[0], results[-1]
+    ratio = math.log(last["size"] / first["size"])
+    slopes: dict[str, dict[str, float]] = {}
+    for group, data in last["groups"].items():
+        before = first["groups"].get(group, {}).get("phases", {})
+        for name, seconds in data.get("phases", {}).items():
+            if before.get(name, 0) > 0 and seconds > 0:
+                slopes.setdefault(group, {})[name] = round(math.log(seconds / before[name]) / ratio, 2)
+    return slopes
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_table(report: dict, baseline: dict | None = None) -> None:
+    old = {}
+    if baseline:
+        for entry in baseline.get("results", []):
+            for group, data in entry["groups"].items():
+                for name, seconds in data.get("phases", {}).items():
+                    old[(entry["size"], group, name)] = seconds
+    for entry in report["results"]:
+        print(f"\nN={entry['size']}  ({', '.join(f'{k} {v}' for k, v in entry['fixture'].items())})")
+        for group, data in entry["groups"].items():
+            if "phases" not in data:
+                print(f"  {group:<20} {data.get('skipped') or data.get('error')}")
+                continue
+            print(f"  {group:<20} {data['total'] * 1000:9.1f} ms  peak {data['peak_rss_kb'] / 1024:6.1f} MB")
+            for name, seconds in data["phases"].items():
+                line = f"    {name:<44} {seconds * 1000:9.1f} ms"
+                previous = old.get((entry["size"], group, name))
+                if previous:
+                    line += f"  x{seconds / previous:.2f} vs {baseline['commit']}"
+                print(line)
+    if report["scaling"]:
+        print("\nScaling exponent (1 = linear, 2 = quadratic):")
+        for group, phases in report["scaling"].items():
+            print("  " + group + ": " + ", ".join(f"{name} {slope}" for name, slope in phases.items()))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--sizes",
+        default=",".join(map(str, DEFAULT_SIZES)),
+        help="comma-separated N values (nodes and projects; cards are N // 10, at least 4)",
+    )
+    parser.add_argument("--links", type=int, default=DEFAULT_LINKS, help="related links per node")
+    parser.add_argument("--groups", default=",".join(GROUPS), help=f"subset of {', '.join(GROUPS)}")
+    parser.add_argument("--output", type=Path, help="JSON path (default: .cache/bench/<commit>.json)")
+    parser.add_argument("--compare", type=Path, help="earlier JSON result to print ratios against")
+    parser.add_argument("--keep", type=Path, help="write the synthetic repos here and leave them")
+    parser.add_argument("--group", choices=GROUPS, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.group:
+        # Child mode: we're inside a synthetic repo; print one group's numbers.
+        print(json.dumps(run_group(args.group)))
+        return 0
+
+    sizes = sorted({int(size) for size in args.sizes.split(",")})
+    groups = [group for group in args.groups.split(",") if group]
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        parser.error(f"unknown group(s): {', '.join(sorted(unknown))}")
+    try:
+        import PIL  # noqa: F401
+
+        heroes = True
+    except ImportError:
+        heroes = False
+
+    workdir = args.keep or Path(tempfile.mkdtemp(prefix="bench-"))
+    results = []
+    try:
+        for size in sizes:
+            repo = workdir / f"n{size}"
+            if repo.exists():
+                shutil.rmtree(repo)
+            started = time.perf_counter()
+            fixture = generate_repo(repo, size, args.links, heroes)
+            print(f"generated N={size} in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+            results.append(
+                {"size": size, "fixture": fixture, "groups": {g: run_group_in(repo, g) for g in groups}}
+            )
+    finally:
+        if args.keep is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "links_per_node": args.links,
+        "results": results,
+        "scaling": scaling(results),
+    }
+    output = args.output or OUTPUT_DIR / f"{report['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    print_table(report, baseline)
+    print(f"\nWrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Record which published docs, PDFs, and media exist, with size and hash.
+
+One walk of the tree (`SiteModel.files`) picks up every file under
+`ASSET_DIRS` with a suffix in `ASSET_SUFFIXES` and writes
+`assets/asset-manifest.json`:
+
+    {"version": 1, "roots": ["/assets/", ...], "skip": ["/assets/responsive/", ...],
+     "files": {"/img/press/headshot.jpg": [bytes, "sha256[:12]"], ...}}
+
+`js/site.js` fetches it once per page to decide the press-kit badges instead of
+sending a `HEAD` probe per asset. Paths outside `roots` (or inside `skip`)
+aren't covered, so the browser still probes those. A zero-byte file is listed
+(it's a committed placeholder) but the browser treats it as not yet added.
+The lints keep checking the filesystem; the manifest is only for the browser.
+
+Rerun after adding, removing, or replacing assets; `--check` (and the content
+tests) fail when any entry, size and hash included, disagrees with the tree.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from site_model import ROOT, SiteModel
+
+ASSET_DIRS = ("assets", "img", "2d/full2d", "3d/full3d")
+# Generated trees with manifests of their own.
+SKIP_DIRS = ("assets/responsive", "assets/search", "assets/diagrams/bundle")
+ASSET_SUFFIXES = frozenset(
+    """
+    .pdf .docx .txt .vtt .srt
+    .jpg .jpeg .png .gif .webp .avif .svg
+    .mp3 .wav .ogg .m4a .mp4 .webm .mov
+    """.split()
+)
+MANIFEST_REL = "assets/asset-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def is_asset(rel: str) -> bool:
+    if not rel.startswith(tuple(folder + "/" for folder in ASSET_DIRS)):
+        return False
+    if rel.startswith(tuple(folder + "/" for folder in SKIP_DIRS)):
+        return False
+    return Path(rel).suffix.lower() in ASSET_SUFFIXES
+
+
+def _digest(path: Path) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            sha.update(block)
+    return sha.hexdigest()[:12]
+
+
+def build_manifest(site: SiteModel) -> dict:
+    files = {}
+    for rel in sorted(rel for rel in site.files if is_asset(rel)):
+        path = site.path(rel)
+        files["/" + rel] = [path.stat().st_size, _digest(path)]
+    return {
+        "version": MANIFEST_VERSION,
+        "roots": [f"/{folder}/" for folder in ASSET_DIRS],
+        "skip": [f"/{folder}/" for folder in SKIP_DIRS],
+        "files": files,
+    }
+
+
+def render(manifest: dict) -> str:
+    # One entry per line keeps diffs readable without paying for indent=2 on every list.
+    lines = [f"  {json.dumps(url)}: {json.dumps(entry)}" for url, entry in manifest["files"].items()]
+    head = (
+        f'{{"version": {manifest["version"]}, "roots": {json.dumps(manifest["roots"])}, '
+        f'"skip": {json.dumps(manifest["skip"])}, "files": {{\n'
+    )
+    return head + ",\n".join(lines) + "\n}}\n"
+
+
+def listed(site: SiteModel) -> dict[str, list] | None:
+    """The committed manifest's entries, or None when the tree has no manifest."""
+    if not site.exists(MANIFEST_REL):
+        return None
+    manifest = site.json(MANIFEST_REL)
+    return manifest.get("files", {}) if manifest.get("version") == MANIFEST_VERSION else None
+
+
+def refresh(root: Path = ROOT) -> dict | None:
+    """Rewrite the manifest if the tree has one; build tools call this after writing assets."""
+    site = SiteModel(root)
+    if not site.exists(MANIFEST_REL):
+        return None
+    manifest = build_manifest(site)
+    site.path(MANIFEST_REL).write_text(render(manifest), encoding="utf-8")
+    return manifest
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="fail if the committed manifest is stale")
+    args = parser.parse_args(argv)
+
+    site = SiteModel()
+    text = render(build_manifest(site))
+    path = site.path(MANIFEST_REL)
+    if args.check:
+        if site.exists(MANIFEST_REL) and site.text(MANIFEST_REL) == text:
+            print("Asset manifest is current")
+            return 0
+        print("Asset manifest is stale; run tools/build_asset_manifest.py")
+        return 1
+
+    path.write_text(text, encoding="utf-8")
+    manifest = json.loads(text)
+    size = sum(entry[0] for entry in manifest["files"].values())
+    print(f"Listed {len(manifest['files'])} assets ({size / 1e6:.1f} MB) in {MANIFEST_REL} ({len(text) / 1024:.0f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
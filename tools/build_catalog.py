@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Compile `catalog/items/*.json` into one validated, queryable index.
+
+Every item listed in `catalog/catalog.json` is checked against `ITEM_SCHEMA`
+and cross-referenced with `collections.json`, `themes.json`, and the other
+items' ids. The result is `catalog/index.json`: the full item records plus
+inverted lookups by theme, collection, and media type, and which items point
+at media files that haven't landed in the repo yet. Consumers load that one
+file instead of opening every item.
+
+Run it after touching anything under `catalog/`; `--check` fails if the
+committed index is stale, which is what CI and the tests want.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CATALOG_DIR = ROOT / "catalog"
+INDEX_PATH = CATALOG_DIR / "index.json"
+INDEX_VERSION = 1
+MEDIA_TYPES = ("images", "video", "audio")
+
+# field -> (allowed types, required)
+ITEM_SCHEMA: dict[str, tuple[tuple[type, ...], bool]] = {
+    "id": ((str,), True),
+    "title": ((str,), True),
+    "slug": ((str,), True),
+    "year_start": ((int,), True),
+    "year_end": ((int, type(None)), False),
+    "circa": ((bool,), False),
+    "status": ((str,), True),
+    "collections": ((list,), True),
+    "themes": ((list,), True),
+    "summary": ((str,), True),
+    "medium": ((list,), False),
+    "materials": ((list,), False),
+    "stack": ((list,), False),
+    "core_concepts": ((list,), False),
+    "body_relation": ((str,), False),
+    "ethics": ((dict,), True),
+    "provenance": ((str,), False),
+    "docs": ((dict,), False),
+    "media": ((dict,), True),
+    "related_ids": ((list,), False),
+    "quote": ((str,), False),
+    "sort_order": ((int,), True),
+}
+
+
+def load_json(path: Path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def validate_item(name: str, item, errors: list[str]) -> None:
+    if not isinstance(item, dict):
+        errors.append(f"{name}: item must be a JSON object")
+        return
+    for field, (types, required) in ITEM_SCHEMA.items():
+        if field not in item:
+            if required:
+                errors.append(f"{name}: missing {field}")
+            continue
+        if not isinstance(item[field], types) or (
+            isinstance(item[field], bool) and bool not in types
+        ):
+            expected = " or ".join("null" if t is type(None) else t.__name__ for t in types)
+            errors.append(f"{name}: {field} should be {expected}")
+    for field in sorted(set(item) - set(ITEM_SCHEMA)):
+        errors.append(f"{name}: unknown field {field}")
+    media = item.get("media")
+    if isinstance(media, dict):
+        for media_type, assets in media.items():
+            if media_type not in MEDIA_TYPES:
+                errors.append(f"{name}: unknown media type {media_type}")
+            elif not isinstance(assets, list) or not all(isinstance(a, str) for a in assets):
+                errors.append(f"{name}: media.{media_type} should be a list of paths")
+
+
+def compile_catalog(
+    catalog_dir: Path = CATALOG_DIR, root: Path = ROOT
+) -> tuple[dict, list[str], list[str]]:
+    """Return `(index, errors, warnings)`; the index is only trustworthy when errors is empty.
+
+    Membership drift between an item's `collections` and `collections.json` is
+    a warning: the index follows what each item claims.
+    """
+    errors: list[str] = []
+    warnings: list[str] = []
+    listed = load_json(catalog_dir / "catalog.json").get("items", [])
+    collections: dict[str, list[str]] = load_json(catalog_dir / "collections.json")
+    themes = set(load_json(catalog_dir / "themes.json").get("themes", []))
+
+    items: dict[str, dict] = {}
+    listed_files = set()
+    for ref in listed:
+        path = root / ref.lstrip("/")
+        name = path.relative_to(root).as_posix()
+        listed_files.add(path.name)
+        if not path.is_file():
+            errors.append(f"catalog.json lists a missing item: {ref}")
+            continue
+        item = load_json(path)
+        validate_item(name, item, errors)
+        if not isinstance(item, dict) or not isinstance(item.get("id"), str):
+            continue
+        if item["id"] != path.stem or item.get("slug") != path.stem:
+            errors.append(f"{name}: id and slug should both match the filename")
+        if item["id"] in items:
+            errors.append(f"{name}: duplicate id {item['id']}")
+        items[item["id"]] = item
+
+    for path in sorted((catalog_dir / "items").glob("*.json")):
+        if path.name not in listed_files:
+            errors.append(f"catalog/items/{path.name} is not listed in catalog.json")
+
+    by_theme: dict[str, list[str]] = defaultdict(list)
+    by_collection: dict[str, list[str]] = defaultdict(list)
+    by_media_type: dict[str, list[str]] = {media_type: [] for media_type in MEDIA_TYPES}
+    missing_assets: dict[str, list[str]] = {}
+
+    order = sorted(items, key=lambda item_id: (items[item_id].get("sort_order", 0), item_id))
+    for item_id in order:
+        item = items[item_id]
+        name = f"catalog/items/{item_id}.json"
+        for theme in item.get("themes", []):
+            if theme not in themes:
+                errors.append(f"{name}: theme {theme!r} is not in themes.json")
+            by_theme[theme].append(item_id)
+        for collection in item.get("collections", []):
+            if collection not in collections:
+                errors.append(f"{name}: collection {collection!r} is not in collections.json")
+            elif item_id not in collections[collection]:
+                warnings.append(f"{name}: collections.json[{collection!r}] does not list it")
+            by_collection[collection].append(item_id)
+        for related in item.get("related_ids", []):
+            if related not in items:
+                errors.append(f"{name}: related id {related!r} has no catalog item")
+        missing = []
+        for media_type, assets in (item.get("media") or {}).items():
+            if assets and media_type in by_media_type:
+                by_media_type[media_type].append(item_id)
+            for asset in assets if isinstance(assets, list) else []:
+                if not asset.startswith(("http://", "https://")) and not (
+                    root / asset.lstrip("/")
+                ).is_file():
+                    missing.append(asset)
+        if missing:
+            missing_assets[item_id] = missing
+
+    for collection, members in collections.items():
+        for member in members:
+            if member not in items:
+                errors.append(f"collections.json[{collection!r}] lists unknown item {member!r}")
+            elif collection not in items[member].get("collections", []):
+                warnings.append(
+                    f"collections.json[{collection!r}] lists {member!r}, but the item doesn't claim it"
+                )
+
+    index = {
+        "version": INDEX_VERSION,
+        "order": order,
+        "items": {item_id: items[item_id] for item_id in order},
+        "by_theme": {theme: by_theme[theme] for theme in sorted(by_theme)},
+        "by_collection": {name: by_collection[name] for name in sorted(by_collection)},
+        "by_media_type": by_media_type,
+        "missing_assets": missing_assets,
+        "complete": [item_id for item_id in order if item_id not in missing_assets],
+    }
+    return index, errors, warnings
+
+
+def render(index: dict) -> str:
+    return json.dumps(index, indent=2, ensure_ascii=False) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="don't write; fail if catalog/index.json is missing or out of date",
+    )
+    args = parser.parse_args(argv)
+
+    index, errors, warnings = compile_catalog()
+    if warnings:
+        print("Catalog warnings:")
+        for warning in warnings:
+            print(" -", warning)
+    if errors:
+        print("Catalog errors:")
+        for error in errors:
+            print(" -", error)
+        return 1
+
+    text = render(index)
+    rel = INDEX_PATH.relative_to(ROOT)
+    if args.check:
+        if not INDEX_PATH.exists() or INDEX_PATH.read_text(encoding="utf-8") != text:
+            print(f"{rel} is stale; run tools/build_catalog.py")
+            return 1
+        print(f"{rel} is up to date")
+        return 0
+
+    INDEX_PATH.write_text(text, encoding="utf-8")
+    print(
+        f"Wrote {rel}: {len(index['items'])} items, "
+        f"{len(index['missing_assets'])} waiting on media"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Bundle the Mermaid diagram sources into one content-hashed JSON file.
+
+Every `docs/visual-system/diagrams/*.md` with a ```mermaid block contributes
+its code, keyed by the URL pages put in `data-diagram-src`. The bundle lands
+in `assets/diagrams/bundle/diagrams.<hash>.json`, so it can be cached forever;
+`_data/diagram_bundle.json` records its URL plus a hash per diagram, and pages
+hand that URL to `js/diagram-loader.js`, which then needs one fetch for every
+diagram on the page. A mount the bundle doesn't cover still falls back to
+fetching its markdown source.
+
+Rerun after editing a diagram; `--check` fails when the committed bundle is stale.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+from lint_visual_system import DIAGRAM_DIR
+from site_model import ROOT, SiteModel
+
+OUTPUT_DIR = ROOT / "assets/diagrams/bundle"
+MANIFEST_PATH = ROOT / "_data/diagram_bundle.json"
+BUNDLE_VERSION = 1
+
+# Same match `diagram-loader.js` applies to a fetched source.
+MERMAID_RE = re.compile(r"```mermaid\s*([\s\S]*?)```", re.I)
+
+
+def extract_mermaid(text: str) -> str:
+    match = MERMAID_RE.search(text)
+    return match.group(1).strip() if match else ""
+
+
+def _dump(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+
+def build_bundle(site: SiteModel) -> tuple[dict, str, str]:
+    """Return `(manifest, bundle filename, bundle json)`."""
+    diagrams = {}
+    for rel in site.glob(site.rel(DIAGRAM_DIR)):
+        code = extract_mermaid(site.text(rel))
+        if code:
+            diagrams["/" + rel] = code
+    text = _dump({"version": BUNDLE_VERSION, "diagrams": diagrams})
+    name = f"diagrams.{hashlib.sha256(text.encode()).hexdigest()[:10]}.json"
+    manifest = {
+        "version": BUNDLE_VERSION,
+        "bundle": "/" + (OUTPUT_DIR / name).relative_to(ROOT).as_posix(),
+        "bytes": len(text.encode()) + 1,
+        "diagrams": {
+            src: hashlib.sha256(code.encode()).hexdigest()[:10] for src, code in diagrams.items()
+        },
+    }
+    return manifest, name, text
+
+
+def render_manifest(manifest: dict) -> str:
+    return json.dumps(manifest, indent=2) + "\n"
+
+
+def write_bundle(manifest: dict, name: str, text: str, root: Path = ROOT) -> int:
+    """Write the bundle and manifest, drop superseded bundles, and return how many were dropped."""
+    output = root / OUTPUT_DIR.relative_to(ROOT)
+    output.mkdir(parents=True, exist_ok=True)
+    path = output / name
+    if not path.exists():
+        path.write_text(text + "\n", encoding="utf-8")
+    removed = 0
+    for stale in output.glob("diagrams.*.json"):
+        if stale.name != name:
+            stale.unlink()
+            removed += 1
+    (root / MANIFEST_PATH.relative_to(ROOT)).write_text(render_manifest(manifest), encoding="utf-8")
+    return removed
+
+
+def is_current(site: SiteModel, manifest: dict, name: str) -> bool:
+    rel = (OUTPUT_DIR / name).relative_to(ROOT).as_posix()
+    return (
+        site.is_file(rel)
+        and site.is_file(MANIFEST_PATH.relative_to(ROOT).as_posix())
+        and site.text(MANIFEST_PATH.relative_to(ROOT).as_posix()) == render_manifest(manifest)
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="fail if the committed bundle is stale")
+    args = parser.parse_args(argv)
+
+    site = SiteModel()
+    manifest, name, text = build_bundle(site)
+    if args.check:
+        if is_current(site, manifest, name):
+            print(f"Diagram bundle is current ({len(manifest['diagrams'])} diagrams)")
+            return 0
+        print("Diagram bundle is stale; run tools/build_diagrams.py")
+        return 1
+
+    removed = write_bundle(manifest, name, text)
+    print(
+        f"Bundled {len(manifest['diagrams'])} diagrams ({manifest['bytes'] / 1024:.1f} KB) "
+        f"into {manifest['bundle']}; removed {removed} superseded bundle(s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""Build responsive image variants and the `srcset` data pages render from.
+
+Every JPG/PNG a page hands to `_includes/responsive-image.html` gets a
+width ladder (the `WIDTHS` rungs narrower than the original, never upscaled) in WebP, plus AVIF when this Pillow can
+write it. Variants land in `assets/responsive/` with the source's content
+hash in the filename, so they can be cached forever. The manifest,
+`_data/responsive_images.json`, maps each source URL to its dimensions, the
+variants, and ready-made `srcset` strings; `_includes/responsive-image.html`
+reads it and falls back to the original `<img>` for anything not listed.
+Sources are found the way the include is fed (see `find_sources`): literal
+`src="..."` arguments in pages, `lineage_images` front matter, and studio
+route images. Photos no page renders that way get no variants.
+
+Sources whose bytes and encoder settings match the manifest are skipped, so a
+rerun after adding one photo only encodes that photo. The rest runs across a
+process pool (`--workers`). Needs Pillow. Sources Pillow can't read are
+recorded under `unreadable` with their hash, so `--check` (and the content
+tests) can tell a new or edited photo from a known placeholder without
+decoding anything; it fails when the committed variants no longer match.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import json
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import site_data
+from site_model import ROOT, SiteModel
+
+INCLUDE_RE = re.compile(r"""\{%-?\s*include\s+responsive-image\.html\s[^%]*?\bsrc=(["'])(/[^"']+)\1""")
+SOURCE_SUFFIXES = (".jpg", ".jpeg", ".png")
+OUTPUT_DIR = ROOT / "assets/responsive"
+MANIFEST_PATH = ROOT / "_data/responsive_images.json"
+MANIFEST_VERSION = 1
+WIDTHS = (320, 640, 960, 1280, 1920)
+
+# format -> Pillow save options. AVIF is dropped at runtime if unsupported.
+ENCODERS = {
+    "avif": {"quality": 55, "speed": 6},
+    "webp": {"quality": 80, "method": 6},
+}
+
+
+def available_formats() -> tuple[str, ...]:
+    from PIL import features
+
+    return tuple(fmt for fmt in ENCODERS if features.check(fmt))
+
+
+def settings_digest(formats: tuple[str, ...]) -> str:
+    """Changes whenever a rerun would encode differently."""
+    settings = {"widths": WIDTHS, "encoders": {fmt: ENCODERS[fmt] for fmt in formats}}
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def referenced_images(site: SiteModel) -> set[str]:
+    """Root-relative URLs pages pass to `responsive-image.html`.
+
+    Literal `src="/..."` arguments in any page, plus the data the two data-driven
+    callers loop over: `lineage_images` in front matter (`lineage-gallery.html`)
+    and `_data/studio_routes.yml` images (`studio-route-card.html`).
+    """
+    urls: set[str] = set()
+    for rel in site.files:
+        if site.url_for(rel) is None:
+            continue
+        urls.update(match.group(2) for match in INCLUDE_RE.finditer(site.text(rel)))
+        for image in site.page(rel).data.get("lineage_images") or []:
+            if isinstance(image, dict) and image.get("src"):
+                urls.add(str(image["src"]))
+    if site.exists("_data/studio_routes.yml"):
+        urls.update(route.image for route in site_data.studio_routes(site.root) if route.image)
+    return urls
+
+
+def find_sources(root: Path = ROOT) -> list[str]:
+    """Repo-relative paths of the referenced JPG/PNG files that exist, sorted."""
+    site = SiteModel(root)
+    found = []
+    for url in referenced_images(site):
+        rel = url.split("?")[0].split("#")[0].lstrip("/")
+        if rel.lower().endswith(SOURCE_SUFFIXES) and site.is_file(rel):
+            found.append(rel)
+    return sorted(found)
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def ladder(width: int) -> list[int]:
+    """Rungs narrower than the original, plus the original width if it fits under the top rung."""
+    return [w for w in WIDTHS if w < width] + ([width] if width <= WIDTHS[-1] else [])
+
+
+def variant_path(rel: str, digest: str, width: int, fmt: str) -> str:
+    stem = Path(rel).with_suffix("")
+    return f"{OUTPUT_DIR.relative_to(ROOT).as_posix()}/{stem.as_posix()}-{width}.{digest[:10]}.{fmt}"
+
+
+def build_variants(rel: str, digest: str, formats: tuple[str, ...], root: Path = ROOT) -> dict:
+    """Encode every variant of one source and return its manifest entry."""
+    from PIL import Image, ImageOps
+
+    with Image.open(root / rel) as opened:
+        image = ImageOps.exif_transpose(opened)
+        image.load()
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+    width, height = image.size
+
+    variants: dict[str, list[dict]] = {fmt: [] for fmt in formats}
+    for target in ladder(width):
+        scaled = image if target == width else image.resize(
+            (target, max(1, round(height * target / width))), Image.LANCZOS
+        )
+        for fmt in formats:
+            out = variant_path(rel, digest, target, fmt)
+            buffer = io.BytesIO()
+            scaled.save(buffer, fmt.upper(), **ENCODERS[fmt])
+            path = root / out
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(buffer.getvalue())
+            variants[fmt].append(
+                {"src": "/" + out, "width": scaled.width, "height": scaled.height, "bytes": buffer.tell()}
+            )
+    return {
+        "sha256": digest,
+        "width": width,
+        "height": height,
+        "bytes": (root / rel).stat().st_size,
+        "variants": variants,
+        "srcset": {
+            fmt: ", ".join(f"{v['src']} {v['width']}w" for v in entries)
+            for fmt, entries in variants.items()
+        },
+    }
+
+
+def _build_one(job: tuple[str, str, tuple[str, ...], Path]) -> tuple[str, dict | None, str | None]:
+    rel, digest, formats, root = job
+    try:
+        return rel, build_variants(rel, digest, formats, root), None
+    except (OSError, ValueError) as exc:
+        # Placeholders (empty or not-yet-real files) stay as plain <img>.
+        return rel, None, str(exc)
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    return manifest if manifest.get("version") == MANIFEST_VERSION else {}
+
+
+def is_current(entry: dict | None, digest: str, root: Path = ROOT) -> bool:
+    if not entry or entry.get("sha256") != digest:
+        return False
+    return all(
+        (root / variant["src"].lstrip("/")).is_file()
+        for entries in entry["variants"].values()
+        for variant in entries
+    )
+
+
+def stale_sources(manifest: dict, root: Path = ROOT) -> list[str]:
+    """Source URLs the manifest doesn't cover as they are now, plus entries for deleted sources."""
+    images = manifest.get("images", {})
+    unreadable = manifest.get("unreadable", {})
+    sources = ["/" + rel for rel in find_sources(root)]
+    stale = []
+    for url in sources:
+        digest = _sha256(root / url.lstrip("/"))
+        if unreadable.get(url) != digest and not is_current(images.get(url), digest, root):
+            stale.append(url)
+    stale.extend(url for url in images if url not in sources)
+    return sorted(stale)
+
+
+def remove_stale(images: dict, root: Path = ROOT) -> int:
+    """Delete variant files no manifest entry points at; return how many."""
+    keep = {
+        variant["src"].lstrip("/")
+        for entry in images.values()
+        for entries in entry["variants"].values()
+        for variant in entries
+    }
+    removed = 0
+    output = root / OUTPUT_DIR.relative_to(ROOT)
+    if output.is_dir():
+        for path in output.rglob("*"):
+            if path.is_file() and path.relative_to(root).as_posix() not in keep:
+                path.unlink()
+                removed += 1
+    return removed
+
+
+def build(
+    formats: tuple[str, ...],
+    root: Path = ROOT,
+    workers: int | None = None,
+    force: bool = False,
+) -> tuple[dict, int, list[str], int]:
+    """Encode what changed under `root` and write its manifest.
+
+    Returns `(images, encoded, failed, removed)`: the manifest's entries, how
+    many sources were encoded, the sources that couldn't be read (left out of
+    the manifest, so the include renders them as plain `<img>`), and how many
+    stale variant files were deleted.
+    """
+    manifest_path = root / MANIFEST_PATH.relative_to(ROOT)
+    settings = settings_digest(formats)
+    previous = load_manifest(manifest_path)
+    old_images = previous.get("images", {}) if previous.get("settings") == settings else {}
+
+    images: dict[str, dict] = {}
+    jobs = []
+    for rel in find_sources(root):
+        digest = _sha256(root / rel)
+        key = "/" + rel
+        if not force and is_current(old_images.get(key), digest, root):
+            images[key] = old_images[key]
+        else:
+            jobs.append((rel, digest, formats, root))
+
+    if workers == 1 or len(jobs) <= 1:
+        results = [_build_one(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_build_one, jobs, chunksize=1))
+    digests = {rel: digest for rel, digest, _, _ in jobs}
+    failed = []
+    unreadable = {}
+    for rel, entry, error in results:
+        if entry is None:
+            failed.append(f"{rel}: {error}")
+            unreadable["/" + rel] = digests[rel]
+        else:
+            images["/" + rel] = entry
+
+    images = dict(sorted(images.items()))
+    removed = remove_stale(images, root)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "version": MANIFEST_VERSION,
+                "settings": settings,
+                "formats": list(formats),
+                "images": images,
+                "unreadable": dict(sorted(unreadable.items())),
+            },
+            indent=2,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    return images, len(jobs) - len(failed), failed, removed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=None, help="encoder processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true", help="re-encode every source even if unchanged")
+    parser.add_argument("--check", action="store_true", help="fail if any source changed since the last build")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        stale = stale_sources(load_manifest())
+        if stale:
+            print("Responsive variants are stale; run tools/build_images.py\n- " + "\n- ".join(stale))
+            return 1
+        print("Responsive variants are current")
+        return 0
+
+    formats = available_formats()
+    if not formats:
+        print("This Pillow can't write WebP or AVIF; nothing to build.")
+        return 1
+    images, encoded, failed, removed = build(formats, workers=args.workers, force=args.force)
+
+    original = sum(entry["bytes"] for entry in images.values())
+    largest = sum(
+        entries[-1]["bytes"] for entry in images.values() for entries in entry["variants"].values()
+    ) // max(1, len(formats))
+    print(
+        f"{len(images)} images ({', '.join(formats)}): encoded {encoded}, "
+        f"skipped {len(images) - encoded} unchanged, removed {removed} stale variants"
+    )
+    print(f"originals {original / 1e6:.1f} MB -> largest variants {largest / 1e6:.1f} MB per format")
+    if failed:
+        print("Unreadable sources (left as plain <img>):")
+        for line in failed:
+            print(" -", line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""Snapshot repo metadata for the proof-card status chips into one static file.
+
+Collects every GitHub `repo:` named by atlas node front matter and
+`_data/fleet.yml`, asks the API about all of them concurrently (the pooled
+keep-alive client in `http_client.py`, which `check_links.py` uses too), and
+writes `assets/repo-status.json`, so `js/status-hook.js` can read one static
+file instead of calling the API from every visitor's browser. The hook still
+calls the API until a first snapshot is committed; switch it over in the same
+change, looking repos up by `repo_slug`.
+
+Requests are conditional: the ETag from the last run lives in
+`.cache/repo-status.json`, so an unchanged repo costs a `304`, which GitHub
+doesn't count against the rate limit when the request is authenticated. Set
+`GITHUB_TOKEN` for the higher authenticated limit. `--api-base` points the job
+at another API root (GitHub Enterprise, or a local stub in tests).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+import site_data
+from http_client import ConnectionPool, request
+from site_model import ROOT, SiteModel
+
+API_BASE = "https://api.github.com"
+OUTPUT_PATH = ROOT / "assets/repo-status.json"
+CACHE_PATH = ROOT / ".cache/repo-status.json"
+MAX_CONCURRENCY = 16
+SNAPSHOT_VERSION = 1
+# Everything the status chip needs; the rest of the API response stays out of the page.
+FIELDS = ("html_url", "pushed_at", "updated_at", "archived")
+
+# A GitHub repo URL or bare `owner/name`; `.git` and a trailing slash are optional.
+# ASCII `\w` so a JS port of the pattern matches the same strings.
+REPO_RE = re.compile(r"^(?:https?://github\.com/)?([\w.-]+)/([\w.-]+?)(?:\.git)?/?$", re.I | re.A)
+
+
+def repo_slug(url: str) -> str | None:
+    """`owner/name` (lowercased, as the hook looks it up) for a GitHub repo URL or bare slug, else None."""
+    match = REPO_RE.match(str(url).strip())
+    return f"{match.group(1)}/{match.group(2)}".lower() if match else None
+
+
+def collect_repos(site: SiteModel) -> dict[str, list[str]]:
+    """Map each `owner/name` to the repo files that name it."""
+    sources: dict[str, list[str]] = defaultdict(list)
+    for rel in site.glob("_nodes"):
+        slug = repo_slug(site.page(rel).data.get("repo") or "")
+        if slug:
+            sources[slug].append(rel)
+    if site.exists("_data/fleet.yml"):
+        for group in site_data.fleet_groups(site.yaml("_data/fleet.yml")):
+            for item in group.items:
+                slug = repo_slug(item.repo or "")
+                if slug and "_data/fleet.yml" not in sources[slug]:
+                    sources[slug].append("_data/fleet.yml")
+    return dict(sorted(sources.items()))
+
+
+class RepoStatus:
+    """Conditional, concurrent fetches of `/repos/<owner>/<name>` with an ETag cache on disk."""
+
+    def __init__(
+        self,
+        api_base: str = API_BASE,
+        cache_path: Path | None = CACHE_PATH,
+        token: str | None = None,
+        concurrency: int = MAX_CONCURRENCY,
+    ) -> None:
+        self.api_base = api_base.rstrip("/")
+        self.cache_path = cache_path
+        self.token = token
+        self.concurrency = concurrency
+        self.cache: dict[str, dict] = self._load_cache()
+
+    def _load_cache(self) -> dict[str, dict]:
+        if self.cache_path is None:
+            return {}
+        try:
+            return json.loads(self.cache_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_cache(self) -> None:
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(json.dumps(self.cache, indent=2, sort_keys=True) + "\n")
+
+    async def _fetch(self, pool: ConnectionPool, gate: asyncio.Semaphore, slug: str) -> tuple[str, str]:
+        """Update `self.cache[slug]` and return `(slug, outcome)`: fetched, unchanged, or an error."""
+        cached = self.cache.get(slug)
+        headers = {"Accept": "application/vnd.github+json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        async with gate:
+            try:
+                status, response, body = await request(pool, "GET", f"{self.api_base}/repos/{slug}", headers)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as exc:
+                return slug, str(exc) or type(exc).__name__
+        if status == 304 and cached:
+            cached["checked"] = time.time()
+            return slug, "unchanged"
+        if status != 200:
+            return slug, f"HTTP {status}"
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return slug, "unreadable response"
+        self.cache[slug] = {
+            "etag": response.get("etag"),
+            "checked": time.time(),
+            "data": {field: data.get(field) for field in FIELDS},
+        }
+        return slug, "fetched"
+
+    async def refresh_async(self, slugs: list[str]) -> dict[str, str]:
+        pool = ConnectionPool()
+        gate = asyncio.Semaphore(self.concurrency)
+        try:
+            outcomes = await asyncio.gather(*(self._fetch(pool, gate, slug) for slug in slugs))
+        finally:
+            pool.close()
+        self._save_cache()
+        return dict(outcomes)
+
+    def refresh(self, slugs: list[str]) -> dict[str, str]:
+        return asyncio.run(self.refresh_async(slugs))
+
+    def snapshot(self, slugs: list[str], previous: dict[str, dict] | None = None) -> dict[str, dict]:
+        """What the hook gets: the last good data for every repo that has any.
+
+        `previous` (the committed snapshot's repos) fills in for repos this
+        run couldn't fetch and the cache doesn't know, so a failed run never
+        blanks out chips that were working.
+        """
+        previous = previous or {}
+        repos = {}
+        for slug in slugs:
+            if slug in self.cache:
+                repos[slug] = self.cache[slug]["data"]
+            elif slug in previous:
+                repos[slug] = previous[slug]
+        return repos
+
+
+def load_snapshot(path: Path = OUTPUT_PATH) -> dict:
+    try:
+        snapshot = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    return snapshot if snapshot.get("version") == SNAPSHOT_VERSION else {}
+
+
+def write_snapshot(repos: dict[str, dict], path: Path = OUTPUT_PATH) -> bool:
+    """Write the snapshot unless the repo data is unchanged; return whether it was written."""
+    if load_snapshot(path).get("repos") == repos:
+        return False
+    generated = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    snapshot = {"version": SNAPSHOT_VERSION, "generated": generated, "repos": repos}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(snapshot, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return True
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--api-base", default=API_BASE, help="API root to query (e.g. a local stub)")
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH, help="where to write the snapshot")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and don't write .cache/repo-status.json")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY, help="requests in flight at once")
+    args = parser.parse_args(argv)
+
+    repos = collect_repos(SiteModel())
+    status = RepoStatus(
+        api_base=args.api_base,
+        cache_path=None if args.no_cache else CACHE_PATH,
+        token=os.environ.get("GITHUB_TOKEN"),
+        concurrency=args.concurrency,
+    )
+    started = time.perf_counter()
+    outcomes = status.refresh(list(repos))
+    elapsed = time.perf_counter() - started
+    previous = load_snapshot(args.output).get("repos")
+    written = write_snapshot(status.snapshot(list(repos), previous), args.output)
+
+    counts = defaultdict(int)
+    for outcome in outcomes.values():
+        counts[outcome if outcome in ("fetched", "unchanged") else "failed"] += 1
+    print(
+        f"{len(repos)} repos in {elapsed:.1f}s: {counts['fetched']} fetched, "
+        f"{counts['unchanged']} unchanged, {counts['failed']} failed; "
+        f"snapshot {'written' if written else 'unchanged'}"
+    )
+    failed = {slug: outcome for slug, outcome in outcomes.items() if outcome not in ("fetched", "unchanged")}
+    if failed:
+        print("Failed (previous data kept where there was any):")
+        for slug, outcome in failed.items():
+            print(f" - {slug} ({outcome}) <- {', '.join(repos[slug])}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,20 +2,40 @@
 """Generate the Critical Digital Studies sampler PDF from the data source."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import argparse
+import ast
+import gc
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 import cairosvg
-import yaml
+from PIL import Image as PILImage
+from PIL import ImageOps
+from reportlab import rl_config
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.platypus import (Image, ListFlowable, PageBreak, Paragraph,
                                 SimpleDocTemplate, Spacer)
 
+import build_asset_manifest
+import front_matter
+import instrument
+import site_data
+
+# Embed image streams as raw binary rather than ASCII85: a fifth smaller on disk,
+# and ReportLab holds every stream in memory until the document is saved.
+rl_config.useA85 = 0
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA_PATH = ROOT / "_data/cds.yml"
@@ -24,6 +44,35 @@ PAGE_PATH = ROOT / "critical-digital-studies-sampler/index.md"
 OUTPUT_PATH = ROOT / "assets/docs/Severns_CriticalDigitalStudies.pdf"
 MAX_IMG_WIDTH = 6.5 * inch
 MAX_IMG_HEIGHT = 3.9 * inch
+SVG_RENDER_WIDTH = 1600
+CACHE_DIR = ROOT / ".cache/sampler-raster"
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+MANIFEST_PATH = ROOT / ".cache/sampler-build.json"
+# Keeps the download friendly on slow connections; `--max-pdf-mb` moves it.
+MAX_PDF_BYTES = 8 * 1024 * 1024
+# Heroes prepared per batch while the PDF is laid out; `--batch-cards` moves it.
+BATCH_CARDS = 16
+CONFIG_PATH = ROOT / "_config.yml"
+CATALOG_INDEX_PATH = ROOT / "catalog/index.json"
+# Where `--per-card`, `--legacy`, and `--catalog` write; `--press-kit-dir` moves it.
+PRESS_KIT_DIR = ROOT / "assets/docs/press-kit"
+
+
+@dataclass(frozen=True)
+class HeroSettings:
+    """How hero images are resampled before embedding."""
+
+    dpi: int = 150
+    jpeg_quality: int = 82
+
+
+@dataclass
+class PreparedHero:
+    """Embed-ready JPEG bytes plus the box (in points) they are drawn into."""
+
+    data: bytes
+    width: float
+    height: float
 
 
 @dataclass
@@ -39,24 +88,55 @@ class Card:
     outcomes: list[str]
     teach: dict
     links: list[dict]
+    tags_label: str = "Alignment"
+    # Every image `img_src` was picked from, so adding one can trigger a rebuild.
+    img_candidates: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class Cover:
+    """Opening page of a multi-card document."""
+
+    title: str
+    subtitle: str
+    note: str
+    show_stamp: bool = False
+
+
+SAMPLER_COVER = Cover(
+    "Critical Digital Studies — Sampler",
+    "Practice-based glimpses of how pedagogy, ethics, and tooling intertwine.",
+    "Each subsequent page is a card: hero image, methods, outcomes, and the teach-with-this kit so a"
+    " future instructor can reproduce the work without guessing.",
+    show_stamp=True,
+)
+LEGACY_COVER = Cover(
+    "Legacy Works",
+    "The earlier 2D and 3D work the current practice grew out of.",
+    "Each subsequent page is one work: a thumbnail, what it was, and where its archive page lives.",
+)
+CATALOG_COVER = Cover(
+    "Catalog",
+    "Every catalogued work, in the order the site lists them.",
+    "Each subsequent page is one item: themes, the ethics notes it was made under, and where to read more.",
+)
 
 
 def load_cards() -> list[Card]:
     """Load cards from `_data/cds.yml` and normalize defaults."""
-    raw = yaml.safe_load(DATA_PATH.read_text())
     cards: list[Card] = []
-    for entry in raw.get("cards", []):
+    for entry in site_data.cds_cards(ROOT):
         cards.append(
             Card(
-                id=entry.get("id", ""),
-                title=entry.get("title", ""),
-                img_src=entry.get("img_src"),
-                abstract=entry.get("abstract"),
-                aligns=entry.get("aligns", []) or [],
-                methods=entry.get("methods", []) or [],
-                outcomes=entry.get("outcomes", []) or [],
-                teach=entry.get("teach", {}) or {},
-                links=entry.get("links", []) or [],
+                id=entry.id,
+                title=entry.title,
+                img_src=entry.img_src,
+                abstract=entry.abstract,
+                aligns=entry.aligns,
+                methods=entry.methods,
+                outcomes=entry.outcomes,
+                teach=entry.teach,
+                links=entry.links,
             )
         )
     if not cards:
@@ -64,19 +144,93 @@ def load_cards() -> list[Card]:
     return cards
 
 
+def site_url() -> str:
+    config = site_data.load(CONFIG_PATH) or {}
+    return (config.get("url") or "").rstrip("/") + (config.get("baseurl") or "").rstrip("/")
+
+
+def _absolute(url: str, base: str) -> str:
+    return url if url.startswith(("http://", "https://")) else base + "/" + url.lstrip("/")
+
+
+def _local_images(*candidates: str | None) -> list[str]:
+    return [src for src in candidates if src and not src.startswith(("http://", "https://"))]
+
+
+def _present_image(*candidates: str | None) -> str | None:
+    """First candidate that is a real (non-empty) file; placeholders don't count."""
+    for src in candidates:
+        if src and not src.startswith(("http://", "https://")):
+            path = ROOT / src.lstrip("/")
+            if path.is_file() and path.stat().st_size:
+                return src
+    return None
+
+
+def load_legacy_cards() -> list[Card]:
+    """One card per entry in `_data/legacy_works.yml`."""
+    base = site_url()
+    return [
+        Card(
+            id=work.id,
+            title=work.title,
+            img_src=_present_image(work.thumbnail, *work.images),
+            img_candidates=_local_images(work.thumbnail, *work.images),
+            abstract=work.summary,
+            aligns=[value for value in (work.medium, work.branch, work.status) if value],
+            methods=[],
+            outcomes=[],
+            teach={},
+            links=[{"label": "Archive page", "url": _absolute(work.archive_url, base)}] if work.archive_url else [],
+            tags_label="Work",
+        )
+        for work in site_data.legacy_works(ROOT)
+    ]
+
+
+def load_catalog_cards() -> list[Card]:
+    """One card per item in the compiled `catalog/index.json`."""
+    base = site_url()
+    index = json.loads(CATALOG_INDEX_PATH.read_text(encoding="utf-8"))
+    cards = []
+    for item_id in index["order"]:
+        item = index["items"][item_id]
+        years = str(item["year_start"])
+        if item.get("year_end") and item["year_end"] != item["year_start"]:
+            years += f"–{item['year_end']}"
+        if item.get("circa"):
+            years = "c. " + years
+        images = item.get("media", {}).get("images") or []
+        cards.append(
+            Card(
+                id=item_id,
+                title=item["title"],
+                img_src=_present_image(*images),
+                img_candidates=_local_images(*images),
+                abstract=item.get("summary"),
+                aligns=[years, *item.get("themes", [])],
+                methods=[f"{key.capitalize()}: {value}" for key, value in item.get("ethics", {}).items()],
+                outcomes=[],
+                teach={},
+                links=[
+                    {"label": label.capitalize(), "url": _absolute(url, base)}
+                    for label, url in (item.get("docs") or {}).items()
+                    if isinstance(url, str)
+                ],
+                tags_label="Themes",
+            )
+        )
+    return cards
+
+
+def read_front_matter() -> str:
+    """Return the raw front matter block of the sampler page (empty if none)."""
+    return front_matter.load(PAGE_PATH).raw or ""
+
+
 def load_updated_stamp() -> str:
     """Grab the `updated` value from the sampler page front matter."""
-    text = PAGE_PATH.read_text()
-    if not text.startswith("---"):
-        return ""
-    lines = text.splitlines()[1:]
-    front_matter: list[str] = []
-    for line in lines:
-        if line.strip() == "---":
-            break
-        front_matter.append(line)
-    meta = yaml.safe_load("\n".join(front_matter))
-    stamp = meta.get("updated") if isinstance(meta, dict) else None
+    stamp = front_matter.load(PAGE_PATH).data.get("updated")
     if isinstance(stamp, str):
         try:
             clean = stamp.strip("\"")
@@ -86,13 +240,71 @@ def load_updated_stamp() -> str:
     return ""
 
 
-def svg_to_png_bytes(path: Path) -> bytes:
-    """Render an SVG asset to PNG bytes using CairoSVG."""
-    return cairosvg.svg2png(url=path.as_uri(), output_width=1600)
+class RasterCache:
+    """On-disk PNG cache keyed by SVG content hash and render width.
+
+    Entries are plain files; a hit bumps the file's mtime so eviction can drop
+    the least recently used renders once the directory grows past `max_bytes`.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = CACHE_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(svg_bytes: bytes, width: int) -> str:
+        digest = hashlib.sha256(svg_bytes)
+        digest.update(f":{width}:{cairosvg.__version__}".encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        path = self.directory / f"{key}.png"
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.png"
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+        self.evict()
+
+    def evict(self) -> None:
+        entries = [(p.stat(), p) for p in self.directory.glob("*.png")]
+        total = sum(st.st_size for st, _ in entries)
+        for st, path in sorted(entries, key=lambda item: item[0].st_mtime):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+
+
+# Swapped for None by `--no-cache`; everything else goes through the cache.
+raster_cache: RasterCache | None = RasterCache(CACHE_DIR)
+# Swapped for an enabled Profiler by `--profile`; a no-op otherwise.
+profiler: instrument.Profiler = instrument.DISABLED
+
+
+def svg_to_png_bytes(path: Path, width: int = SVG_RENDER_WIDTH) -> bytes:
+    """Render an SVG asset to PNG bytes using CairoSVG, reusing cached renders."""
+    if raster_cache is None:
+        return cairosvg.svg2png(url=path.as_uri(), output_width=width)
+    key = raster_cache.key(path.read_bytes(), width)
+    cached = raster_cache.get(key)
+    if cached is not None:
+        return cached
+    png = cairosvg.svg2png(url=path.as_uri(), output_width=width)
+    raster_cache.put(key, png)
+    return png
 
 
-def load_image(card: Card) -> Image | None:
-    """Return a scaled ReportLab Image for the card hero."""
+def hero_bytes(card: Card) -> bytes | None:
+    """Read (or rasterize) the card hero into embeddable image bytes."""
     if not card.img_src:
         return None
     asset_path = ROOT / card.img_src.lstrip("/")
@@ -100,16 +312,134 @@ def load_image(card: Card) -> Image | None:
         raise FileNotFoundError(f"Image not found for card {card.id}: {asset_path}")
 
     if asset_path.suffix.lower() == ".svg":
-        image_bytes = svg_to_png_bytes(asset_path)
-    else:
-        image_bytes = asset_path.read_bytes()
+        return svg_to_png_bytes(asset_path)
+    return asset_path.read_bytes()
 
-    stream = BytesIO(image_bytes)
+
+def downsample(image_bytes: bytes, settings: HeroSettings) -> PreparedHero:
+    """Decode once, resample to the displayed box at `settings.dpi`, re-encode as JPEG.
+
+    The display box mirrors ReportLab's `_restrictSize`: pixels count as points
+    and images only ever shrink to fit MAX_IMG_WIDTH x MAX_IMG_HEIGHT.
+    """
+    with PILImage.open(BytesIO(image_bytes)) as source:
+        img = ImageOps.exif_transpose(source)
+        px_w, px_h = img.size
+        scale = min(1.0, MAX_IMG_WIDTH / px_w, MAX_IMG_HEIGHT / px_h)
+        width, height = px_w * scale, px_h * scale
+        target = (
+            max(1, round(width / inch * settings.dpi)),
+            max(1, round(height / inch * settings.dpi)),
+        )
+        if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+            # JPEG has no alpha; the page is white, so flatten onto white.
+            rgba = img.convert("RGBA")
+            img = PILImage.new("RGB", rgba.size, "white")
+            img.paste(rgba, mask=rgba.getchannel("A"))
+        else:
+            img = img.convert("RGB")
+        if target[0] < px_w:
+            img = img.resize(target, PILImage.LANCZOS)
+        out = BytesIO()
+        img.save(out, format="JPEG", quality=settings.jpeg_quality, optimize=True)
+    return PreparedHero(out.getvalue(), width, height)
+
+
+def hero_image(hero: PreparedHero) -> Image:
+    """Wrap a prepared hero in a ReportLab Image sized to its display box."""
+    stream = BytesIO(hero.data)
     stream.seek(0)
-    hero = Image(stream)
-    hero._restrictSize(MAX_IMG_WIDTH, MAX_IMG_HEIGHT)
-    hero.hAlign = "CENTER"
-    return hero
+    image = Image(stream, width=hero.width, height=hero.height)
+    image.hAlign = "CENTER"
+    return image
+
+
+def _prepare_hero_timed(
+    card: Card, settings: HeroSettings = HeroSettings()
+) -> tuple[PreparedHero | None, dict[str, float]]:
+    """Read the card hero and resample it, timing each step wherever it ran."""
+    timings: dict[str, float] = {}
+    started = time.perf_counter()
+    image_bytes = hero_bytes(card)
+    if image_bytes is None:
+        return None, timings
+    step = "rasterize svg" if card.img_src.lower().endswith(".svg") else "read image"
+    timings[step] = time.perf_counter() - started
+    started = time.perf_counter()
+    hero = downsample(image_bytes, settings)
+    timings["resample"] = time.perf_counter() - started
+    return hero, timings
+
+
+def _init_hero_worker(use_cache: bool) -> None:
+    # Spawned workers re-import this module, so `--no-cache` has to be replayed.
+    global raster_cache
+    if not use_cache:
+        raster_cache = None
+
+
+def iter_heroes(
+    cards: list[Card],
+    workers: int | None = None,
+    settings: HeroSettings = HeroSettings(),
+    batch_cards: int = 0,
+) -> Iterator[PreparedHero | None]:
+    """Yield each card's prepared hero in card order, `batch_cards` cards at a time.
+
+    One process pool serves every batch; only the batch in flight is held in
+    memory, so the caller can lay out and drop each hero before the next
+    batch is prepared. `batch_cards=0` prepares everything in one go and
+    `workers=1` skips the pool entirely. Per-card step timings go to `profiler`.
+    """
+    prepare = partial(_prepare_hero_timed, settings=settings)
+    pending = [card for card in cards if card.img_src]
+    pool = None
+    if workers != 1 and len(pending) > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_hero_worker,
+            initargs=(raster_cache is not None,),
+        )
+    step = batch_cards or len(cards) or 1
+    try:
+        for start in range(0, len(cards), step):
+            batch = cards[start:start + step]
+            results = pool.map(prepare, batch) if pool else map(prepare, batch)
+            for card, (hero, timings) in zip(batch, results):
+                for name, seconds in timings.items():
+                    profiler.add(name, seconds, item=card.id)
+                yield hero
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+class FlowableStream(list):
+    """A flowable list that refills itself from `batches` as `doc.build` consumes it.
+
+    ReportLab's build loop only ever looks at the front of the list (and
+    deletes what it has laid out), so feeding it one card at a time keeps
+    just the current card's flowables, and its hero, alive.
+    """
+
+    def __init__(self, batches: Iterator[list]) -> None:
+        super().__init__()
+        self._batches = batches
+
+    def _refill(self) -> None:
+        while not super().__len__():
+            batch = next(self._batches, None)
+            if batch is None:
+                return
+            self.extend(batch)
+
+    def __len__(self) -> int:
+        self._refill()
+        return super().__len__()
+
+    def __getitem__(self, index):
+        self._refill()
+        return super().__getitem__(index)
 
 
 def bullet_list(items: Iterable[str], style: ParagraphStyle) -> ListFlowable:
@@ -172,15 +502,8 @@ def link_list(card: Card, style: ParagraphStyle) -> ListFlowable | None:
     )
 
 
-def build_pdf(cards: list[Card]) -> None:
-    doc = SimpleDocTemplate(
-        str(OUTPUT_PATH),
-        pagesize=letter,
-        leftMargin=0.75 * inch,
-        rightMargin=0.75 * inch,
-        topMargin=0.8 * inch,
-        bottomMargin=0.8 * inch,
-    )
+def build_styles() -> dict[str, ParagraphStyle]:
+    """Paragraph styles for the sampler, built once per run."""
     styles = getSampleStyleSheet()
     body = ParagraphStyle("Body", parent=styles["BodyText"], fontSize=10.5, leading=14)
     tags = ParagraphStyle(
@@ -225,17 +548,22 @@ def build_pdf(cards: list[Card]) -> None:
         alignment=1,
         spaceBefore=12,
     )
+    return {
+        "body": body,
+        "tags": tags,
+        "heading": heading,
+        "title": title,
+        "intro": intro,
+        "intro_body": intro_body,
+    }
+
 
+def cover_flowables(styles: dict[str, ParagraphStyle], cover: Cover, updated_stamp: str = "") -> list:
+    body = styles["body"]
     elements: list = []
-    updated_stamp = load_updated_stamp()
-    elements.append(Paragraph("Critical Digital Studies — Sampler", intro))
-    elements.append(
-        Paragraph(
-            "Practice-based glimpses of how pedagogy, ethics, and tooling intertwine.",
-            intro_body,
-        )
-    )
-    if updated_stamp:
+    elements.append(Paragraph(cover.title, styles["intro"]))
+    elements.append(Paragraph(cover.subtitle, styles["intro_body"]))
+    if cover.show_stamp and updated_stamp:
         elements.append(
             Paragraph(
                 f"<font size=10>Unlisted page · Updated {updated_stamp}</font>",
@@ -245,8 +573,7 @@ def build_pdf(cards: list[Card]) -> None:
     elements.append(Spacer(1, 1.2 * inch))
     elements.append(
         Paragraph(
-            "Each subsequent page is a card: hero image, methods, outcomes, and the teach-with-this kit so a"
-            " future instructor can reproduce the work without guessing.",
+            cover.note,
             ParagraphStyle(
                 "CoverNote",
                 parent=body,
@@ -257,41 +584,601 @@ def build_pdf(cards: list[Card]) -> None:
         )
     )
     elements.append(PageBreak())
+    return elements
+
+
+def card_flowables(card: Card, hero: PreparedHero | None, styles: dict[str, ParagraphStyle]) -> list:
+    body, heading = styles["body"], styles["heading"]
+    elements: list = [Paragraph(card.title, styles["title"])]
+    if card.aligns:
+        elements.append(Paragraph(f"{card.tags_label}: " + " · ".join(card.aligns), styles["tags"]))
+    if hero is not None:
+        elements.append(hero_image(hero))
+        elements.append(Spacer(1, 0.25 * inch))
+    if card.abstract:
+        elements.append(Paragraph(card.abstract, body))
+    if card.methods:
+        elements.append(Paragraph("Methods & Ethics", heading))
+        elements.append(bullet_list(card.methods, body))
+    if card.outcomes:
+        elements.append(Paragraph("Outcomes", heading))
+        elements.append(bullet_list(card.outcomes, body))
+    teach = teach_blocks(card, body)
+    if teach:
+        elements.append(Paragraph("Teach with this", heading))
+        elements.append(teach)
+    links = link_list(card, body)
+    if links:
+        elements.append(Paragraph("Links", heading))
+        elements.append(links)
+    return elements
+
+
+def write_document(
+    path: Path,
+    cards: list[Card],
+    heroes: Iterator[PreparedHero | None],
+    styles: dict[str, ParagraphStyle],
+    cover: Cover | None = None,
+    updated_stamp: str = "",
+    collect_every: int = BATCH_CARDS,
+) -> int:
+    """Lay `cards` out into `path`, one page each, and return the file size.
+
+    `heroes` yields one prepared hero per card, in order. Each card's
+    flowables are created only when ReportLab reaches them, so memory tracks
+    the card being laid out plus the PDF ReportLab is assembling.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    doc = SimpleDocTemplate(
+        str(path),
+        pagesize=letter,
+        leftMargin=0.75 * inch,
+        rightMargin=0.75 * inch,
+        topMargin=0.8 * inch,
+        bottomMargin=0.8 * inch,
+    )
+
+    def batches() -> Iterator[list]:
+        if cover is not None:
+            yield cover_flowables(styles, cover, updated_stamp)
+        for index, card in enumerate(cards):
+            if collect_every and index and index % collect_every == 0:
+                # Laid-out images sit in reference cycles (flowable <-> canvas
+                # bookkeeping) that the cyclic GC only reaches after enough
+                # allocations, not enough bytes; free them per batch.
+                gc.collect()
+            with profiler.phase("prepare heroes"):
+                hero = next(heroes)
+            with profiler.phase("flowables", item=card.id):
+                elements = card_flowables(card, hero, styles)
+            if index < len(cards) - 1:
+                elements.append(PageBreak())
+            yield elements
 
-    for index, card in enumerate(cards):
-        elements.append(Paragraph(card.title, title))
-        if card.aligns:
-            elements.append(Paragraph("Alignment: " + " · ".join(card.aligns), tags))
-        hero = load_image(card)
-        if hero:
-            elements.append(hero)
-            elements.append(Spacer(1, 0.25 * inch))
-        if card.abstract:
-            elements.append(Paragraph(card.abstract, body))
-        if card.methods:
-            elements.append(Paragraph("Methods & Ethics", heading))
-            elements.append(bullet_list(card.methods, body))
-        if card.outcomes:
-            elements.append(Paragraph("Outcomes", heading))
-            elements.append(bullet_list(card.outcomes, body))
-        teach = teach_blocks(card, body)
-        if teach:
-            elements.append(Paragraph("Teach with this", heading))
-            elements.append(teach)
-        links = link_list(card, body)
-        if links:
-            elements.append(Paragraph("Links", heading))
-            elements.append(links)
-        if index < len(cards) - 1:
-            elements.append(PageBreak())
-
-    doc.build(elements)
-    print(f"Wrote sampler PDF to {OUTPUT_PATH.relative_to(ROOT)}")
-
-
-def main() -> None:
-    cards = load_cards()
-    build_pdf(cards)
+    with profiler.phase("doc.build"):
+        doc.build(FlowableStream(batches()))
+    return path.stat().st_size
+
+
+def check_budget(size: int, max_bytes: int | None) -> None:
+    """Fail the build when the sampler PDF came out over `max_bytes`."""
+    if max_bytes is not None and size > max_bytes:
+        raise SystemExit(
+            f"Sampler PDF is {size / 1024 / 1024:.1f} MB, over the {max_bytes / 1024 / 1024:.1f} MB"
+            " budget; lower --dpi/--jpeg-quality or shrink the heroes."
+        )
+
+
+def staging_path(path: Path) -> Path:
+    """Where `path` is written before it's known to fit the budget."""
+    return path.with_suffix(f".{os.getpid()}.tmp")
+
+
+def report_sampler(size: int) -> None:
+    print(f"Wrote sampler PDF to {OUTPUT_PATH.relative_to(ROOT)} ({size / 1024:.0f} KB)")
+
+
+def build_pdf(
+    cards: list[Card],
+    workers: int | None = None,
+    settings: HeroSettings = HeroSettings(),
+    max_bytes: int | None = MAX_PDF_BYTES,
+    batch_cards: int = BATCH_CARDS,
+) -> None:
+    """Lay the sampler out card by card.
+
+    Heroes are prepared `batch_cards` at a time as layout reaches them, so
+    memory tracks one batch rather than the whole card set. `batch_cards=0`
+    prepares every hero before layout starts.
+    """
+    with profiler.phase("front matter"):
+        updated_stamp = load_updated_stamp()
+    # Written aside and moved into place only once it fits, so an over-budget
+    # (or interrupted) build leaves the previous sampler untouched.
+    staged = staging_path(OUTPUT_PATH)
+    try:
+        size = write_document(
+            staged,
+            cards,
+            iter_heroes(cards, workers, settings, batch_cards),
+            build_styles(),
+            SAMPLER_COVER,
+            updated_stamp,
+            batch_cards,
+        )
+        check_budget(size, max_bytes)
+        staged.replace(OUTPUT_PATH)
+    finally:
+        staged.unlink(missing_ok=True)
+    report_sampler(size)
+
+
+@dataclass
+class DocumentSet:
+    """Cards exported together: an all-cards PDF and/or one PDF per card."""
+
+    name: str
+    cover: Cover
+    cards: list[Card]
+    combined: Path | None
+    per_card_dir: Path | None
+
+
+# Set by `_init_export_worker`: the sets, where each prepared hero was spilled, styles, and cover stamp.
+_export: dict = {}
+
+
+def spill_heroes(
+    cards: list[Card],
+    directory: Path,
+    workers: int | None = None,
+    settings: HeroSettings = HeroSettings(),
+    batch_cards: int = BATCH_CARDS,
+) -> dict[str, tuple[str, float, float]]:
+    """Prepare each card's hero and write it to `directory` as soon as it's ready.
+
+    Returns `img_src -> (file, width, height)`: small enough to hand to every
+    render process, which reads back only the heroes its own document shows.
+    """
+    spilled = {}
+    for index, (card, hero) in enumerate(zip(cards, iter_heroes(cards, workers, settings, batch_cards))):
+        if hero is None:
+            continue
+        path = directory / f"{index}.jpg"
+        path.write_bytes(hero.data)
+        spilled[card.img_src] = (str(path), hero.width, hero.height)
+    return spilled
+
+
+def _load_spilled(entry: tuple[str, float, float] | None) -> PreparedHero | None:
+    if entry is None:
+        return None
+    path, width, height = entry
+    return PreparedHero(Path(path).read_bytes(), width, height)
+
+
+def _init_export_worker(sets: list[DocumentSet], heroes: dict, updated_stamp: str) -> None:
+    _export.update(
+        sets={document_set.name: document_set for document_set in sets},
+        heroes=heroes,
+        styles=build_styles(),
+        stamp=updated_stamp,
+    )
+
+
+def _render_job(job: tuple[str, str | None, Path]) -> tuple[Path, int, float]:
+    name, card_id, path = job
+    document_set = _export["sets"][name]
+    cards = [card for card in document_set.cards if card_id is None or card.id == card_id]
+    heroes = (_load_spilled(_export["heroes"].get(card.img_src)) for card in cards)
+    started = time.perf_counter()
+    size = write_document(
+        path,
+        cards,
+        heroes,
+        _export["styles"],
+        document_set.cover if card_id is None else None,
+        _export["stamp"],
+    )
+    return path, size, time.perf_counter() - started
+
+
+def check_card_ids(document_set: DocumentSet) -> None:
+    """Refuse per-card exports whose file names would be empty or collide."""
+    seen: set[str] = set()
+    for number, card in enumerate(document_set.cards, 1):
+        card_id = "" if card.id is None else str(card.id)
+        if not card_id.strip() or card_id.startswith(".") or "/" in card_id or "\\" in card_id:
+            raise SystemExit(
+                f"{document_set.name} entry {number} ({card.title!r}) has id {card.id!r},"
+                " which can't name its per-card PDF; give it a plain, non-empty id."
+            )
+        if card_id in seen:
+            raise SystemExit(
+                f"{document_set.name} has two entries with id {card_id!r}; their per-card PDFs would"
+                " overwrite each other."
+            )
+        seen.add(card_id)
+
+
+def export_documents(
+    sets: list[DocumentSet],
+    workers: int | None = None,
+    settings: HeroSettings = HeroSettings(),
+    batch_cards: int = BATCH_CARDS,
+) -> list[tuple[Path, int]]:
+    """Render every document in `sets` from one load of the data and one pass over the images.
+
+    Each distinct hero is prepared once, however many documents show it, and
+    spilled to a scratch directory; render workers get only the file index
+    and read a hero back when their document reaches it, so no process holds
+    the whole set. The documents are independent, so they render
+    concurrently across `workers` processes.
+    """
+    unique: dict[str, Card] = {}
+    for document_set in sets:
+        for card in document_set.cards:
+            if card.img_src:
+                unique.setdefault(card.img_src, card)
+    with profiler.phase("front matter"):
+        updated_stamp = load_updated_stamp()
+
+    jobs: list[tuple[str, str | None, Path]] = []
+    for document_set in sets:
+        if document_set.combined is not None:
+            jobs.append((document_set.name, None, document_set.combined))
+        if document_set.per_card_dir is not None:
+            jobs.extend(
+                (document_set.name, card.id, document_set.per_card_dir / f"{card.id}.pdf")
+                for card in document_set.cards
+            )
+
+    with tempfile.TemporaryDirectory(prefix="sampler-heroes-") as scratch:
+        with profiler.phase("prepare heroes"):
+            heroes = spill_heroes(list(unique.values()), Path(scratch), workers, settings, batch_cards)
+        with profiler.phase("render"):
+            if workers == 1 or len(jobs) <= 1:
+                _init_export_worker(sets, heroes, updated_stamp)
+                results = [_render_job(job) for job in jobs]
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_export_worker,
+                    initargs=(sets, heroes, updated_stamp),
+                ) as pool:
+                    results = list(pool.map(_render_job, jobs))
+    for path, _, seconds in results:
+        profiler.add("documents", seconds, item=_label(path))
+    return [(path, size) for path, size, _ in results]
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _settings_digest(settings: HeroSettings) -> str:
+    return _sha256(json.dumps(asdict(settings), sort_keys=True).encode())
+
+
+def local_modules(entry: Path = Path(__file__)) -> list[Path]:
+    """`entry` plus every sibling module it imports, directly or through another sibling.
+
+    Read from the source rather than `sys.modules`, so the answer doesn't
+    depend on what else the current process happened to import.
+    """
+    found = {entry}
+    pending = [entry]
+    while pending:
+        tree = ast.parse(pending.pop().read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                path = entry.parent / f"{name.split('.')[0]}.py"
+                if path.is_file() and path not in found:
+                    found.add(path)
+                    pending.append(path)
+    return sorted(found)
+
+
+def _tool_digest() -> str:
+    digest = hashlib.sha256()
+    for path in local_modules():
+        digest.update(f"{path.name}\0".encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _label(path: Path) -> str:
+    """Repo-relative name for `path`, or the absolute path when it lives elsewhere."""
+    return path.relative_to(ROOT).as_posix() if path.is_relative_to(ROOT) else str(path)
+
+
+def fingerprint_inputs(
+    cards: list[Card], settings: HeroSettings, data_paths: Iterable[Path] = (DATA_PATH,)
+) -> dict[str, str | None]:
+    """Hash everything that can change the PDFs, keyed by a readable input name.
+
+    Images a card could have picked but didn't (missing or empty) are recorded
+    too, as None or the empty file's hash, so filling one in triggers a rebuild.
+    """
+    inputs: dict[str, str | None] = {
+        # This file and the helpers it imports (front_matter, site_data, ...).
+        "tool": _tool_digest(),
+        "image settings": _settings_digest(settings),
+        f"{PAGE_PATH.relative_to(ROOT)} (front matter)": _sha256(read_front_matter().encode()),
+    }
+    for path in data_paths:
+        inputs[_label(path)] = _sha256(path.read_bytes())
+    for card in cards:
+        for src in card.img_candidates or ([card.img_src] if card.img_src else []):
+            asset_path = ROOT / src.lstrip("/")
+            inputs[src.lstrip("/")] = _sha256(asset_path.read_bytes()) if asset_path.exists() else None
+    return inputs
+
+
+def stale_input(manifest: dict, settings: HeroSettings, exports: str = "") -> str | None:
+    """Describe the first input that differs from the last build, or None if nothing did.
+
+    `exports` names the press-kit documents asked for (see `describe_exports`);
+    a build that wrote a different set doesn't count. Only the recorded inputs
+    are re-hashed, so an unchanged tree never has to parse the data files; if
+    one changed, the hero set may have too and we rebuild anyway.
+    """
+    if not OUTPUT_PATH.exists():
+        return f"{OUTPUT_PATH.relative_to(ROOT)} is missing"
+    recorded = manifest.get("inputs") or {}
+    outputs = manifest.get("outputs") or {}
+    if not recorded or not outputs:
+        return "no previous build manifest"
+    if manifest.get("exports", "") != exports:
+        return "the last build wrote a different set of documents"
+    for name in outputs:
+        if not (ROOT / name).exists():
+            return f"{name} is missing"
+    page_key = f"{PAGE_PATH.relative_to(ROOT)} (front matter)"
+    for name, digest in recorded.items():
+        if name == "tool":
+            current = _tool_digest()
+        elif name == "image settings":
+            current = _settings_digest(settings)
+        elif name == page_key:
+            current = _sha256(read_front_matter().encode())
+        else:
+            path = ROOT / name
+            current = _sha256(path.read_bytes()) if path.exists() else None
+        if current != digest:
+            return f"{name} changed"
+    for name, digest in outputs.items():
+        if _sha256((ROOT / name).read_bytes()) != digest:
+            return f"{name} was edited since the last build"
+    return None
+
+
+def load_manifest() -> dict:
+    try:
+        return json.loads(MANIFEST_PATH.read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def write_manifest(
+    cards: list[Card],
+    settings: HeroSettings,
+    outputs: Iterable[Path] = (OUTPUT_PATH,),
+    data_paths: Iterable[Path] = (DATA_PATH,),
+    exports: str = "",
+) -> None:
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "inputs": fingerprint_inputs(cards, settings, data_paths),
+        "outputs": {_label(path): _sha256(path.read_bytes()) for path in outputs},
+        "exports": exports,
+    }
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+
+
+def main(argv: list[str] | None = None) -> None:
+    global raster_cache, profiler
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="rasterize every SVG hero fresh instead of using .cache/sampler-raster",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="processes used to prepare hero images (default: CPU count; 1 = serial)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="rebuild even if no input changed since the last build",
+    )
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=HeroSettings.dpi,
+        help=f"resolution heroes are resampled to for their printed box (default: {HeroSettings.dpi})",
+    )
+    parser.add_argument(
+        "--jpeg-quality",
+        type=int,
+        default=HeroSettings.jpeg_quality,
+        help=f"JPEG quality for embedded heroes, 1-95 (default: {HeroSettings.jpeg_quality})",
+    )
+    parser.add_argument(
+        "--max-pdf-mb",
+        type=float,
+        default=MAX_PDF_BYTES / 1024 / 1024,
+        help="fail the build when the PDF exceeds this size; 0 disables the budget",
+    )
+    parser.add_argument(
+        "--batch-cards",
+        type=int,
+        default=BATCH_CARDS,
+        help=f"cards whose heroes are prepared and laid out together (default: {BATCH_CARDS}; 0 = all at once)",
+    )
+    parser.add_argument(
+        "--per-card",
+        action="store_true",
+        help="also write one PDF per sampler card into the press kit directory",
+    )
+    parser.add_argument(
+        "--legacy",
+        action="store_true",
+        help="also export _data/legacy_works.yml (all works plus one PDF per work)",
+    )
+    parser.add_argument(
+        "--catalog",
+        action="store_true",
+        help="also export catalog/index.json (all items plus one PDF per item)",
+    )
+    parser.add_argument(
+        "--press-kit",
+        action="store_true",
+        help="shorthand for --per-card --legacy --catalog",
+    )
+    parser.add_argument(
+        "--press-kit-dir",
+        type=Path,
+        default=PRESS_KIT_DIR,
+        help="where exported documents go (default: assets/docs/press-kit)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time each build phase and card, and print a summary table at exit",
+    )
+    parser.add_argument(
+        "--cprofile",
+        type=Path,
+        metavar="FILE",
+        help="also write cProfile stats here (implies --profile; read with `python -m pstats FILE`)",
+    )
+    parser.add_argument(
+        "--tracemalloc",
+        type=Path,
+        metavar="FILE",
+        help="also write the top allocation sites and peak traced memory here (implies --profile)",
+    )
+    args = parser.parse_args(argv)
+    if not 1 <= args.jpeg_quality <= 95:
+        parser.error("--jpeg-quality must be between 1 and 95")
+    if args.dpi < 1:
+        parser.error("--dpi must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.batch_cards < 0:
+        parser.error("--batch-cards must be 0 or more")
+    if args.press_kit:
+        args.per_card = args.legacy = args.catalog = True
+    if args.profile or args.cprofile or args.tracemalloc:
+        profiler = instrument.Profiler()
+    try:
+        with profiler.capture(args.cprofile, args.tracemalloc):
+            _build(args)
+    finally:
+        if profiler.enabled:
+            print()
+            print(profiler.summary(label="card"))
+
+
+def describe_exports(args: argparse.Namespace) -> str:
+    """The press-kit documents a run asks for, as recorded in the build manifest ("" for none)."""
+    kinds = [kind for kind in ("per-card", "legacy", "catalog") if getattr(args, kind.replace("-", "_"))]
+    return f"{' '.join(kinds)} -> {_label(args.press_kit_dir)}" if kinds else ""
+
+
+def _build(args: argparse.Namespace) -> None:
+    global raster_cache
+    settings = HeroSettings(dpi=args.dpi, jpeg_quality=args.jpeg_quality)
+    max_bytes = int(args.max_pdf_mb * 1024 * 1024) or None
+    exports = describe_exports(args)
+    if not args.force:
+        with profiler.phase("check inputs"):
+            reason = stale_input(load_manifest(), settings, exports)
+        if reason is None:
+            what = "Sampler and press-kit PDFs are" if exports else f"{OUTPUT_PATH.relative_to(ROOT)} is"
+            print(f"{what} up to date (use --force to rebuild)")
+            return
+        print(f"Rebuilding: {reason}")
+    if args.no_cache:
+        raster_cache = None
+    if exports:
+        _build_press_kit(args, settings, max_bytes, exports)
+        return
+    with profiler.phase("load cards"):
+        cards = load_cards()
+    build_pdf(
+        cards,
+        workers=args.workers,
+        settings=settings,
+        max_bytes=max_bytes,
+        batch_cards=args.batch_cards,
+    )
+    with profiler.phase("write manifest"):
+        write_manifest(cards, settings)
+        build_asset_manifest.refresh()
+
+
+def _build_press_kit(
+    args: argparse.Namespace, settings: HeroSettings, max_bytes: int | None, exports: str
+) -> None:
+    """The sampler plus whichever press-kit documents were asked for, in one pass."""
+    out = args.press_kit_dir
+    staged = staging_path(OUTPUT_PATH)
+    data_paths = [DATA_PATH]
+    with profiler.phase("load cards"):
+        cards = load_cards()
+        sets = [
+            DocumentSet(
+                "sampler", SAMPLER_COVER, cards, staged, out / "sampler" if args.per_card else None
+            )
+        ]
+        if args.legacy:
+            sets.append(
+                DocumentSet(
+                    "legacy", LEGACY_COVER, load_legacy_cards(), out / "legacy-works.pdf", out / "legacy"
+                )
+            )
+            data_paths += [ROOT / "_data/legacy_works.yml", CONFIG_PATH]
+        if args.catalog:
+            sets.append(
+                DocumentSet("catalog", CATALOG_COVER, load_catalog_cards(), out / "catalog.pdf", out / "catalog")
+            )
+            data_paths += [CATALOG_INDEX_PATH, CONFIG_PATH]
+    for document_set in sets:
+        if document_set.per_card_dir is not None:
+            check_card_ids(document_set)
+    try:
+        sizes = dict(
+            export_documents(sets, workers=args.workers, settings=settings, batch_cards=args.batch_cards)
+        )
+        sampler_size = sizes.pop(staged)
+        check_budget(sampler_size, max_bytes)
+        staged.replace(OUTPUT_PATH)
+    finally:
+        staged.unlink(missing_ok=True)
+    outputs = [OUTPUT_PATH, *sizes]
+    report_sampler(sampler_size)
+    print(f"Wrote {len(sizes)} press-kit PDFs to {_label(out)} ({sum(sizes.values()) / 1024:.0f} KB)")
+    with profiler.phase("write manifest"):
+        write_manifest(
+            [card for document_set in sets for card in document_set.cards],
+            settings,
+            outputs,
+            dict.fromkeys(data_paths),
+            exports,
+        )
+        build_asset_manifest.refresh()
 
 
 if __name__ == "__main__":
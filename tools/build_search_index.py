@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Build the sharded client-side search index under `assets/search/`.
+
+Indexes atlas nodes, projects, teaching pages, and the legacy lineage notes:
+front matter `title`, `summary`, `pillar`, and `reading.*` plus the page body,
+each weighted by where the word appeared. Tokens are bucketed into shards by
+their first two characters, so a browser fetches `manifest.json` once and then
+only the shards its query terms start with. Shard filenames carry a content
+hash, so they can be cached forever; the manifest is the only file that
+changes name-for-name between builds. `--check` fails when the committed
+index differs from a fresh build.
+
+`js/search-index.js` is the matching reader.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from site_model import ROOT, SiteModel
+
+OUTPUT_DIR = ROOT / "assets/search"
+SOURCES = ("_nodes", "_projects", "_teaching", "docs/legacy")
+INDEX_VERSION = 1
+SHARD_PREFIX = 2
+
+# Where a word shows up decides how much it counts toward a match.
+FIELD_WEIGHTS = {"title": 8, "pillar": 4, "summary": 4, "reading": 2, "body": 1}
+
+STOPWORDS = frozenset(
+    """
+    a an and are as at be but by can do for from has have how if in into is it its
+    not of on or so than that the their them then there these they this to too was
+    we were what when where which while who why will with you your
+    """.split()
+)
+
+LIQUID_RE = re.compile(r"{%.*?%}|{{.*?}}", re.S)
+TAG_RE = re.compile(r"<[^>]+>")
+LINK_TARGET_RE = re.compile(r"\]\([^)]*\)")
+TOKEN_RE = re.compile(r"[^\W_]+(?:['’][^\W_]+)?")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase words of two or more characters, minus stopwords and markup."""
+    text = LIQUID_RE.sub(" ", text)
+    text = TAG_RE.sub(" ", text)
+    text = LINK_TARGET_RE.sub("]", text)
+    tokens = []
+    for match in TOKEN_RE.finditer(text.lower()):
+        token = match.group(0).replace("’", "'").split("'")[0]
+        if len(token) >= 2 and token not in STOPWORDS:
+            tokens.append(token)
+    return tokens
+
+
+def _flatten(value) -> str:
+    if isinstance(value, dict):
+        return " ".join(_flatten(item) for item in value.values())
+    if isinstance(value, list):
+        return " ".join(_flatten(item) for item in value)
+    return "" if value is None else str(value)
+
+
+def page_fields(data: dict, body: str) -> dict[str, str]:
+    return {
+        "title": _flatten(data.get("title")),
+        "pillar": _flatten(data.get("pillar")),
+        "summary": _flatten(data.get("summary") or data.get("seo_description")),
+        "reading": _flatten(data.get("reading")),
+        "body": body,
+    }
+
+
+def collect_documents(site: SiteModel) -> list[dict]:
+    documents = []
+    for folder in SOURCES:
+        for rel in site.glob(folder):
+            url = site.url_for(rel)
+            if url is None:
+                continue
+            page = site.page(rel)
+            documents.append(
+                {
+                    "url": "/" + url + ("" if url.endswith(".html") else "/"),
+                    "title": _flatten(page.data.get("title")) or Path(rel).stem,
+                    "summary": _flatten(page.data.get("summary") or page.data.get("seo_description")),
+                    "kind": folder.strip("_").split("/")[-1],
+                    "fields": page_fields(page.data, page.body),
+                }
+            )
+    return documents
+
+
+def build_postings(documents: list[dict]) -> dict[str, dict[str, list[int]]]:
+    """shard -> token -> flat [doc, score, doc, score, ...] sorted by score."""
+    scores: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+    for doc_id, document in enumerate(documents):
+        for field, text in document["fields"].items():
+            weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                scores[token][doc_id] += weight
+    shards: dict[str, dict[str, list[int]]] = defaultdict(dict)
+    for token in sorted(scores):
+        ranked = sorted(scores[token].items(), key=lambda item: (-item[1], item[0]))
+        shards[token[:SHARD_PREFIX]][token] = [n for pair in ranked for n in pair]
+    return shards
+
+
+def _dump(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+
+def build_index(site: SiteModel) -> tuple[dict, dict[str, str]]:
+    """Return `(manifest, {shard filename: shard json})`."""
+    documents = collect_documents(site)
+    files: dict[str, str] = {}
+    shard_names: dict[str, str] = {}
+    for prefix, postings in sorted(build_postings(documents).items()):
+        text = _dump(postings)
+        digest = hashlib.sha256(text.encode()).hexdigest()[:10]
+        name = f"{prefix}.{digest}.json"
+        files[name] = text
+        shard_names[prefix] = name
+    manifest = {
+        "version": INDEX_VERSION,
+        "prefix": SHARD_PREFIX,
+        "docs": [
+            {"u": doc["url"], "t": doc["title"], "s": doc["summary"], "k": doc["kind"]}
+            for doc in documents
+        ],
+        "shards": shard_names,
+    }
+    return manifest, files
+
+
+def write_index(manifest: dict, files: dict[str, str], output_dir: Path = OUTPUT_DIR) -> None:
+    shard_dir = output_dir / "shards"
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    for name, text in files.items():
+        path = shard_dir / name
+        if not path.exists():
+            path.write_text(text + "\n", encoding="utf-8")
+    for stale in shard_dir.glob("*.json"):
+        if stale.name not in files:
+            stale.unlink()
+    (output_dir / "manifest.json").write_text(_dump(manifest) + "\n", encoding="utf-8")
+
+
+def stale_files(manifest: dict, files: dict[str, str], output_dir: Path = OUTPUT_DIR) -> list[str]:
+    """Paths under `output_dir` that a write of this build would add, change, or delete."""
+    stale = []
+    manifest_path = output_dir / "manifest.json"
+    if not manifest_path.is_file() or manifest_path.read_text(encoding="utf-8") != _dump(manifest) + "\n":
+        stale.append("manifest.json")
+    shard_dir = output_dir / "shards"
+    on_disk = {path.name for path in shard_dir.glob("*.json")} if shard_dir.is_dir() else set()
+    for name in sorted(on_disk | set(files)):
+        path = shard_dir / name
+        if name not in files or name not in on_disk or path.read_text(encoding="utf-8") != files[name] + "\n":
+            stale.append(f"shards/{name}")
+    return stale
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR, help="where to write the index")
+    parser.add_argument("--check", action="store_true", help="fail if the committed index is stale")
+    args = parser.parse_args(argv)
+
+    manifest, files = build_index(SiteModel())
+    if args.check:
+        stale = stale_files(manifest, files, args.output)
+        if not stale:
+            print(f"Search index is current ({len(manifest['docs'])} pages, {len(files)} shards)")
+            return 0
+        print(f"Search index is stale ({len(stale)} files differ); run tools/build_search_index.py")
+        for rel in stale[:10]:
+            print(f" - {rel}")
+        return 1
+    write_index(manifest, files, args.output)
+    size = sum(len(text.encode()) for text in files.values())
+    print(
+        f"Indexed {len(manifest['docs'])} pages into {len(files)} shards "
+        f"({size / 1024:.0f} KB) under {args.output.relative_to(ROOT) if args.output.is_relative_to(ROOT) else args.output}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
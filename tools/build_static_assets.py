@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""Fingerprint the site's CSS and JS, optionally precompressing them.
+
+Every file matched by `SOURCES` gets a copy named for the hash of its contents under
+`assets/dist/` (same relative path, `<stem>.<hash10><suffix>`), so a new
+version is a new URL and a stale cached copy can never be served. Relative
+`url(...)` references in CSS are rewritten to root-relative ones so moving
+the file doesn't break them.
+
+GitHub Pages, which serves this site, compresses responses itself, ignores
+`.gz`/`.br` files and sets its own short cache lifetime, so by default only the
+fingerprinted copies are written. `--precompress` adds `.gz` and, when the
+`brotli` package is installed, `.br` siblings for a host that serves
+precompressed files (nginx `gzip_static`/`brotli_static`, most CDNs) and can
+send immutable cache headers for `assets/dist/`; don't commit those.
+
+`_data/static_assets.json` maps each original URL to its fingerprinted one;
+`_includes/asset-url.html` looks paths up there and falls back to the original,
+so a page never points at a file that wasn't built. Sources whose bytes and
+output settings match the manifest are skipped; the rest are built across a
+process pool (`--workers`). `--check` (and the content tests) fail when a
+source changed since the last build, so an edit can't ship behind the old
+hashed copy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import posixpath
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from site_model import ROOT
+
+# Vendored libraries in sketch folders are shared and fingerprinted by `build_vendor.py`.
+SOURCES = (
+    "css/*.css",
+    "js/*.js",
+    "assets/css/*.css",
+)
+OUTPUT_DIR = ROOT / "assets/dist"
+MANIFEST_PATH = ROOT / "_data/static_assets.json"
+MANIFEST_VERSION = 1
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+CSS_URL_RE = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+
+
+def brotli_available() -> bool:
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def settings_digest(precompress: bool, with_brotli: bool) -> str:
+    """Changes whenever a rerun would write different files."""
+    settings = {
+        "gzip": GZIP_LEVEL if precompress else None,
+        "brotli": BROTLI_QUALITY if precompress and with_brotli else None,
+        "css_urls": 1,
+    }
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def find_sources(root: Path = ROOT) -> list[str]:
+    """Repo-relative source paths, sorted."""
+    found = set()
+    for pattern in SOURCES:
+        found.update(path.relative_to(root).as_posix() for path in root.glob(pattern) if path.is_file())
+    return sorted(found)
+
+
+def rebase_css_urls(text: str, rel: str) -> str:
+    """Rewrite relative `url(...)` targets in the CSS at `rel` to root-relative paths."""
+    base = posixpath.dirname(rel)
+
+    def rebase(match: re.Match) -> str:
+        quote, target = match.groups()
+        if target.startswith(("/", "#", "data:", "http:", "https:")):
+            return match.group(0)
+        return f"url({quote}/{posixpath.normpath(posixpath.join(base, target))}{quote})"
+
+    return CSS_URL_RE.sub(rebase, text)
+
+
+def output_path(rel: str, data: bytes) -> str:
+    digest = hashlib.sha256(data).hexdigest()
+    path = Path(rel)
+    return f"{OUTPUT_DIR.relative_to(ROOT).as_posix()}/{path.parent.as_posix()}/{path.stem}.{digest[:10]}{path.suffix}"
+
+
+def write_precompressed(path: Path, data: bytes, precompress: bool, with_brotli: bool) -> tuple[int, int | None]:
+    """Write `path`, plus `.gz` (and `.br`) siblings when `precompress`; return the compressed sizes.
+
+    The gzip size is measured either way so the report can show what a visitor downloads.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    # mtime=0 keeps the .gz byte-identical across rebuilds.
+    gz = gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    if not precompress:
+        return len(gz), None
+    Path(f"{path}.gz").write_bytes(gz)
+    if not with_brotli:
+        return len(gz), None
+    import brotli
+
+    br = brotli.compress(data, quality=BROTLI_QUALITY)
+    Path(f"{path}.br").write_bytes(br)
+    return len(gz), len(br)
+
+
+def build_asset(rel: str, digest: str, precompress: bool, with_brotli: bool, root: Path = ROOT) -> dict:
+    """Write the fingerprinted copy (and any compressed siblings); return the manifest entry."""
+    data = (root / rel).read_bytes()
+    if rel.endswith(".css"):
+        data = rebase_css_urls(data.decode("utf-8"), rel).encode("utf-8")
+    out = output_path(rel, data)
+    gz, br = write_precompressed(root / out, data, precompress, with_brotli)
+    return {
+        "path": "/" + out,
+        "sha256": digest,
+        "bytes": len(data),
+        "gzip": gz,
+        "br": br,
+        "precompressed": precompress,
+    }
+
+
+def _build_one(job: tuple[str, str, bool, bool]) -> tuple[str, dict]:
+    rel, digest, precompress, with_brotli = job
+    return rel, build_asset(rel, digest, precompress, with_brotli)
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    return manifest if manifest.get("version") == MANIFEST_VERSION else {}
+
+
+def _outputs(entry: dict) -> list[str]:
+    out = entry["path"].lstrip("/")
+    if not entry.get("precompressed"):
+        return [out]
+    return [out, out + ".gz"] + ([out + ".br"] if entry.get("br") is not None else [])
+
+
+def is_current(entry: dict | None, digest: str, root: Path = ROOT) -> bool:
+    if not entry or entry.get("sha256") != digest:
+        return False
+    return all((root / out).is_file() for out in _outputs(entry))
+
+
+def stale_sources(manifest: dict, root: Path = ROOT) -> list[str]:
+    """Source URLs whose manifest entry is missing or out of date, plus entries for deleted sources."""
+    files = manifest.get("files", {})
+    sources = ["/" + rel for rel in find_sources(root)]
+    stale = [
+        url for url in sources
+        if not is_current(files.get(url), hashlib.sha256((root / url.lstrip("/")).read_bytes()).hexdigest(), root)
+    ]
+    stale.extend(url for url in files if url not in sources)
+    return sorted(stale)
+
+
+def remove_stale(files: dict, root: Path = ROOT) -> int:
+    """Delete outputs no manifest entry points at; return how many."""
+    keep = {out for entry in files.values() for out in _outputs(entry)}
+    removed = 0
+    output = root / OUTPUT_DIR.relative_to(ROOT)
+    if output.is_dir():
+        for path in output.rglob("*"):
+            if path.is_file() and path.relative_to(root).as_posix() not in keep:
+                path.unlink()
+                removed += 1
+    return removed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=None, help="compression processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true", help="rebuild every asset even if unchanged")
+    parser.add_argument(
+        "--precompress", action="store_true", help="also write .gz/.br siblings (for hosts other than GitHub Pages)"
+    )
+    parser.add_argument("--check", action="store_true", help="fail if any source changed since the last build")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        stale = stale_sources(load_manifest())
+        if stale:
+            print("Fingerprinted assets are stale; run tools/build_static_assets.py\n- " + "\n- ".join(stale))
+            return 1
+        print("Fingerprinted assets are current")
+        return 0
+
+    with_brotli = args.precompress and brotli_available()
+    settings = settings_digest(args.precompress, with_brotli)
+    previous = load_manifest()
+    old_files = previous.get("files", {}) if previous.get("settings") == settings else {}
+
+    files: dict[str, dict] = {}
+    jobs = []
+    for rel in find_sources():
+        digest = hashlib.sha256((ROOT / rel).read_bytes()).hexdigest()
+        key = "/" + rel
+        if not args.force and is_current(old_files.get(key), digest):
+            files[key] = old_files[key]
+        else:
+            jobs.append((rel, digest, args.precompress, with_brotli))
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            for rel, entry in pool.map(_build_one, jobs, chunksize=1):
+                files["/" + rel] = entry
+
+    files = dict(sorted(files.items()))
+    removed = remove_stale(files)
+    MANIFEST_PATH.write_text(
+        json.dumps({"version": MANIFEST_VERSION, "settings": settings, "files": files}, indent=2) + "\n",
+        encoding="utf-8",
+    )
+
+    raw = sum(entry["bytes"] for entry in files.values())
+    gz = sum(entry["gzip"] for entry in files.values())
+    print(
+        f"{len(files)} assets: built {len(jobs)}, skipped {len(files) - len(jobs)} unchanged, "
+        f"removed {removed} stale outputs"
+    )
+    line = f"{raw / 1024:.0f} KB raw -> {gz / 1024:.0f} KB gzip"
+    if with_brotli:
+        line += f" / {sum(entry['br'] for entry in files.values()) / 1024:.0f} KB brotli"
+    elif args.precompress:
+        line += " (install `brotli` for .br variants)"
+    print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""Share one fingerprinted copy of each vendored JavaScript library across sketches.
+
+Every file matched by `VENDOR_GLOBS` is fingerprinted and identified by its
+license banner (`/*! p5.js v1.6.0 ...`), then grouped with copies of the same
+library that are version-compatible: same major version, or same major.minor
+for 0.x releases, whose minors break. Files with no recognizable banner only
+group with byte-identical copies. Each group's newest copy is written once to
+`assets/vendor/<name>-<version>.<hash10>.js`, minified with `rjsmin` unless
+the source is minified already. `rjsmin` is pinned in `requirements-dev.txt`;
+without it the run stops before writing anything rather than ship unminified
+copies. `--precompress` adds the same `.gz`/`.br` siblings
+`build_static_assets.py --precompress` does, for hosts other than GitHub
+Pages; don't commit those.
+
+Sketch pages (`SKETCH_PAGES`) are then rewritten so every `<script src>` that
+loads a grouped library, whether the sketch's own copy or a CDN URL for a
+library the sketch vendors, points at the shared file. A CDN URL is only
+swapped for a copy of the version it names, and a `.min.js` one only for a
+minified copy, so a rewrite never changes which build a page runs. A visitor who opens
+several sketches downloads each runtime once, and the hashed name makes it
+cacheable forever. `_data/vendor_libraries.json` records the groups and
+pages. The report compares what a visitor browsing every sketch downloads
+before and after.
+
+Libraries no sketch page loads (the `js/legacy/` set the archived 2D/3D pages
+reference directly) are reported but not copied. `assets/vendor/` is itself
+one of the sources, so once a page points at the shared file its sketch's own
+copy can be deleted and reruns still find the library. `--dry-run` prints the
+grouping only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import posixpath
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import build_static_assets
+from site_model import ROOT
+
+VENDOR_GLOBS = ("assets/vendor/*.js", "robot/*.js", "spin/libraries/*.js", "js/legacy/*.js")
+SKETCH_PAGES = ("robot/index.html", "spin/index.html")
+# Sketch code lives next to the libraries but isn't one.
+NOT_LIBRARIES = ("sketch.js", "script.js")
+OUTPUT_DIR = ROOT / "assets/vendor"
+MANIFEST_PATH = ROOT / "_data/vendor_libraries.json"
+MANIFEST_VERSION = 1
+
+# (name, version) out of the first few hundred bytes of a library.
+BANNERS = (
+    re.compile(r"\b(p5(?:\.(?!js\b)\w+)?)(?:\.js)?\s+v(\d+(?:\.\d+)+)"),
+    re.compile(r"\[(p5\.\w+)\]\s+Version:\s*(\d+(?:\.\d+)+)"),
+    re.compile(r"\b(jQuery(?: Easing)?)\s+v(\d+(?:\.\d+)+)"),
+    re.compile(r"\b(imagesLoaded|Masonry)\s+PACKAGED\s+v(\d+(?:\.\d+)+)"),
+    re.compile(r"\b(Modernizr)\s+(\d+(?:\.\d+)+)"),
+)
+SCRIPT_SRC_RE = re.compile(r"""(<script\b[^>]*?\bsrc=)(["'])([^"']+)\2""", re.I)
+CDN_RE = re.compile(r"^(?:https?:)?//(?:cdnjs\.cloudflare\.com|cdn\.jsdelivr\.net|unpkg\.com)/", re.I)
+# `/1.6.0/` or `@1.6.0/` in a CDN path.
+CDN_VERSION_RE = re.compile(r"[/@]v?(\d+(?:\.\d+)+)/")
+
+
+@dataclass
+class Copy:
+    rel: str
+    name: str
+    version: str | None
+    sha256: str
+    size: int
+
+    @property
+    def compat(self) -> str:
+        """Copies sharing this key can stand in for each other."""
+        if self.version is None:
+            return f"{self.name}@{self.sha256[:10]}"
+        parts = self.version.split(".")
+        return f"{self.name}@{parts[0] if parts[0] != '0' else '.'.join(parts[:2])}"
+
+
+def _version_key(version: str | None) -> tuple[int, ...]:
+    return tuple(int(part) for part in (version or "0").split("."))
+
+
+def identify(rel: str, data: bytes) -> tuple[str, str | None]:
+    """Library name (lowercased) and version from the banner, else the file stem and None."""
+    head = data[:600].decode("utf-8", "replace")
+    for pattern in BANNERS:
+        match = pattern.search(head)
+        if match:
+            return match.group(1).lower().replace(" ", "-"), match.group(2)
+    return re.sub(r"(\.min)?\.js$", "", posixpath.basename(rel)).lower(), None
+
+
+def find_copies(root: Path = ROOT) -> list[Copy]:
+    copies = []
+    for pattern in VENDOR_GLOBS:
+        for path in sorted(root.glob(pattern)):
+            if not path.is_file() or path.name in NOT_LIBRARIES:
+                continue
+            rel = path.relative_to(root).as_posix()
+            data = path.read_bytes()
+            name, version = identify(rel, data)
+            copies.append(Copy(rel, name, version, hashlib.sha256(data).hexdigest(), len(data)))
+    return copies
+
+
+def group_copies(copies: list[Copy]) -> dict[str, list[Copy]]:
+    """compat key -> copies, newest first."""
+    groups: dict[str, list[Copy]] = {}
+    for copy in copies:
+        groups.setdefault(copy.compat, []).append(copy)
+    for members in groups.values():
+        members.sort(key=lambda copy: (_version_key(copy.version), copy.rel), reverse=True)
+    return dict(sorted(groups.items()))
+
+
+def is_minified(rel: str, data: bytes) -> bool:
+    if ".min." in posixpath.basename(rel):
+        return True
+    lines = data.count(b"\n") + 1
+    return len(data) / lines > 400
+
+
+def needs_minifier(groups: dict[str, list[Copy]], keys, root: Path = ROOT) -> list[str]:
+    """Libraries among `keys` whose shared copy would have to be minified here."""
+    return [
+        groups[key][0].rel
+        for key in keys
+        if not is_minified(groups[key][0].rel, (root / groups[key][0].rel).read_bytes())
+    ]
+
+
+def minify(data: bytes) -> bytes | None:
+    """`data` run through rjsmin (license banners kept), or None when it isn't installed."""
+    try:
+        import rjsmin
+    except ImportError:
+        return None
+    return rjsmin.jsmin(data.decode("utf-8"), keep_bang_comments=True).encode("utf-8")
+
+
+def build_shared(members: list[Copy], precompress: bool, with_brotli: bool, root: Path = ROOT) -> dict:
+    """Write the group's shared copy and return its manifest entry."""
+    best = members[0]
+    data = (root / best.rel).read_bytes()
+    minified = is_minified(best.rel, data)
+    if not minified:
+        smaller = minify(data)
+        if smaller is None:
+            raise SystemExit(f"{best.rel} needs minifying and rjsmin isn't installed")
+        data, minified = smaller, True
+    digest = hashlib.sha256(data).hexdigest()
+    label = f"{best.name}-{best.version}" if best.version else best.name
+    out = f"{OUTPUT_DIR.relative_to(ROOT).as_posix()}/{label}.{digest[:10]}{'.min' if minified else ''}.js"
+    gz, br = build_static_assets.write_precompressed(root / out, data, precompress, with_brotli)
+    return {
+        "name": best.name,
+        "version": best.version,
+        "shared": "/" + out,
+        "minified": minified,
+        "bytes": len(data),
+        "gzip": gz,
+        "br": br,
+        "precompressed": precompress,
+        "copies": [
+            {"path": "/" + copy.rel, "version": copy.version, "sha256": copy.sha256[:12], "bytes": copy.size}
+            for copy in members
+        ],
+    }
+
+
+def resolve(src: str, page_rel: str, by_path: dict[str, str], local_names: dict[str, Copy]) -> str | None:
+    """The compat key a `<script src>` on `page_rel` loads, if it's a grouped library."""
+    if CDN_RE.match(src):
+        # Only trust a CDN URL when the sketch vendors the same library beside it,
+        # at the version the URL pins and at least as minified.
+        path = src.split("?")[0]
+        copy = local_names.get(re.sub(r"(\.min)?\.js$", "", posixpath.basename(path)).lower())
+        if copy is None:
+            return None
+        pinned = CDN_VERSION_RE.search(path)
+        if pinned and pinned.group(1) != copy.version:
+            return None
+        if path.endswith(".min.js") and ".min." not in posixpath.basename(copy.rel):
+            return None
+        return copy.compat
+    if re.match(r"^[a-z]+:|^//", src, re.I):
+        return None
+    path = src.split("?")[0].split("#")[0]
+    rel = path.lstrip("/") if path.startswith("/") else posixpath.normpath(
+        posixpath.join(posixpath.dirname(page_rel), path)
+    )
+    return by_path.get("/" + rel)
+
+
+def page_scripts(text: str, page_rel: str, by_path: dict, local_names: dict) -> list[tuple[str, str]]:
+    """`(src, compat key)` for each `<script>` on the page that loads a grouped library."""
+    found = []
+    for match in SCRIPT_SRC_RE.finditer(text):
+        key = resolve(match.group(3), page_rel, by_path, local_names)
+        if key is not None:
+            found.append((match.group(3), key))
+    return found
+
+
+def rewrite_page(text: str, targets: dict[str, str]) -> str:
+    """Replace each `<script src>` listed in `targets` (old src -> new src)."""
+
+    def swap(match: re.Match) -> str:
+        prefix, quote, src = match.groups()
+        return f"{prefix}{quote}{targets[src]}{quote}" if src in targets else match.group(0)
+
+    return SCRIPT_SRC_RE.sub(swap, text)
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    return manifest if manifest.get("version") == MANIFEST_VERSION else {}
+
+
+def remove_stale(libraries: dict, root: Path = ROOT) -> int:
+    """Delete shared files (and siblings) no manifest entry points at; return how many."""
+    keep = {
+        entry["shared"].lstrip("/") + suffix
+        for entry in libraries.values()
+        for suffix in (("", ".gz", ".br") if entry.get("precompressed") else ("",))
+    }
+    removed = 0
+    output = root / OUTPUT_DIR.relative_to(ROOT)
+    if output.is_dir():
+        for path in output.iterdir():
+            if path.is_file() and path.relative_to(root).as_posix() not in keep:
+                path.unlink()
+                removed += 1
+    return removed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="report groups and savings without writing")
+    parser.add_argument(
+        "--precompress", action="store_true", help="also write .gz/.br siblings (for hosts other than GitHub Pages)"
+    )
+    args = parser.parse_args(argv)
+
+    copies = find_copies()
+    groups = group_copies(copies)
+    by_path = {"/" + copy.rel: copy.compat for copy in copies}
+
+    scripts: dict[str, list[tuple[str, str]]] = {}
+    before = 0
+    for page_rel in SKETCH_PAGES:
+        if not (ROOT / page_rel).is_file():
+            continue
+        folder = posixpath.dirname(page_rel) + "/"
+        local = [copy for copy in copies if copy.rel.startswith(folder)]
+        text = (ROOT / page_rel).read_text(encoding="utf-8")
+        scripts[page_rel] = page_scripts(text, page_rel, by_path, {copy.name: copy for copy in local})
+        # Before sharing, each page fetched its own copy; a CDN URL costs what the copy beside it does.
+        for _, key in scripts[page_rel]:
+            before += next((copy.size for copy in local if copy.compat == key), groups[key][0].size)
+
+    loaded = sorted({key for found in scripts.values() for _, key in found})
+    for key, members in groups.items():
+        listing = ", ".join(f"{copy.rel} ({copy.version or '?'}, {copy.size / 1024:.0f} KB)" for copy in members)
+        print(f"{key}: {listing}{'' if key in loaded else ' (no sketch page loads it)'}")
+    if args.dry_run:
+        after = sum(groups[key][0].size for key in loaded)
+        print(f"Sketch pages load {len(loaded)} libraries: {before / 1024:.0f} KB page by page, {after / 1024:.0f} KB shared")
+        return 0
+
+    unminified = needs_minifier(groups, loaded)
+    if unminified and minify(b"") is None:
+        print("rjsmin isn't installed, and these would ship unminified; run pip install -r requirements-dev.txt:")
+        for rel in unminified:
+            print(f" - {rel}")
+        return 1
+
+    with_brotli = args.precompress and build_static_assets.brotli_available()
+    libraries = {key: build_shared(groups[key], args.precompress, with_brotli) for key in loaded}
+    pages = {}
+    for page_rel, found in scripts.items():
+        targets = {src: libraries[key]["shared"] for src, key in found}
+        path = ROOT / page_rel
+        text = path.read_text(encoding="utf-8")
+        updated = rewrite_page(text, targets)
+        if updated != text:
+            path.write_text(updated, encoding="utf-8")
+        pages[page_rel] = [libraries[key]["shared"] for _, key in found]
+    removed = remove_stale(libraries)
+    MANIFEST_PATH.write_text(
+        json.dumps({"version": MANIFEST_VERSION, "libraries": libraries, "pages": pages}, indent=2) + "\n",
+        encoding="utf-8",
+    )
+
+    after = sum(entry["bytes"] for entry in libraries.values())
+    gz = sum(entry["gzip"] for entry in libraries.values())
+    print(
+        f"Sketch pages load {len(loaded)} shared libraries: {before / 1024:.0f} KB fetched page by page before, "
+        f"{after / 1024:.0f} KB once now ({gz / 1024:.0f} KB gzip); removed {removed} stale files"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Run every lint in one process against one shared view of the repo.
+
+Each check is a `run(site)` function from its own script; they all share a
+single `SiteModel`, so files are read and parsed once no matter how many
+checks look at them. Prints one report with per-check timing and exits
+non-zero if any check found errors. `--watch` keeps going and re-checks
+incrementally; see `watch.py`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import instrument
+import lint
+import lint_hidden_page
+import lint_sampler
+import lint_visual_system
+import parallel
+import site_data
+from site_model import Findings, SiteModel
+
+# (name, run function, the `run_checks` options it takes: `jobs` for sharded
+# file-level work, `profiler` for phase timings under `--profile`)
+CHECKS = [
+    ("lint", lint.run, ("jobs",)),
+    ("lint_sampler", lint_sampler.run, ()),
+    ("lint_hidden_page", lint_hidden_page.run, ()),
+    ("lint_visual_system", lint_visual_system.run, ("jobs", "profiler")),
+]
+
+
+def run_checks(
+    site: SiteModel,
+    checks=CHECKS,
+    jobs: int | None = None,
+    profiler: instrument.Profiler = instrument.DISABLED,
+) -> list[tuple[str, Findings, float]]:
+    options = {"jobs": jobs, "profiler": profiler}
+    results = []
+    for name, check, takes in checks:
+        started = time.perf_counter()
+        with profiler.phase(name):
+            findings = check(site, **{option: options[option] for option in takes})
+        results.append((name, findings, time.perf_counter() - started))
+    # Sources deleted since the last run would otherwise keep their parse cache forever.
+    site_data.prune(site.root)
+    return results
+
+
+def report(results: list[tuple[str, Findings, float]]) -> int:
+    failed = False
+    for name, findings, elapsed in results:
+        status = "FAIL" if findings.errors else "PASS"
+        failed = failed or bool(findings.errors)
+        print(f"{status}  {name:<20} {elapsed * 1000:7.1f} ms")
+        for error in findings.errors:
+            print(f"      error: {error}")
+        for warning in findings.warnings:
+            print(f"      warning: {warning}")
+        for note in findings.notes:
+            print(f"      note: {note}")
+    total = sum(elapsed for _, _, elapsed in results)
+    print(f"\n{len(results)} checks in {total * 1000:.1f} ms: {'FAIL' if failed else 'PASS'}")
+    return 1 if failed else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="keep running and re-check only what changed after each save",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=parallel.jobs_count,
+        default=None,
+        help=parallel.JOBS_HELP,
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="break each check into phases and print a timing table after the report",
+    )
+    parser.add_argument("--cprofile", type=Path, metavar="FILE", help="also write cProfile stats here")
+    args = parser.parse_args(argv)
+    if args.watch:
+        import watch
+
+        return watch.watch()
+    if not (args.profile or args.cprofile):
+        return report(run_checks(SiteModel(), jobs=args.jobs))
+    profiler = instrument.Profiler()
+    with profiler.capture(args.cprofile):
+        status = report(run_checks(SiteModel(), jobs=args.jobs, profiler=profiler))
+    print()
+    print(profiler.summary())
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
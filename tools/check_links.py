@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Check that the external links the site publishes still answer.
+
+Collects every http(s) URL from `_data/fleet.yml`, `_data/cds.yml`, atlas node
+front matter, and markdown links in `_projects` / `_teaching`, then checks them
+concurrently on one asyncio loop: keep-alive connections are pooled per host,
+concurrency is bounded overall and per host, and HEAD falls back to GET for
+servers that refuse HEAD. The timeout covers each request, not the wait for a
+per-host slot, and a GET fallback only reads the status line and headers.
+Redirects are followed only within the origin that was asked; one pointing
+at another origin is reported (it still counts as answering) rather than
+followed, so a check never wanders off to a host nobody listed.
+Results are cached in `.cache/link-check.json` for `--ttl` seconds (failures
+for at most `FAILURE_TTL`, so a flaky host is retried soon) and a re-run only
+hits the network for new or stale URLs.
+
+`--base-url` points every request at another origin (path and query kept), so
+tests and dry runs can use a local stand-in server instead of the internet.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+import lint
+from http_client import TIMEOUT, ConnectionPool, request
+from site_model import ROOT, SiteModel
+
+CACHE_PATH = ROOT / ".cache/link-check.json"
+DEFAULT_TTL = 24 * 60 * 60
+FAILURE_TTL = 10 * 60
+MAX_CONCURRENCY = 32
+MAX_REDIRECTS = 5
+
+
+@dataclass
+class LinkResult:
+    url: str
+    ok: bool
+    status: int | None
+    error: str | None
+    checked: float
+    # Where a redirect to another origin pointed; such redirects aren't followed.
+    redirect: str | None = None
+
+
+def _walk_urls(value, found: set[str]) -> None:
+    if isinstance(value, str):
+        if value.startswith(("http://", "https://")):
+            found.add(value.strip())
+    elif isinstance(value, dict):
+        for item in value.values():
+            _walk_urls(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            _walk_urls(item, found)
+
+
+def collect_links(site: SiteModel) -> dict[str, list[str]]:
+    """Map each external URL to the repo files that mention it."""
+    sources: dict[str, list[str]] = defaultdict(list)
+
+    def add(rel: str, value) -> None:
+        found: set[str] = set()
+        _walk_urls(value, found)
+        for url in sorted(found):
+            sources[url].append(rel)
+
+    for rel in ("_data/fleet.yml", "_data/cds.yml"):
+        if site.exists(rel):
+            add(rel, site.yaml(rel))
+    for rel in site.glob("_nodes"):
+        add(rel, site.page(rel).data)
+    for folder, _ in lint.FOLDERS:
+        for rel in site.glob(folder):
+            page = site.page(rel)
+            add(rel, [page.data, lint.LINK_RE.findall(page.body)])
+    return dict(sorted(sources.items()))
+
+
+def _origin(url: str) -> tuple:
+    parts = urlsplit(url)
+    return parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80)
+
+
+async def _fetch(
+    pool: ConnectionPool, method: str, url: str, timeout: float = TIMEOUT
+) -> tuple[int, str | None]:
+    """`(status, redirect)`: same-origin redirects are followed, others come back unfollowed."""
+    origin = _origin(url)
+    for _ in range(MAX_REDIRECTS + 1):
+        # Only the status matters here, so a GET never downloads the page.
+        status, headers, _ = await request(pool, method, url, timeout=timeout, read_body=False)
+        if status in (301, 302, 303, 307, 308) and "location" in headers:
+            location = urljoin(url, headers["location"])
+            if _origin(location) != origin:
+                return status, location
+            url = location
+            continue
+        return status, None
+    raise RuntimeError("too many redirects")
+
+
+def rebase(url: str, base_url: str | None) -> str:
+    """Swap the origin of `url` for `base_url`, keeping path and query."""
+    if not base_url:
+        return url
+    parts = urlsplit(url)
+    base = urlsplit(base_url)
+    return parts._replace(scheme=base.scheme, netloc=base.netloc).geturl()
+
+
+class LinkChecker:
+    """Concurrent checker with a TTL result cache on disk."""
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        cache_path: Path | None = CACHE_PATH,
+        ttl: float = DEFAULT_TTL,
+        concurrency: int = MAX_CONCURRENCY,
+        timeout: float = TIMEOUT,
+        failure_ttl: float = FAILURE_TTL,
+    ) -> None:
+        self.base_url = base_url
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.failure_ttl = failure_ttl
+        self.cache: dict[str, dict] = self._load_cache()
+
+    def _load_cache(self) -> dict[str, dict]:
+        if self.cache_path is None:
+            return {}
+        try:
+            return json.loads(self.cache_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_cache(self) -> None:
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(json.dumps(self.cache, indent=2, sort_keys=True) + "\n")
+
+    def cached(self, url: str, now: float) -> LinkResult | None:
+        entry = self.cache.get(url)
+        if not entry:
+            return None
+        # A failure may be a timeout or a host having a bad minute; don't trust it for long.
+        ttl = self.ttl if entry["ok"] else min(self.ttl, self.failure_ttl)
+        if now - entry["checked"] < ttl:
+            return LinkResult(**entry)
+        return None
+
+    async def _check(self, pool: ConnectionPool, gate: asyncio.Semaphore, url: str) -> LinkResult:
+        target = rebase(url, self.base_url)
+        async with gate:
+            try:
+                status, redirect = await _fetch(pool, "HEAD", target, self.timeout)
+                if status >= 400:
+                    # Plenty of hosts refuse or mishandle HEAD; ask again properly.
+                    status, redirect = await _fetch(pool, "GET", target, self.timeout)
+                return LinkResult(url, status < 400, status, None, time.time(), redirect)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError, RuntimeError) as exc:
+                return LinkResult(url, False, None, str(exc) or type(exc).__name__, time.time())
+
+    async def check_async(self, urls: list[str]) -> dict[str, LinkResult]:
+        now = time.time()
+        results: dict[str, LinkResult] = {}
+        pending = []
+        for url in urls:
+            hit = self.cached(url, now)
+            if hit is not None:
+                results[url] = hit
+            else:
+                pending.append(url)
+        pool = ConnectionPool()
+        gate = asyncio.Semaphore(self.concurrency)
+        try:
+            fresh = await asyncio.gather(*(self._check(pool, gate, url) for url in pending))
+        finally:
+            pool.close()
+        for result in fresh:
+            results[result.url] = result
+            self.cache[result.url] = asdict(result)
+        self._save_cache()
+        return {url: results[url] for url in urls}
+
+    def check(self, urls: list[str]) -> dict[str, LinkResult]:
+        return asyncio.run(self.check_async(urls))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", help="send every request to this origin instead (e.g. a local stub)")
+    parser.add_argument("--ttl", type=float, default=DEFAULT_TTL, help="seconds a cached result stays fresh")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and don't write .cache/link-check.json")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY, help="requests in flight at once")
+    args = parser.parse_args(argv)
+
+    links = collect_links(SiteModel())
+    checker = LinkChecker(
+        base_url=args.base_url,
+        cache_path=None if args.no_cache else CACHE_PATH,
+        ttl=args.ttl,
+        concurrency=args.concurrency,
+    )
+    started = time.perf_counter()
+    results = checker.check(list(links))
+    elapsed = time.perf_counter() - started
+
+    broken = [result for result in results.values() if not result.ok]
+    moved = [result for result in results.values() if result.ok and result.redirect]
+    print(f"checked {len(results)} external links in {elapsed:.1f}s")
+    if moved:
+        print("Redirected to another origin (not followed; consider updating):")
+        for result in moved:
+            print(f" - {result.url} -> {result.redirect} <- {', '.join(links[result.url])}")
+    if broken:
+        print("Broken links:")
+        for result in broken:
+            reason = result.status if result.status is not None else result.error
+            print(f" - {result.url} ({reason}) <- {', '.join(links[result.url])}")
+        return 1
+    print("All links answered")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Shared front-matter reader for the lint and build tools.
+
+Every page is read at most once per process: `load()` caches by path and
+revalidates against the file's mtime and size, so repeat callers get the same
+`Page` back for free. Only the front matter block is read up front; YAML is
+parsed the first time someone asks for `.data`, and the body stays on disk
+until someone asks for `.body`.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import site_data
+
+_cache: dict[Path, tuple[tuple[int, int], "Page"]] = {}
+
+
+class Page:
+    """A Jekyll page split into front matter and body, both loaded lazily."""
+
+    def __init__(self, path: Path, raw: str | None, body_offset: int) -> None:
+        self.path = path
+        # Raw YAML between the `---` fences; None when the page has no front matter.
+        self.raw = raw
+        self._body_offset = body_offset
+        self._data: dict | None = None
+        self._body: str | None = None
+
+    @property
+    def has_front_matter(self) -> bool:
+        return self.raw is not None
+
+    @property
+    def data(self) -> dict:
+        if self._data is None:
+            parsed = site_data.parse(self.raw) if self.raw else None
+            self._data = parsed if isinstance(parsed, dict) else {}
+        return self._data
+
+    @property
+    def body(self) -> str:
+        if self._body is None:
+            with open(self.path, "rb") as handle:
+                handle.seek(self._body_offset)
+                self._body = handle.read().decode("utf-8")
+        return self._body
+
+    @property
+    def text(self) -> str:
+        """The whole file, for checks that grep across front matter and body."""
+        if self.raw is None:
+            return self.body
+        return f"---\n{self.raw}\n---\n{self.body}"
+
+
+def _read_front_matter(path: Path) -> tuple[str | None, int]:
+    with open(path, "rb") as handle:
+        first = handle.readline()
+        if first.rstrip(b"\r\n") != b"---":
+            return None, 0
+        lines: list[bytes] = []
+        for line in iter(handle.readline, b""):
+            if line.strip() == b"---":
+                return b"".join(lines).decode("utf-8").rstrip("\r\n"), handle.tell()
+            lines.append(line)
+    # An unterminated fence is not front matter; treat the file as all body.
+    return None, 0
+
+
+def load(path: str | os.PathLike) -> Page:
+    """Return the cached `Page` for `path`, re-reading it only if the file changed."""
+    key = Path(path).resolve()
+    stat = key.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _cache.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    raw, offset = _read_front_matter(key)
+    page = Page(key, raw, offset)
+    _cache[key] = (stamp, page)
+    return page
+
+
+def clear_cache() -> None:
+    _cache.clear()
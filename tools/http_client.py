@@ -0,0 +1,162 @@
+"""Small pooled HTTP/1.1 client on asyncio streams, shared by the network tools.
+
+`request()` sends one request on a keep-alive connection from a
+`ConnectionPool`, at most `PER_HOST` at a time per (scheme, host, port), and
+retries once on a fresh connection when a pooled one turns out to have been
+closed by the server. Its timeout starts only once a per-host slot is free.
+It never follows redirects; callers decide which `Location` they trust.
+A response cut short raises `asyncio.IncompleteReadError`, which callers
+should treat like the other connection errors. `check_links.py` and `build_repo_status.py` both use it; it has no
+dependencies beyond the standard library.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+PER_HOST = 4
+TIMEOUT = 10.0
+USER_AGENT = "bseverns.github.io tools"
+
+
+class ConnectionPool:
+    """Idle keep-alive connections per (scheme, host, port)."""
+
+    def __init__(self) -> None:
+        self.idle: dict[tuple, list] = defaultdict(list)
+        self.limits: dict[tuple, asyncio.Semaphore] = {}
+        self.ssl = ssl.create_default_context()
+
+    def limit(self, key: tuple) -> asyncio.Semaphore:
+        if key not in self.limits:
+            self.limits[key] = asyncio.Semaphore(PER_HOST)
+        return self.limits[key]
+
+    async def acquire(self, key: tuple) -> tuple[tuple, bool]:
+        """Return `(connection, reused)`, preferring an idle keep-alive connection."""
+        while self.idle[key]:
+            reader, writer = self.idle[key].pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return (reader, writer), True
+        scheme, host, port = key
+        conn = await asyncio.open_connection(
+            host, port, ssl=self.ssl if scheme == "https" else None
+        )
+        return conn, False
+
+    def release(self, key: tuple, conn, reusable: bool) -> None:
+        if reusable:
+            self.idle[key].append(conn)
+        else:
+            conn[1].close()
+
+    def close(self) -> None:
+        for conns in self.idle.values():
+            for _, writer in conns:
+                writer.close()
+        self.idle.clear()
+
+
+async def _read_body(reader: asyncio.StreamReader, headers: dict[str, str]) -> bytes:
+    """Read the whole response body, which also frees the connection for reuse."""
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if not size:
+                # Skip (empty) trailers up to the blank line that ends the message.
+                while (await reader.readline()).strip():
+                    pass
+                return b"".join(chunks)
+            chunks.append((await reader.readexactly(size + 2))[:-2])
+    length = headers.get("content-length")
+    if length is not None:
+        return await reader.readexactly(int(length))
+    return await reader.read()
+
+
+class _StaleConnection(ConnectionError):
+    """A pooled keep-alive connection the server had already closed."""
+
+
+async def _exchange(
+    conn,
+    method: str,
+    target: str,
+    netloc: str,
+    extra: dict[str, str] | None = None,
+    read_body: bool = True,
+) -> tuple[int, dict[str, str], bytes, bool]:
+    """Send one request; without `read_body` the body is left unread and the connection isn't reused."""
+    reader, writer = conn
+    fields = {"User-Agent": USER_AGENT, "Accept": "*/*", **(extra or {}), "Connection": "keep-alive"}
+    writer.write(
+        f"{method} {target} HTTP/1.1\r\nHost: {netloc}\r\n".encode()
+        + "".join(f"{name}: {value}\r\n" for name, value in fields.items()).encode()
+        + b"\r\n"
+    )
+    await writer.drain()
+    status_line = await reader.readline()
+    if not status_line:
+        raise _StaleConnection("connection closed before a response")
+    version, status = status_line.decode("latin-1").split(" ", 2)[:2]
+    headers: dict[str, str] = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    status_code = int(status)
+    body = b""
+    reusable = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    if method != "HEAD" and status_code not in (204, 304):
+        if read_body:
+            body = await _read_body(reader, headers)
+        elif headers.get("content-length") != "0":
+            reusable = False
+    return status_code, headers, body, reusable
+
+
+async def request(
+    pool: ConnectionPool,
+    method: str,
+    url: str,
+    extra: dict[str, str] | None = None,
+    timeout: float | None = TIMEOUT,
+    read_body: bool = True,
+) -> tuple[int, dict[str, str], bytes]:
+    """One request on a pooled connection; `extra` adds or overrides request headers.
+
+    `timeout` starts once a per-host slot is free, so queueing behind other
+    requests to the same host never counts against it.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme
+    port = parts.port or (443 if scheme == "https" else 80)
+    key = (scheme, parts.hostname, port)
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
+
+    async def attempt() -> tuple[int, dict[str, str], bytes]:
+        while True:
+            conn, reused = await pool.acquire(key)
+            reusable = False
+            try:
+                status, headers, body, reusable = await _exchange(
+                    conn, method, target, parts.netloc, extra, read_body
+                )
+                return status, headers, body
+            except (_StaleConnection, ConnectionResetError, BrokenPipeError, asyncio.IncompleteReadError):
+                # An idle connection timed out server-side; retry on a fresh one.
+                if not reused:
+                    raise
+            finally:
+                pool.release(key, conn, reusable)
+
+    async with pool.limit(key):
+        return await asyncio.wait_for(attempt(), timeout)
@@ -0,0 +1,135 @@
+"""Named phase timers, per-item timings, and optional cProfile/tracemalloc capture.
+
+A `Profiler` is cheap enough to leave in place: a disabled one (the default)
+turns every call into a no-op. Tools keep one at module level, the way
+`build_sampler_pdf.raster_cache` is kept, and swap in an enabled one when
+`--profile` is passed:
+
+    with profiler.phase("load cards"):
+        cards = load_cards()
+    for card in cards:
+        with profiler.phase("flowables", item=card.id):
+            ...
+    print(profiler.summary())
+
+Phases nest: a phase opened inside another is recorded as `outer/inner`, and
+`add()` records a duration measured somewhere else (a worker process, say)
+under whatever phase is currently open. Items collect their own per-phase
+breakdown so the slowest card, file, or node shows up by name.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class Profiler:
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.items: dict[str, dict[str, float]] = {}
+        self._stack: list[str] = []
+
+    def _key(self, name: str) -> str:
+        return "/".join(self._stack + [name])
+
+    def add(self, name: str, seconds: float, item: str | None = None) -> None:
+        """Record `seconds` under `name` (nested in the open phase), and for `item` if given.
+
+        Durations reported by parallel workers add up, so a nested total can
+        exceed the wall time of the phase it sits in.
+        """
+        if not self.enabled:
+            return
+        key = self._key(name)
+        self.phases[key] = self.phases.get(key, 0.0) + seconds
+        if item is not None:
+            timings = self.items.setdefault(item, {})
+            timings[name] = timings.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str, item: str | None = None):
+        if not self.enabled:
+            yield
+            return
+        # Claim the slot on entry so parents list before the phases nested in them.
+        self.phases.setdefault(self._key(name), 0.0)
+        started = time.perf_counter()
+        self._stack.append(name)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            self.add(name, time.perf_counter() - started, item)
+
+    @contextmanager
+    def capture(self, cprofile_path: Path | None = None, tracemalloc_path: Path | None = None):
+        """Run the block under cProfile and/or tracemalloc and write what they saw.
+
+        The cProfile file is regular `pstats` output (`python -m pstats FILE`,
+        snakeviz, ...); the tracemalloc file lists the top allocation sites
+        and the peak.
+        """
+        profile = None
+        if cprofile_path is not None:
+            import cProfile
+
+            profile = cProfile.Profile()
+        if tracemalloc_path is not None:
+            import tracemalloc
+
+            tracemalloc.start(10)
+        if profile is not None:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+                Path(cprofile_path).parent.mkdir(parents=True, exist_ok=True)
+                profile.dump_stats(str(cprofile_path))
+            if tracemalloc_path is not None:
+                snapshot = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                lines = [f"peak traced memory: {peak / 1024 / 1024:.1f} MB", ""]
+                lines.extend(str(stat) for stat in snapshot.statistics("lineno")[:40])
+                Path(tracemalloc_path).parent.mkdir(parents=True, exist_ok=True)
+                Path(tracemalloc_path).write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def as_dict(self) -> dict:
+        return {
+            "wall": time.perf_counter() - self.started,
+            "phases": dict(self.phases),
+            "items": {item: dict(timings) for item, timings in self.items.items()},
+        }
+
+    def summary(self, top: int = 10, label: str = "item") -> str:
+        """A plain-text table: phases (indented by nesting), then the slowest items."""
+        if not self.enabled:
+            return ""
+        wall = time.perf_counter() - self.started
+        lines = [f"{'phase':<36} {'ms':>10} {'% wall':>7}"]
+        for key, seconds in self.phases.items():
+            depth = key.count("/")
+            name = "  " * depth + key.rsplit("/", 1)[-1]
+            lines.append(f"{name:<36} {seconds * 1000:10.1f} {seconds / wall * 100:6.1f}%")
+        lines.append(f"{'wall':<36} {wall * 1000:10.1f}")
+        if self.items:
+            columns = list(dict.fromkeys(name for timings in self.items.values() for name in timings))
+            ranked = sorted(self.items.items(), key=lambda entry: -sum(entry[1].values()))[:top]
+            lines.append("")
+            lines.append(
+                f"{'slowest ' + label + 's':<28}" + "".join(f" {col[:14]:>14}" for col in columns) + f" {'total ms':>10}"
+            )
+            for item, timings in ranked:
+                cells = "".join(f" {timings.get(col, 0.0) * 1000:14.1f}" for col in columns)
+                lines.append(f"{item[:28]:<28}{cells} {sum(timings.values()) * 1000:10.1f}")
+        return "\n".join(lines)
+
+
+# The default: every call is a no-op until a tool swaps in an enabled one.
+DISABLED = Profiler(enabled=False)
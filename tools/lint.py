@@ -1,23 +1,13 @@
 #!/usr/bin/env python3
 """Tiny linter for portfolio front matter and links."""
-import os, sys, re, yaml
+import argparse, sys, re
 
-ROOT = os.path.dirname(os.path.dirname(__file__))
+import parallel
+from site_model import Findings, SiteModel
 
-warnings = []
-errors = []
+LINK_RE = re.compile(r'\[(?:[^\]]+)\]\(([^)]+)\)')
 
-def parse_front_matter(path):
-    with open(path, 'r', encoding='utf-8') as f:
-        text = f.read()
-    if text.startswith('---'):
-        parts = text.split('---', 2)
-        fm = yaml.safe_load(parts[1]) or {}
-        body = parts[2]
-        return fm, body
-    return {}, text
-
-def check_item(path, data, is_project):
+def check_item(path, data, is_project, findings):
     missing = []
     for field in ['title', 'summary', 'featured']:
         if field not in data:
@@ -25,58 +15,84 @@ def check_item(path, data, is_project):
     if is_project and 'year' not in data:
         missing.append('year')
     if missing:
-        errors.append(f"{path}: missing {', '.join(missing)}")
+        findings.errors.append(f"{path}: missing {', '.join(missing)}")
     if 'hero' in data:
         if not data.get('hero_alt'):
-            warnings.append(f"{path}: hero_alt missing")
+            findings.warnings.append(f"{path}: hero_alt missing")
     elif data.get('gallery'):
         if not any(img.get('alt') for img in data['gallery']):
-            warnings.append(f"{path}: gallery images missing alt text")
+            findings.warnings.append(f"{path}: gallery images missing alt text")
     else:
-        errors.append(f"{path}: need hero or gallery with alt text")
+        findings.errors.append(f"{path}: need hero or gallery with alt text")
     if not data.get('summary'):
-        warnings.append(f"{path}: summary empty")
+        findings.warnings.append(f"{path}: summary empty")
     if not isinstance(data.get('featured'), bool):
-        warnings.append(f"{path}: featured should be true/false")
+        findings.warnings.append(f"{path}: featured should be true/false")
+
+def check_links(path, body, findings, site):
+    # resolve_link walks the tree once per run, then every check is a set lookup.
+    # It drops #anchors and ?queries and knows Jekyll permalinks; None = external.
+    for url in LINK_RE.findall(body):
+        url = url.strip().split(' ', 1)[0].strip('<>')
+        if site.resolve_link(url, path) is False:
+            findings.warnings.append(f"{path}: link not found -> {url}")
+
+FOLDERS = [('_projects', True), ('_teaching', False)]
 
-def check_links(path, body):
-    link_re = re.compile(r'\[(?:[^\]]+)\]\(([^)]+)\)')
-    for url in link_re.findall(body):
-        if url.startswith('http'):
-            continue
-        full = os.path.join(ROOT, url.lstrip('/'))
-        if not os.path.exists(full):
-            warnings.append(f"{path}: link not found -> {url}")
+def check_page(site, rel, is_project):
+    findings = Findings()
+    page = site.page(rel)
+    check_item(rel, page.data, is_project, findings)
+    check_links(rel, page.body, findings, site)
+    return findings
 
-for folder, is_proj in [('_projects', True), ('_teaching', False)]:
-    d = os.path.join(ROOT, folder)
-    if not os.path.isdir(d):
-        continue
-    for name in os.listdir(d):
-        if not name.endswith('.md'):
-            continue
-        p = os.path.join(d, name)
-        data, body = parse_front_matter(p)
-        check_item(p, data, is_proj)
-        check_links(p, body)
+def check_about(site):
+    # Check about page docs
+    findings = Findings()
+    if site.exists('about.md'):
+        for pdf in re.findall(r'/assets/docs/([^"\)]+)', site.text('about.md')):
+            if not site.exists(f'assets/docs/{pdf}'):
+                findings.warnings.append(f"about.md: missing document assets/docs/{pdf}")
+    return findings
 
-# Check about page docs
-about = os.path.join(ROOT, 'about.md')
-if os.path.exists(about):
-    text = open(about, encoding='utf-8').read()
-    for pdf in re.findall(r'/assets/docs/([^"\)]+)', text):
-        if not os.path.exists(os.path.join(ROOT, 'assets', 'docs', pdf)):
-            warnings.append(f"about.md: missing document assets/docs/{pdf}")
+def _check_unit(site, unit):
+    rel, is_proj = unit
+    return check_page(site, rel, is_proj)
 
-if errors:
-    print("Errors:")
-    for e in errors:
-        print(" -", e)
-    sys.exit(1)
+def run(site, jobs=None):
+    findings = Findings()
+    units = [(rel, is_proj) for folder, is_proj in FOLDERS for rel in site.glob(folder)]
+    if parallel.resolve_jobs(jobs) > 1:
+        # Build the permalink index once here so workers inherit it.
+        site.permalinks
+    for result in parallel.map_files(_check_unit, site, units, jobs):
+        findings.extend(result)
+    findings.extend(check_about(site))
+    return findings
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--watch', action='store_true',
+                        help='keep running and re-check only what changed after each save')
+    parser.add_argument('--jobs', type=parallel.jobs_count, default=None, help=parallel.JOBS_HELP)
+    args = parser.parse_args(argv)
+    if args.watch:
+        import watch
+        return watch.watch(checks=['lint'])
+    findings = run(SiteModel(), jobs=args.jobs)
+    if findings.errors:
+        print("Errors:")
+        for e in findings.errors:
+            print(" -", e)
+        return 1
+
+    if findings.warnings:
+        print("Warnings:")
+        for w in findings.warnings:
+            print(" -", w)
+    else:
+        print("All good")
+    return 0
 
-if warnings:
-    print("Warnings:")
-    for w in warnings:
-        print(" -", w)
-else:
-    print("All good")
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,67 +1,72 @@
 #!/usr/bin/env python3
-import os, sys, re, json
-
-ROOT = os.path.dirname(os.path.abspath(__file__)) + "/.."
-page = os.path.join(ROOT, "critical-digital-studies-sampler", "index.md")
-issues = []
-
-if not os.path.exists(page):
-    issues.append("Page missing: critical-digital-studies-sampler/index.md")
-
-# Check front matter flags
-fm = ""
-with open(page, "r", encoding="utf-8") as f:
-    txt = f.read()
-m = re.search(r"^---(.*?)---", txt, re.S | re.M)
-if m:
-    fm = m.group(1)
-else:
-    issues.append("No YAML front matter detected.")
-
-def has(k, v=None):
-    if not fm: return False
-    if v is None:
-        return re.search(rf"^{k}\s*:\s*", fm, re.M) is not None
-    return re.search(rf"^{k}\s*:\s*{re.escape(str(v))}\s*$", fm, re.M) is not None
-
-if not has("noindex", "true"):
-    issues.append("Front matter should include: noindex: true")
-if not has("sitemap", "false"):
-    issues.append("Front matter should include: sitemap: false")
-
-# Check that nav doesn't link it (if navigation data exists)
-nav_yml = os.path.join(ROOT, "_data", "navigation.yml")
-if os.path.exists(nav_yml):
-    with open(nav_yml, "r", encoding="utf-8") as f:
-        nav = f.read()
-    if "critical-digital-studies-sampler" in nav:
-        issues.append("Navigation contains a link to the hidden page; remove it from _data/navigation.yml")
-
-# Check assets existence
+import sys
+
+from site_model import Findings, SiteModel
+
+PAGE = "critical-digital-studies-sampler/index.md"
+
 # Core image assets should always be around so the gallery doesn’t ghost out.
-assets = [
+ASSETS = [
     "assets/images/cds/faceTimes-consent.png",
     "assets/images/cds/mn42-panel.jpg",
     "assets/images/cds/glitch-geometry-still.jpg",
     "assets/images/cds/ds200412-still.jpg",
 ]
-for a in assets:
-    if not os.path.exists(os.path.join(ROOT, a)):
-        issues.append(f"Missing asset placeholder: {a}")
 
 # The PDF bounced between two filenames as the sampler evolved. Accept either so
 # the lint stays flexible while still catching a missing download link.
-pdf_candidates = [
+PDF_CANDIDATES = [
     "assets/docs/Severns_CriticalDigitalStudies.pdf",
     "assets/docs/Severns_CriticalDigitalStudies_Sampler.pdf",
 ]
-if not any(os.path.exists(os.path.join(ROOT, p)) for p in pdf_candidates):
-    issues.append(
-        "Missing asset placeholder: assets/docs/Severns_CriticalDigitalStudies.pdf"
-    )
-
-if issues:
-    print("\nHidden page checks: FAIL\n- " + "\n- ".join(issues))
-    sys.exit(1)
-else:
+
+
+def run(site):
+    issues = []
+
+    fm = {}
+    if not site.exists(PAGE):
+        issues.append("Page missing: critical-digital-studies-sampler/index.md")
+    else:
+        # Check front matter flags
+        doc = site.page(PAGE)
+        if doc.has_front_matter:
+            fm = doc.data
+        else:
+            issues.append("No YAML front matter detected.")
+
+    # Parsed YAML values, the way Jekyll reads them: `noindex: "true"` is a string, not a flag.
+    if fm.get("noindex") is not True:
+        issues.append("Front matter should include: noindex: true")
+    if fm.get("sitemap") is not False:
+        issues.append("Front matter should include: sitemap: false")
+
+    # Check that nav doesn't link it (if navigation data exists)
+    if site.exists("_data/navigation.yml"):
+        if "critical-digital-studies-sampler" in site.text("_data/navigation.yml"):
+            issues.append("Navigation contains a link to the hidden page; remove it from _data/navigation.yml")
+
+    # Check assets existence
+    for a in ASSETS:
+        if not site.exists(a):
+            issues.append(f"Missing asset placeholder: {a}")
+
+    if not any(site.exists(p) for p in PDF_CANDIDATES):
+        issues.append(
+            "Missing asset placeholder: assets/docs/Severns_CriticalDigitalStudies.pdf"
+        )
+
+    return Findings(errors=issues)
+
+
+def main():
+    issues = run(SiteModel()).errors
+    if issues:
+        print("\nHidden page checks: FAIL\n- " + "\n- ".join(issues))
+        return 1
     print("Hidden page checks: PASS")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
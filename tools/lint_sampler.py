@@ -5,62 +5,29 @@ Checks front matter flags, card structure, nav leaks, and placeholder assets.
 If anything's off, we bail loud so the page never ships half-baked.
 """
 
-import os
-import re
 import sys
 
-import yaml
-
-# Repo root relative to this script; we stay portable when run from anywhere.
-ROOT = os.path.dirname(os.path.abspath(__file__)) + "/.."
+from site_model import Findings, SiteModel
 
 # Target page we obsess over.
-page = os.path.join(ROOT, "critical-digital-studies-sampler", "index.md")
-
-# Collect sins here and screech at the end.
-issues = []
-
-# Step 1: make sure the page exists before we start nitpicking.
-if not os.path.exists(page):
-    print("Missing page:", page)
-    sys.exit(1)
-
-txt = open(page, "r", encoding="utf-8").read()
-m = re.search(r"^---(.*?)---", txt, re.S | re.M)
-if not m:
-    issues.append("No YAML front matter.")
-else:
-    fm = m.group(1)
-
-    # Helper to sniff out keys and their values inside the front matter.
-    def has(k, v=None):
-        if v is None:
-            return re.search(rf"^{k}\s*:\s*", fm, re.M)
-        return re.search(rf"^{k}\s*:\s*{re.escape(v)}\s*$", fm, re.M)
-
-    # The page must shout "noindex" and bail from the sitemap.
-    if not has("noindex", "true"):
-        issues.append("Front matter must include: noindex: true")
-    if not has("sitemap", "false"):
-        issues.append("Front matter must include: sitemap: false")
-
-    # Version stamp makes it obvious when the page was last touched.
-    if not has("updated"):
-        issues.append("Front matter missing: updated (YYYY-MM-DD)")
-
-# Check that the page actually loops over the include.
-if "{% include cds-card.html" not in txt:
-    issues.append("Sampler page should include cds-card.html for rendering cards.")
-if "site.data.cds.cards" not in txt:
-    issues.append("Sampler page should reference site.data.cds.cards.")
-
-# Load card data from YAML so we can lint the actual source of truth.
-data_path = os.path.join(ROOT, "_data", "cds.yml")
-if not os.path.exists(data_path):
-    issues.append("Missing _data/cds.yml for sampler data.")
-else:
-    data = yaml.safe_load(open(data_path, "r", encoding="utf-8").read()) or {}
-    cards = data.get("cards", [])
+PAGE = "critical-digital-studies-sampler/index.md"
+
+# Placeholder assets the gallery leans on.
+ASSETS = [
+    "assets/images/cds/faceTimes-consent.svg",
+    "assets/images/cds/mn42-panel.svg",
+    "assets/images/cds/glitch-geometry-still.svg",
+    "assets/images/cds/ds200412-still.svg",
+]
+
+PDF_CANDIDATES = [
+    "assets/docs/Severns_CriticalDigitalStudies.pdf",
+    "assets/docs/Severns_CriticalDigitalStudies_Sampler.pdf",
+]
+
+
+def check_cards(cards, issues):
+    """Lint the card data itself, since that's the source of truth."""
     if len(cards) < 4:
         issues.append(f"Expected ≥4 cards in data, found {len(cards)}.")
     for i, card in enumerate(cards, 1):
@@ -88,32 +55,69 @@ else:
                 issues.append(f"Card {i}: link '{link.get('label', 'unknown')}' missing URL.")
 
 
-# Ensure it's not in nav (if navigation data exists).
-nav = os.path.join(ROOT, "_data", "navigation.yml")
-if os.path.exists(nav):
-    if "critical-digital-studies-sampler" in open(nav, "r", encoding="utf-8").read():
-        issues.append("Hidden page is referenced in _data/navigation.yml; remove the link.")
-
-# Check placeholder assets exist.
-assets = [
-    "assets/images/cds/faceTimes-consent.svg",
-    "assets/images/cds/mn42-panel.svg",
-    "assets/images/cds/glitch-geometry-still.svg",
-    "assets/images/cds/ds200412-still.svg",
-]
-for a in assets:
-    if not os.path.exists(os.path.join(ROOT, a)):
-        issues.append(f"Missing asset: {a}")
-
-pdf_candidates = [
-    "assets/docs/Severns_CriticalDigitalStudies.pdf",
-    "assets/docs/Severns_CriticalDigitalStudies_Sampler.pdf",
-]
-if not any(os.path.exists(os.path.join(ROOT, p)) for p in pdf_candidates):
-    issues.append("Missing asset: assets/docs/Severns_CriticalDigitalStudies.pdf")
-
-if issues:
-    print("Sampler checks: FAIL\n- " + "\n- ".join(issues))
-    sys.exit(1)
-
-print("Sampler checks: PASS")
+def run(site):
+    # Collect sins here and screech at the end.
+    issues = []
+
+    # Step 1: make sure the page exists before we start nitpicking.
+    if not site.exists(PAGE):
+        return Findings(errors=[f"Missing page: {PAGE}"])
+
+    doc = site.page(PAGE)
+    txt = doc.body
+    if not doc.has_front_matter:
+        issues.append("No YAML front matter.")
+    else:
+        fm = doc.data
+
+        # The page must shout "noindex" and bail from the sitemap. Flags are
+        # judged as parsed YAML values, the way Jekyll reads them.
+        if fm.get("noindex") is not True:
+            issues.append("Front matter must include: noindex: true")
+        if fm.get("sitemap") is not False:
+            issues.append("Front matter must include: sitemap: false")
+
+        # Version stamp makes it obvious when the page was last touched.
+        if "updated" not in fm:
+            issues.append("Front matter missing: updated (YYYY-MM-DD)")
+
+    # Check that the page actually loops over the include.
+    if "{% include cds-card.html" not in txt:
+        issues.append("Sampler page should include cds-card.html for rendering cards.")
+    if "site.data.cds.cards" not in txt:
+        issues.append("Sampler page should reference site.data.cds.cards.")
+
+    # Load card data from YAML so we can lint the actual source of truth.
+    if not site.exists("_data/cds.yml"):
+        issues.append("Missing _data/cds.yml for sampler data.")
+    else:
+        data = site.yaml("_data/cds.yml") or {}
+        check_cards(data.get("cards", []), issues)
+
+    # Ensure it's not in nav (if navigation data exists).
+    if site.exists("_data/navigation.yml"):
+        if "critical-digital-studies-sampler" in site.text("_data/navigation.yml"):
+            issues.append("Hidden page is referenced in _data/navigation.yml; remove the link.")
+
+    # Check placeholder assets exist.
+    for a in ASSETS:
+        if not site.exists(a):
+            issues.append(f"Missing asset: {a}")
+
+    if not any(site.exists(p) for p in PDF_CANDIDATES):
+        issues.append("Missing asset: assets/docs/Severns_CriticalDigitalStudies.pdf")
+
+    return Findings(errors=issues)
+
+
+def main():
+    issues = run(SiteModel()).errors
+    if issues:
+        print("Sampler checks: FAIL\n- " + "\n- ".join(issues))
+        return 1
+    print("Sampler checks: PASS")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,10 +3,18 @@
 
 from __future__ import annotations
 
+import argparse
 import re
 import sys
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
 
+import instrument
+import parallel
+import site_data
+from site_model import Findings, SiteModel
+
 
 ROOT = Path(__file__).resolve().parent.parent
 DIAGRAM_DIR = ROOT / "docs" / "visual-system" / "diagrams"
@@ -47,43 +55,191 @@ PAGE_REFERENCES = {
 }
 
 
-def main() -> int:
+PERMALINK_RE = re.compile(r'permalink:\s*("?)([^"\n]+)\1')
+RELATED_RE = re.compile(r'(?:-|url:)\s*"(/atlas/n/[^"]+/)"')
+
+
+@dataclass
+class AtlasIndex:
+    """Permalink lookups for every atlas node, built from one pass over `_nodes`."""
+
+    permalinks: dict[str, str] = field(default_factory=dict)
+    related: dict[str, list[str]] = field(default_factory=dict)
+    inbound: dict[str, set[str]] = field(default_factory=dict)
+    node_permalinks: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, site: SiteModel, jobs: int | None = None) -> "AtlasIndex":
+        index = cls()
+        node_paths = site.glob(site.rel(NODE_DIR))
+        scans = parallel.map_files(_scan_node_file, site, node_paths, jobs)
+        for node_path, (url, links) in zip(node_paths, scans):
+            index.add_scanned(node_path, url, links)
+        return index
+
+    def add(self, node_path: str, text: str) -> None:
+        self.add_scanned(node_path, *scan_node(text))
+
+    def add_scanned(self, node_path: str, url: str | None, links: list[str]) -> None:
+        if url is not None:
+            self.node_permalinks[node_path] = url
+            # First node (in sorted order) wins, matching the old glob-order lookup.
+            owner = self.permalinks.get(url)
+            if owner is None or node_path < owner:
+                self.permalinks[url] = node_path
+        self.related[node_path] = links
+        for link in links:
+            self.inbound.setdefault(link, set()).add(node_path)
+
+    def remove(self, node_path: str) -> None:
+        """Forget a node so it can be re-added after an edit (or stay gone after a delete)."""
+        url = self.node_permalinks.pop(node_path, None)
+        if url is not None and self.permalinks.get(url) == node_path:
+            del self.permalinks[url]
+            others = sorted(path for path, link in self.node_permalinks.items() if link == url)
+            if others:
+                self.permalinks[url] = others[0]
+        for link in self.related.pop(node_path, []):
+            sources = self.inbound.get(link)
+            if sources is not None:
+                sources.discard(node_path)
+                if not sources:
+                    del self.inbound[link]
+
+    def referrers(self, url: str) -> set[str]:
+        """Nodes whose related links point at `url`."""
+        return set(self.inbound.get(url, ()))
+
+    def exists(self, url: str) -> bool:
+        return url in self.permalinks
+
+    def dangling(self) -> list[tuple[str, str]]:
+        """Every (node, related url) pair whose target permalink is missing."""
+        return [
+            (node_path, url)
+            for node_path, links in self.related.items()
+            for url in links
+            if url not in self.permalinks
+        ]
+
+    def orphans(self, extra_inbound: Iterable[str] = ()) -> list[str]:
+        """Nodes nobody links to, ignoring a node's links to itself."""
+        linked = set(extra_inbound)
+        for url, sources in self.inbound.items():
+            target = self.permalinks.get(url)
+            if any(source != target for source in sources):
+                linked.add(url)
+        return sorted(path for url, path in self.permalinks.items() if url not in linked)
+
+
+def scan_node(text: str) -> tuple[str | None, list[str]]:
+    """Pull a node's permalink and its related atlas links out of its source."""
+    match = PERMALINK_RE.search(text)
+    return (match.group(2).strip() if match else None), RELATED_RE.findall(text)
+
+
+def _scan_node_file(site: SiteModel, node_path: str) -> tuple[str | None, list[str]]:
+    return scan_node(site.text(node_path))
+
+
+def check_diagrams(site: SiteModel) -> list[str]:
     failures: list[str] = []
-
-    diagram_paths = {path.name: path for path in DIAGRAM_DIR.glob("*.md")}
+    diagram_dir = site.rel(DIAGRAM_DIR)
+    diagram_paths = {Path(rel).name: rel for rel in site.glob(diagram_dir)}
     for name in sorted(REQUIRED_DIAGRAMS):
-        path = diagram_paths.get(name)
-        if not path or not path.is_file():
+        rel = diagram_paths.get(name)
+        if not rel:
             failures.append(f"missing diagram source: docs/visual-system/diagrams/{name}")
             continue
-        text = path.read_text()
-        if "```mermaid" not in text:
-            failures.append(f"diagram source lacks Mermaid block: {path.relative_to(ROOT)}")
+        if "```mermaid" not in site.text(rel):
+            failures.append(f"diagram source lacks Mermaid block: {rel}")
 
     for page_name, refs in PAGE_REFERENCES.items():
-        page_path = ROOT / page_name
-        text = page_path.read_text()
+        text = site.text(page_name)
         for ref in refs:
             if ref not in text:
                 failures.append(f"{page_name} is missing diagram reference: {ref}")
-
-    fleet_text = (ROOT / "_data" / "fleet.yml").read_text()
-    urls = re.findall(r'url:\s*"([^"]+)"', fleet_text)
-    for url in urls:
-        if not atlas_url_exists(url):
-            failures.append(f"fleet entry points to missing atlas permalink: {url}")
-
-    for node_path in sorted(NODE_DIR.glob("*.md")):
-        text = node_path.read_text()
-        for related in re.findall(r'-\s*"(/atlas/n/[^"]+/)"', text):
-            if not atlas_url_exists(related):
-                failures.append(
-                    f"{node_path.relative_to(ROOT)} references missing related atlas permalink: {related}"
-                )
-
-    if failures:
+    return failures
+
+
+def fleet_urls(site: SiteModel) -> list[str]:
+    groups = site_data.fleet_groups(site.yaml("_data/fleet.yml"))
+    return [item.url for group in groups for item in group.items if item.url]
+
+
+def check_fleet(urls: list[str], index: AtlasIndex) -> list[str]:
+    return [
+        f"fleet entry points to missing atlas permalink: {url}"
+        for url in urls
+        if not index.exists(url)
+    ]
+
+
+def check_node(node_path: str, index: AtlasIndex) -> list[str]:
+    return [
+        f"{node_path} references missing related atlas permalink: {related}"
+        for related in index.related.get(node_path, [])
+        if not index.exists(related)
+    ]
+
+
+def orphan_notes(index: AtlasIndex, urls: list[str]) -> list[str]:
+    # Orphans are worth knowing about but are not a failure: plenty of nodes
+    # are reached from atlas listing pages rather than from each other.
+    orphans = index.orphans(extra_inbound=urls)
+    if not orphans:
+        return []
+    notes = [f"{len(orphans)} atlas node(s) have no fleet or related inbound links"]
+    notes.extend(f"orphan: {node_path}" for node_path in orphans)
+    return notes
+
+
+def run(
+    site: SiteModel,
+    list_orphans: bool = False,
+    jobs: int | None = None,
+    profiler: instrument.Profiler = instrument.DISABLED,
+) -> Findings:
+    """Run the visual-system checks; `check_all.py --profile` passes its profiler for phase timings."""
+    with profiler.phase("diagrams"):
+        findings = Findings(errors=check_diagrams(site))
+    with profiler.phase("atlas index"):
+        index = AtlasIndex.build(site, jobs)
+    with profiler.phase("links"):
+        urls = fleet_urls(site)
+        findings.errors.extend(check_fleet(urls, index))
+        for node_path, related in index.dangling():
+            findings.errors.append(
+                f"{node_path} references missing related atlas permalink: {related}"
+            )
+    if list_orphans:
+        with profiler.phase("orphans"):
+            findings.notes.extend(orphan_notes(index, urls))
+    return findings
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--orphans",
+        action="store_true",
+        help="list atlas nodes with no fleet or related inbound links",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=parallel.jobs_count,
+        default=None,
+        help=parallel.JOBS_HELP,
+    )
+    args = parser.parse_args(argv)
+    findings = run(SiteModel(ROOT), list_orphans=args.orphans, jobs=args.jobs)
+
+    for note in findings.notes:
+        print(f"note: {note}")
+
+    if findings.errors:
         print("visual-system lint failed:\n")
-        for failure in failures:
+        for failure in findings.errors:
             print(f"- {failure}")
         return 1
 
@@ -91,14 +247,5 @@ def main() -> int:
     return 0
 
 
-def atlas_url_exists(url: str) -> bool:
-    for node_path in NODE_DIR.glob("*.md"):
-        text = node_path.read_text()
-        match = re.search(r'permalink:\s*("?)([^"\n]+)\1', text)
-        if match and match.group(2).strip() == url:
-            return True
-    return False
-
-
 if __name__ == "__main__":
     sys.exit(main())
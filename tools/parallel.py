@@ -0,0 +1,70 @@
+"""Fan file-level lint work out across processes with stable output order.
+
+`map_files(func, site, items, jobs)` calls `func(site, item)` for every item
+and returns the results in the same order as `items`, whatever order the
+workers finish in. Each worker gets its own `SiteModel` seeded with the
+parent's file index (and permalink index, if it was already built) so the
+tree is walked once, not once per process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from site_model import SiteModel
+
+# Below this many items per worker the pool costs more than it saves.
+MIN_ITEMS_PER_JOB = 8
+# Shared `--jobs` help, so every tool says when it quietly stays serial.
+JOBS_HELP = (
+    "shard file-level checks across processes (0 = one per CPU; default: serial); "
+    f"runs serially anyway when there are fewer than {MIN_ITEMS_PER_JOB} files per process"
+)
+
+_worker_site: SiteModel | None = None
+
+
+def jobs_count(value: str) -> int:
+    """argparse `type=` for `--jobs`: a whole number, 0 or more."""
+    try:
+        jobs = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a whole number: {value!r}") from None
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 (one per CPU) or more, not {jobs}")
+    return jobs
+
+
+def resolve_jobs(jobs: int | None) -> int:
+    """`None`/1 mean serial; 0 means one job per CPU."""
+    if jobs is not None and jobs < 0:
+        raise ValueError(f"jobs must be 0 or more, not {jobs}")
+    if not jobs:
+        return 1 if jobs is None else (os.cpu_count() or 1)
+    return jobs
+
+
+def _init_worker(state: dict) -> None:
+    global _worker_site
+    _worker_site = SiteModel.from_state(state)
+
+
+def _call(func, item):
+    return func(_worker_site, item)
+
+
+def map_files(func, site: SiteModel, items: list, jobs: int | None = None) -> list:
+    """`func(site, item)` for each item, in order; serial when `items` can't keep `jobs` workers busy."""
+    jobs = resolve_jobs(jobs)
+    if jobs == 1 or len(items) < jobs * MIN_ITEMS_PER_JOB:
+        return [func(site, item) for item in items]
+    chunksize = max(1, len(items) // (jobs * 4))
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(site.state(),),
+    ) as pool:
+        return list(pool.map(partial(_call, func), items, chunksize=chunksize))
@@ -0,0 +1,244 @@
+"""Shared YAML loading for `_data/` and friends.
+
+`parse()` uses libyaml's `CSafeLoader` when PyYAML was built with it and the
+pure-Python `SafeLoader` otherwise; the results are the same. `loads()` and
+`load()` also keep parsed results on disk under `<root>/.cache/yaml/` of the
+tree being processed, pickled and named for the source file plus a hash of
+its text, so a tool starting cold pays for a file read and an unpickle rather
+than a parse. Each source keeps only its latest entry, and `prune()` drops
+entries for files that are gone, so the cache stays one file per YAML source.
+Pickle rather than marshal because YAML hands back `datetime.date` for
+unquoted dates. `load()` additionally memoizes per path (revalidated by mtime
+and size) within a process.
+
+The typed accessors (`fleet`, `studio_routes`, `legacy_works`, `cds_cards`)
+turn the `_data/` files into dataclasses, so callers stop scraping YAML with
+regexes or guessing at keys. Fields the dataclass doesn't name are kept in
+`extra`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from dataclasses import MISSING, dataclass, field, fields
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+import yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_REL = ".cache/yaml"
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Bumped whenever the pickled shape could change (a PyYAML upgrade, say).
+_CACHE_VERSION = f"1:{yaml.__version__}:{Loader.__name__}"
+_memo: dict[Path, tuple[tuple[int, int], object]] = {}
+
+
+def parse(text: str):
+    return yaml.load(text, Loader=Loader)
+
+
+def cache_dir(root: Path = ROOT) -> Path:
+    return Path(root) / CACHE_REL
+
+
+def _entry_prefix(source: str) -> str:
+    # The repo-relative source path, escaped into one file name so `prune` can read it back.
+    return quote(source, safe="") + "."
+
+
+def _glob_escape(text: str) -> str:
+    return "".join(f"[{char}]" if char in "*?[" else char for char in text)
+
+
+def loads(text: str, cache_dir: Path | None = None, source: str | None = None):
+    """Parse `text`, reusing a pickled result from `cache_dir` when `source` last had this text.
+
+    `source` is the repo-relative path the text came from; without it (or
+    without `cache_dir`) nothing is cached, since there'd be no way to retire
+    the entry once the file changes.
+    """
+    if cache_dir is None or source is None:
+        return parse(text)
+    prefix = _entry_prefix(source)
+    digest = hashlib.sha256(f"{_CACHE_VERSION}\0{text}".encode()).hexdigest()[:16]
+    path = cache_dir / f"{prefix}{digest}.pickle"
+    try:
+        with open(path, "rb") as handle:
+            return pickle.load(handle)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        pass
+    data = parse(text)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as handle:
+            pickle.dump(data, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(path)
+        # The source's earlier versions can never be asked for again.
+        for old in cache_dir.glob(f"{_glob_escape(prefix)}*.pickle"):
+            if old != path and old.name[len(prefix):].count(".") == 1:
+                old.unlink(missing_ok=True)
+    except OSError:
+        # A read-only checkout still parses fine; it just doesn't get faster.
+        pass
+    return data
+
+
+def prune(root: Path = ROOT) -> int:
+    """Delete cache entries whose source file no longer exists under `root`; return how many."""
+    directory = cache_dir(root)
+    if not directory.is_dir():
+        return 0
+    removed = 0
+    for path in directory.iterdir():
+        if path.suffix == ".tmp":
+            # Another process may be mid-write.
+            continue
+        source = path.name.rpartition(".")[0].rpartition(".")[0]
+        if path.suffix == ".pickle" and source and (Path(root) / unquote(source)).is_file():
+            continue
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+
+def load(path: Path, root: Path = ROOT):
+    """Parsed contents of the YAML file at `path`, cached under `root` when it lives there."""
+    path = Path(path).resolve()
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _memo.get(path)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    root = Path(root).resolve()
+    source = path.relative_to(root).as_posix() if path.is_relative_to(root) else None
+    data = loads(path.read_text(encoding="utf-8"), cache_dir(root), source)
+    _memo[path] = (stamp, data)
+    return data
+
+
+def clear_cache() -> None:
+    """Forget the in-process memo (on-disk entries are keyed by content and never stale)."""
+    _memo.clear()
+
+
+def _build(cls, entry: dict):
+    """`cls` from a YAML mapping; unknown keys land in `extra`.
+
+    `key:` with nothing after it parses as None, which falls back to the field's
+    default; a list or mapping field also treats any other empty value as empty.
+    """
+    specs = {f.name: f for f in fields(cls) if f.name != "extra"}
+    known = {}
+    for key, value in entry.items():
+        spec = specs.get(key)
+        if spec is None:
+            continue
+        if spec.default_factory is not MISSING and not value:
+            value = spec.default_factory()
+        elif value is None and spec.default is not MISSING:
+            value = spec.default
+        known[key] = value
+    return cls(**known, extra={key: value for key, value in entry.items() if key not in specs})
+
+
+@dataclass
+class FleetItem:
+    title: str
+    url: str | None = None
+    repo: str | None = None
+    why: str | None = None
+    relates: str | None = None
+    extra: dict = field(default_factory=dict)
+
+
+@dataclass
+class FleetGroup:
+    title: str
+    summary: str | None = None
+    items: list[FleetItem] = field(default_factory=list)
+    extra: dict = field(default_factory=dict)
+
+
+@dataclass
+class StudioRoute:
+    id: str
+    title: str
+    url: str
+    eyebrow: str | None = None
+    image: str | None = None
+    image_alt: str | None = None
+    summary: str | None = None
+    external: bool = False
+    extra: dict = field(default_factory=dict)
+
+
+@dataclass
+class LegacyWork:
+    id: str
+    title: str
+    branch: str | None = None
+    order: int = 0
+    medium: str | None = None
+    status: str | None = None
+    archive_url: str | None = None
+    thumbnail: str | None = None
+    images: list[str] = field(default_factory=list)
+    summary: str | None = None
+    lineage_note: str | None = None
+    catalog_record: str | None = None
+    extra: dict = field(default_factory=dict)
+
+
+@dataclass
+class CdsCard:
+    id: str = ""
+    title: str = ""
+    img_src: str | None = None
+    img_alt: str | None = None
+    abstract: str | None = None
+    abstract_locked: bool = False
+    aligns: list[str] = field(default_factory=list)
+    methods: list[str] = field(default_factory=list)
+    outcomes: list[str] = field(default_factory=list)
+    teach: dict = field(default_factory=dict)
+    links: list[dict] = field(default_factory=list)
+    extra: dict = field(default_factory=dict)
+
+
+def _entries(value) -> list[dict]:
+    return [entry for entry in value or [] if isinstance(entry, dict)]
+
+
+def fleet_groups(data) -> list[FleetGroup]:
+    """Groups from already-parsed `fleet.yml` data (e.g. `SiteModel.yaml()`)."""
+    groups = []
+    for entry in _entries((data or {}).get("satellite_groups")):
+        group = _build(FleetGroup, {key: value for key, value in entry.items() if key != "items"})
+        group.items = [_build(FleetItem, item) for item in _entries(entry.get("items"))]
+        groups.append(group)
+    return groups
+
+
+def fleet(root: Path = ROOT) -> list[FleetGroup]:
+    return fleet_groups(load(root / "_data/fleet.yml", root))
+
+
+def studio_routes(root: Path = ROOT) -> list[StudioRoute]:
+    return [_build(StudioRoute, entry) for entry in _entries(load(root / "_data/studio_routes.yml", root))]
+
+
+def legacy_works(root: Path = ROOT) -> list[LegacyWork]:
+    """Legacy works in display order."""
+    works = [_build(LegacyWork, entry) for entry in _entries(load(root / "_data/legacy_works.yml", root))]
+    return sorted(works, key=lambda work: work.order)
+
+
+def cds_cards(root: Path = ROOT) -> list[CdsCard]:
+    data = load(root / "_data/cds.yml", root) or {}
+    return [_build(CdsCard, entry) for entry in _entries(data.get("cards"))]
@@ -0,0 +1,257 @@
+"""In-memory view of the repo that the lint checks share.
+
+Each file is read (and each YAML file parsed) at most once per `SiteModel`,
+so running every check in one process costs one pass over the tree instead
+of one per script.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import posixpath
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+import front_matter
+import site_data
+
+ROOT = Path(__file__).resolve().parent.parent
+# Never part of the published site, so never worth walking.
+WALK_SKIP = {".git", "_site", ".cache", ".venv", "venv", "__pycache__"}
+PAGE_SUFFIXES = (".md", ".markdown", ".html")
+
+
+@dataclass
+class Findings:
+    """What a check found. Errors fail the run; warnings and notes are printed."""
+
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    notes: list[str] = field(default_factory=list)
+
+    def extend(self, other: "Findings") -> None:
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+        self.notes.extend(other.notes)
+
+
+class SiteModel:
+    """Memoized file access rooted at the repo (or a fixture tree in tests)."""
+
+    def __init__(self, root: Path = ROOT) -> None:
+        self.root = Path(root)
+        self._text: dict[str, str] = {}
+        self._yaml: dict[str, object] = {}
+        self._json: dict[str, object] = {}
+        self._exists: dict[str, bool] = {}
+        self._listings: dict[tuple[str, str], list[str]] = {}
+        self._files: set[str] | None = None
+        self._dirs: set[str] | None = None
+        self._permalinks: set[str] | None = None
+        self._yaml_cache = site_data.cache_dir(self.root)
+
+    def state(self) -> dict:
+        """Picklable snapshot of the indexes, for seeding worker processes."""
+        return {
+            "root": str(self.root),
+            "files": self.files,
+            "dirs": self._dirs,
+            "permalinks": self._permalinks,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "SiteModel":
+        site = cls(Path(state["root"]))
+        site._files = state["files"]
+        site._dirs = state["dirs"]
+        site._permalinks = state["permalinks"]
+        return site
+
+    def path(self, rel: str) -> Path:
+        return self.root / rel.lstrip("/")
+
+    def rel(self, path: Path) -> str:
+        return Path(path).relative_to(self.root).as_posix()
+
+    def exists(self, rel: str) -> bool:
+        if self._files is not None:
+            rel = rel.strip("/")
+            return rel in self._files or rel in self._dirs or rel == ""
+        if rel not in self._exists:
+            self._exists[rel] = self.path(rel).exists()
+        return self._exists[rel]
+
+    @property
+    def files(self) -> set[str]:
+        """Every repo file as a relative posix path, from one scandir walk."""
+        if self._files is None:
+            self._walk()
+        return self._files
+
+    def _walk(self) -> None:
+        files: set[str] = set()
+        dirs: set[str] = set()
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            with os.scandir(self.root / rel_dir) as entries:
+                for entry in entries:
+                    rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in WALK_SKIP:
+                            dirs.add(rel)
+                            stack.append(rel)
+                    else:
+                        files.add(rel)
+        self._files, self._dirs = files, dirs
+
+    def _collection_permalinks(self) -> dict[str, str]:
+        config = self.yaml("_config.yml") if "_config.yml" in self.files else None
+        collections = (config or {}).get("collections") or {}
+        return {
+            f"_{name}": spec["permalink"]
+            for name, spec in collections.items()
+            if isinstance(spec, dict) and spec.get("output") and spec.get("permalink")
+        }
+
+    def url_for(self, rel: str, collections: dict[str, str] | None = None) -> str | None:
+        """Output URL path (no leading/trailing slash) of a Jekyll page, or None if it isn't one.
+
+        Front matter `permalink:` wins, then the collection permalink pattern
+        from `_config.yml`, then Jekyll's default `dir/name.md -> /dir/name.html`.
+        """
+        if not rel.endswith(PAGE_SUFFIXES) or "node_modules" in rel.split("/"):
+            return None
+        if collections is None:
+            collections = self._collection_permalinks()
+        top = rel.split("/", 1)[0]
+        if top.startswith("_") and top not in collections:
+            return None
+        page = self.page(rel)
+        if not page.has_front_matter:
+            return None
+        permalink = page.data.get("permalink")
+        stem = posixpath.splitext(rel)[0]
+        if not permalink and top in collections:
+            permalink = collections[top].replace(":name", posixpath.basename(stem))
+        if permalink:
+            return str(permalink).strip("/")
+        if posixpath.basename(stem) == "index":
+            return posixpath.dirname(stem)
+        return stem + ".html"
+
+    @property
+    def permalinks(self) -> set[str]:
+        """Output URLs (see `url_for`) of every Jekyll page in the tree, built on first use."""
+        if self._permalinks is None:
+            collections = self._collection_permalinks()
+            urls = (self.url_for(rel, collections) for rel in self.files)
+            self._permalinks = {url for url in urls if url is not None}
+        return self._permalinks
+
+    def link_targets(self, url: str, from_rel: str = "") -> list[str] | None:
+        """Repo paths (or page URLs) a local link could mean, in the order `resolve_link` tries them.
+
+        Query strings and fragments are ignored; a bare `#anchor` gives `[]`.
+        Returns None for links this can't judge: external schemes,
+        protocol-relative URLs, and Liquid tags.
+        """
+        parts = urlsplit(url)
+        if parts.scheme or parts.netloc or "{{" in url or "{%" in url:
+            return None
+        path = unquote(parts.path)
+        if not path:
+            return []
+        if path.startswith("/"):
+            candidates = [path.strip("/")]
+        else:
+            base = posixpath.dirname(from_rel)
+            candidates = [posixpath.normpath(posixpath.join(base, path)), path.strip("/")]
+        targets = [target.strip("/") for target in candidates]
+        return [target for target in dict.fromkeys(targets) if not target.startswith("..")]
+
+    def resolve_link(self, url: str, from_rel: str = "") -> bool | None:
+        """Whether a local link target exists in the source tree or as a page URL.
+
+        Query strings and fragments are ignored. Returns None for links this
+        can't judge: external schemes, protocol-relative URLs, and Liquid tags.
+        """
+        targets = self.link_targets(url, from_rel)
+        if targets is None:
+            return None
+        if not targets and not urlsplit(url).path:
+            # A bare `#anchor` or `?query` points back at the same page.
+            return True
+        for target in targets:
+            if self.exists(target):
+                return True
+            if target in self.permalinks:
+                return True
+            if target.endswith(".html") and target[: -len(".html")] in self.permalinks:
+                return True
+        return False
+
+    def text(self, rel: str) -> str:
+        if rel not in self._text:
+            self._text[rel] = self.path(rel).read_text(encoding="utf-8")
+        return self._text[rel]
+
+    def yaml(self, rel: str):
+        if rel not in self._yaml:
+            self._yaml[rel] = site_data.loads(self.text(rel), self._yaml_cache, rel)
+        return self._yaml[rel]
+
+    def json(self, rel: str):
+        if rel not in self._json:
+            self._json[rel] = json.loads(self.text(rel))
+        return self._json[rel]
+
+    def is_file(self, rel: str) -> bool:
+        """Whether `rel` is a file, answered from the one-walk index rather than a stat."""
+        return rel.strip("/") in self.files
+
+    def page(self, rel: str) -> front_matter.Page:
+        return front_matter.load(self.path(rel))
+
+    def invalidate(self, rel: str) -> None:
+        """Drop everything cached about `rel` after it changed on disk."""
+        self._text.pop(rel, None)
+        self._yaml.pop(rel, None)
+        self._json.pop(rel, None)
+        self._exists.pop(rel, None)
+        # Adds and deletes change directory listings; they're cheap to redo.
+        self._listings.clear()
+        if self._files is not None:
+            path = self.path(rel)
+            if path.is_file():
+                self._files.add(rel)
+            else:
+                self._files.discard(rel)
+            if path.is_dir():
+                self._dirs.add(rel)
+            elif rel in self._dirs:
+                # A deleted folder takes everything under it along.
+                prefix = rel + "/"
+                self._dirs = {d for d in self._dirs if d != rel and not d.startswith(prefix)}
+                self._files = {f for f in self._files if not f.startswith(prefix)}
+            # Adding a file can create its folders; deleting one can take them away.
+            parent = posixpath.dirname(rel)
+            while parent:
+                if self.path(parent).is_dir():
+                    self._dirs.add(parent)
+                else:
+                    self._dirs.discard(parent)
+                parent = posixpath.dirname(parent)
+        if rel.endswith(PAGE_SUFFIXES) or rel == "_config.yml":
+            self._permalinks = None
+
+    def glob(self, folder: str, pattern: str = "*.md") -> list[str]:
+        """Sorted repo-relative paths matching `pattern` directly inside `folder`."""
+        key = (folder, pattern)
+        if key not in self._listings:
+            base = self.path(folder)
+            matches = sorted(base.glob(pattern)) if base.is_dir() else []
+            self._listings[key] = [self.rel(p) for p in matches if p.is_file()]
+        return self._listings[key]
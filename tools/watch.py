@@ -0,0 +1,244 @@
+"""Watch mode for the lints: re-check only what a save could have changed.
+
+Every check is split into small units (one per project/teaching page, one per
+atlas node, one for the diagrams, ...). Results are kept per unit, along with
+the files each unit read. When the poller sees files change it drops them from
+the `SiteModel`, patches the atlas index in place, and re-runs just the units
+that depend on those files. Touching a node re-checks every node whose
+`related` links point at its old or new permalink, and a page gaining or
+losing a permalink re-checks every page that links to it.
+"""
+
+from __future__ import annotations
+
+import os
+import posixpath
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import lint
+import lint_hidden_page
+import lint_sampler
+import lint_visual_system as visual
+from site_model import PAGE_SUFFIXES, ROOT, Findings, SiteModel
+
+ALL_CHECKS = ("lint", "lint_sampler", "lint_hidden_page", "lint_visual_system")
+SKIP_DIRS = {"node_modules", "_site", "__pycache__"}
+POLL_INTERVAL = 0.5
+
+
+class IncrementalChecks:
+    """Per-unit lint results that can be refreshed for a set of changed files."""
+
+    def __init__(self, site: SiteModel, checks=ALL_CHECKS) -> None:
+        self.site = site
+        self.checks = set(checks)
+        self.results: dict[str, Findings] = {}
+        self.deps: dict[str, set[str]] = defaultdict(set)
+        self.index: visual.AtlasIndex | None = None
+        # Repo-relative, so a fixture tree is watched the same way as the repo.
+        self.node_dir = visual.NODE_DIR.relative_to(ROOT).as_posix()
+        self.diagram_dir = visual.DIAGRAM_DIR.relative_to(ROOT).as_posix()
+
+    # -- unit bookkeeping -------------------------------------------------
+
+    def _depends(self, unit: str, *paths: str) -> None:
+        for path in paths:
+            self.deps[path].add(unit)
+
+    def _forget(self, unit: str) -> None:
+        self.results.pop(unit, None)
+        for units in self.deps.values():
+            units.discard(unit)
+
+    def units(self) -> list[str]:
+        found: list[str] = []
+        if "lint" in self.checks:
+            for folder, _ in lint.FOLDERS:
+                found.extend(f"lint:{rel}" for rel in self.site.glob(folder))
+            found.append("lint:about.md")
+        if "lint_sampler" in self.checks:
+            found.append("lint_sampler")
+        if "lint_hidden_page" in self.checks:
+            found.append("lint_hidden_page")
+        if "lint_visual_system" in self.checks:
+            found.extend(["vs:diagrams", "vs:fleet"])
+            found.extend(f"vs:node:{rel}" for rel in self.site.glob(self.node_dir))
+        return found
+
+    def run_unit(self, unit: str) -> None:
+        site = self.site
+        self._forget(unit)
+        if unit.startswith("lint:") and unit != "lint:about.md":
+            rel = unit[len("lint:"):]
+            if not site.path(rel).is_file():
+                return
+            is_project = rel.startswith("_projects/")
+            findings = lint.check_page(site, rel, is_project)
+            # Same candidates `resolve_link` tries: repo paths and page URLs alike.
+            targets = [
+                target
+                for url in lint.LINK_RE.findall(site.page(rel).body)
+                for target in site.link_targets(url.strip().split(" ", 1)[0].strip("<>"), rel) or ()
+            ]
+            self._depends(unit, rel, *targets)
+        elif unit == "lint:about.md":
+            findings = lint.check_about(site)
+            self._depends(unit, "about.md", "assets/docs/")
+        elif unit == "lint_sampler":
+            findings = lint_sampler.run(site)
+            self._depends(
+                unit, lint_sampler.PAGE, "_data/cds.yml", "_data/navigation.yml",
+                *lint_sampler.ASSETS, *lint_sampler.PDF_CANDIDATES,
+            )
+        elif unit == "lint_hidden_page":
+            findings = lint_hidden_page.run(site)
+            self._depends(
+                unit, lint_hidden_page.PAGE, "_data/navigation.yml",
+                *lint_hidden_page.ASSETS, *lint_hidden_page.PDF_CANDIDATES,
+            )
+        elif unit == "vs:diagrams":
+            findings = Findings(errors=visual.check_diagrams(site))
+            self._depends(unit, self.diagram_dir + "/", *visual.PAGE_REFERENCES)
+        elif unit == "vs:fleet":
+            findings = Findings(errors=visual.check_fleet(visual.fleet_urls(site), self._index()))
+            self._depends(unit, "_data/fleet.yml")
+        elif unit.startswith("vs:node:"):
+            rel = unit[len("vs:node:"):]
+            if rel not in self._index().related:
+                return
+            findings = Findings(errors=visual.check_node(rel, self._index()))
+        else:
+            raise ValueError(f"unknown unit: {unit}")
+        self.results[unit] = findings
+
+    def _index(self) -> visual.AtlasIndex:
+        if self.index is None:
+            self.index = visual.AtlasIndex.build(self.site)
+        return self.index
+
+    # -- public API -------------------------------------------------------
+
+    def check_all(self) -> None:
+        for unit in self.units():
+            self.run_unit(unit)
+
+    def update(self, changed: set[str]) -> list[str]:
+        """Re-check the units affected by `changed` repo-relative paths."""
+        pages_changed = any(rel.endswith(PAGE_SUFFIXES) or rel == "_config.yml" for rel in changed)
+        old_permalinks = set(self.site.permalinks) if pages_changed and "lint" in self.checks else None
+        for rel in changed:
+            self.site.invalidate(rel)
+        affected: set[str] = set()
+        if old_permalinks is not None:
+            # A page URL appearing or disappearing settles links aimed at it (or at `<url>.html`).
+            for url in old_permalinks ^ self.site.permalinks:
+                affected |= self.deps.get(url, set()) | self.deps.get(url + ".html", set())
+        for rel in changed:
+            affected |= self.deps.get(rel, set())
+            # A file can bring its folders into existence (or take them away).
+            parent = posixpath.dirname(rel)
+            while parent:
+                affected |= self.deps.get(parent, set())
+                parent = posixpath.dirname(parent)
+            for path, units in self.deps.items():
+                if path.endswith("/") and rel.startswith(path):
+                    affected |= units
+            if rel.endswith(".md") and any(
+                rel.startswith(folder + "/") for folder, _ in lint.FOLDERS
+            ) and "lint" in self.checks:
+                affected.add(f"lint:{rel}")
+            if (
+                "lint_visual_system" in self.checks
+                and rel.startswith(self.node_dir + "/")
+                and rel.endswith(".md")
+            ):
+                affected |= self._update_node(rel)
+        ordered = sorted(affected)
+        for unit in ordered:
+            self.run_unit(unit)
+        return ordered
+
+    def _update_node(self, rel: str) -> set[str]:
+        index = self._index()
+        old_url = index.node_permalinks.get(rel)
+        index.remove(rel)
+        if self.site.path(rel).is_file():
+            index.add(rel, self.site.text(rel))
+        new_url = index.node_permalinks.get(rel)
+        affected = {f"vs:node:{rel}"}
+        for url in {old_url, new_url} - {None}:
+            affected |= {f"vs:node:{path}" for path in index.referrers(url)}
+        if old_url != new_url:
+            affected.add("vs:fleet")
+        return affected
+
+    def findings(self) -> Findings:
+        merged = Findings()
+        for unit in sorted(self.results):
+            merged.extend(self.results[unit])
+        return merged
+
+
+def snapshot(root: Path) -> dict[str, tuple[int, int]]:
+    """Map every repo file to (mtime_ns, size), skipping hidden and build dirs."""
+    stamps: dict[str, tuple[int, int]] = {}
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        stack.append(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    stat = entry.stat()
+                    rel = Path(entry.path).relative_to(root).as_posix()
+                    stamps[rel] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+
+def changed_paths(before: dict, after: dict) -> set[str]:
+    return {rel for rel in before.keys() | after.keys() if before.get(rel) != after.get(rel)}
+
+
+def print_findings(findings: Findings) -> None:
+    for error in findings.errors:
+        print(f"  error: {error}")
+    for warning in findings.warnings:
+        print(f"  warning: {warning}")
+
+
+def watch(checks=ALL_CHECKS, interval: float = POLL_INTERVAL) -> int:
+    site = SiteModel()
+    incremental = IncrementalChecks(site, checks)
+    started = time.perf_counter()
+    stamps = snapshot(site.root)
+    incremental.check_all()
+    findings = incremental.findings()
+    print(f"watching {site.root} ({(time.perf_counter() - started) * 1000:.0f} ms initial check)")
+    print_findings(findings)
+    try:
+        while True:
+            time.sleep(interval)
+            latest = snapshot(site.root)
+            changed = changed_paths(stamps, latest)
+            stamps = latest
+            if not changed:
+                continue
+            started = time.perf_counter()
+            units = incremental.update(changed)
+            elapsed = (time.perf_counter() - started) * 1000
+            findings = incremental.findings()
+            stamp = time.strftime("%H:%M:%S")
+            print(
+                f"[{stamp}] {len(changed)} file(s) changed, re-checked {len(units)} unit(s)"
+                f" in {elapsed:.1f} ms: {len(findings.errors)} error(s),"
+                f" {len(findings.warnings)} warning(s)"
+            )
+            print_findings(findings)
+    except KeyboardInterrupt:
+        return 1 if findings.errors else 0